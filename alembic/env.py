@@ -0,0 +1,68 @@
+import asyncio
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import pool
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import async_engine_from_config
+from sqlmodel import SQLModel
+
+import service.core  # noqa: F401 registers the tables in the metadata
+from settings import get_settings
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+# The same database as the application, `%` escaped for the interpolation of alembic.ini.
+settings = get_settings()
+for option, value in (
+    ("DB_USER", settings.POSTGRES_USER),
+    ("DB_PASS", settings.POSTGRES_PASSWORD),
+    ("DB_HOST", settings.POSTGRES_HOST),
+    ("DB_NAME", settings.POSTGRES_DB),
+):
+    config.set_section_option(config.config_ini_section, option, value.replace("%", "%%"))
+
+target_metadata = SQLModel.metadata
+
+
+def run_migrations_offline() -> None:
+    """
+    Renders the migrations as SQL (`alembic upgrade head --sql`) without connecting to the database.
+    """
+    context.configure(
+        url=config.get_main_option("sqlalchemy.url"),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection: Connection) -> None:
+    context.configure(connection=connection, target_metadata=target_metadata)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_async_migrations() -> None:
+    """
+    Runs the migrations over asyncpg, the driver of the application, on a connection outside of any pool.
+    """
+    connectable = async_engine_from_config(
+        config.get_section(config.config_ini_section, {}),
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool,
+    )
+    async with connectable.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+    await connectable.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    asyncio.run(run_async_migrations())
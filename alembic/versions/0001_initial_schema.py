@@ -0,0 +1,323 @@
+"""
+Initial schema, the tables, enum types, extensions and triggers as `create_db` created them before migrations.
+
+Databases created by `console.py db create` are at the head revision, adopt them with `alembic stamp head`.
+
+Revision ID: 0001
+Revises:
+Create Date: 2025-09-01 09:00:00
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0001"
+down_revision: str | Sequence[str] | None = None
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Frozen copy of the DDL generated from the models, later changes of the models come as new revisions.
+SCHEMA = (
+    """CREATE TYPE eventstatus AS ENUM ('DRAFT', 'PUBLISHED', 'ARCHIVED')""",
+    """CREATE TYPE programtype AS ENUM ('UNSPECIFIED', 'WORKSHOP', 'LECTURE')""",
+    """CREATE TYPE sessionstatus AS ENUM ('DRAFT', 'PUBLISHED', 'CANCELLED', 'ENDED')""",
+    """
+        CREATE TABLE t_user (
+            created_by UUID,
+            created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT NOW() NOT NULL,
+            updated_by UUID,
+            updated_at TIMESTAMP WITHOUT TIME ZONE,
+            id_user UUID NOT NULL,
+            email VARCHAR(255) NOT NULL,
+            full_name VARCHAR(255),
+            CONSTRAINT primary_key_t_user PRIMARY KEY (id_user),
+            CONSTRAINT foreign_key_t_user_created_by_t_user FOREIGN KEY(created_by) REFERENCES t_user (id_user),
+            CONSTRAINT foreign_key_t_user_updated_by_t_user FOREIGN KEY(updated_by) REFERENCES t_user (id_user)
+        )
+    """,
+    """
+        CREATE TABLE t_event (
+            created_by UUID,
+            created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT NOW() NOT NULL,
+            updated_by UUID,
+            updated_at TIMESTAMP WITHOUT TIME ZONE,
+            id_event UUID NOT NULL,
+            name VARCHAR(255) NOT NULL,
+            description VARCHAR(1024),
+            start_date DATE NOT NULL,
+            end_date DATE NOT NULL,
+            status eventstatus NOT NULL,
+            calendar_revision INTEGER DEFAULT 0 NOT NULL,
+            CONSTRAINT primary_key_t_event PRIMARY KEY (id_event),
+            CONSTRAINT check_event_start_before_end CHECK (start_date <= end_date),
+            CONSTRAINT foreign_key_t_event_created_by_t_user FOREIGN KEY(created_by) REFERENCES t_user (id_user),
+            CONSTRAINT foreign_key_t_event_updated_by_t_user FOREIGN KEY(updated_by) REFERENCES t_user (id_user)
+        )
+    """,
+    """
+        CREATE TABLE t_attendee (
+            created_by UUID,
+            created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT NOW() NOT NULL,
+            updated_by UUID,
+            updated_at TIMESTAMP WITHOUT TIME ZONE,
+            id_attendee UUID NOT NULL,
+            id_event UUID NOT NULL,
+            email VARCHAR(255) NOT NULL,
+            full_name VARCHAR(255),
+            can_register_from TIMESTAMP WITHOUT TIME ZONE,
+            access_token VARCHAR(255),
+            invite_email_sent BOOLEAN NOT NULL,
+            calendar_revision INTEGER DEFAULT 0 NOT NULL,
+            CONSTRAINT primary_key_t_attendee PRIMARY KEY (id_attendee),
+            CONSTRAINT uq_attendee_email UNIQUE (email, id_event),
+            CONSTRAINT foreign_key_t_attendee_created_by_t_user FOREIGN KEY(created_by) REFERENCES t_user (id_user),
+            CONSTRAINT foreign_key_t_attendee_updated_by_t_user FOREIGN KEY(updated_by) REFERENCES t_user (id_user),
+            CONSTRAINT foreign_key_t_attendee_id_event_t_event FOREIGN KEY(id_event) REFERENCES t_event (id_event)
+        )
+    """,
+    """
+        CREATE TABLE t_location (
+            created_by UUID,
+            created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT NOW() NOT NULL,
+            updated_by UUID,
+            updated_at TIMESTAMP WITHOUT TIME ZONE,
+            id_location UUID NOT NULL,
+            id_event UUID NOT NULL,
+            name VARCHAR(255) NOT NULL,
+            lat DOUBLE PRECISION,
+            lon DOUBLE PRECISION,
+            color VARCHAR(7) NOT NULL,
+            CONSTRAINT primary_key_t_location PRIMARY KEY (id_location),
+            CONSTRAINT foreign_key_t_location_created_by_t_user FOREIGN KEY(created_by) REFERENCES t_user (id_user),
+            CONSTRAINT foreign_key_t_location_updated_by_t_user FOREIGN KEY(updated_by) REFERENCES t_user (id_user),
+            CONSTRAINT foreign_key_t_location_id_event_t_event FOREIGN KEY(id_event) REFERENCES t_event (id_event)
+        )
+    """,
+    """
+        CREATE TABLE t_program_item (
+            created_by UUID,
+            created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT NOW() NOT NULL,
+            updated_by UUID,
+            updated_at TIMESTAMP WITHOUT TIME ZONE,
+            id_program_item UUID NOT NULL,
+            id_event UUID NOT NULL,
+            id_location UUID,
+            name VARCHAR(255) NOT NULL,
+            description VARCHAR(1024),
+            type programtype NOT NULL,
+            attendee_limit INTEGER,
+            attendee_limit_buffer INTEGER,
+            required_time INTERVAL NOT NULL,
+            before_time_buffer INTERVAL NOT NULL,
+            after_time_buffer INTERVAL NOT NULL,
+            CONSTRAINT primary_key_t_program_item PRIMARY KEY (id_program_item),
+            CONSTRAINT foreign_key_t_program_item_created_by_t_user FOREIGN KEY(created_by) REFERENCES t_user (id_user),
+            CONSTRAINT foreign_key_t_program_item_updated_by_t_user FOREIGN KEY(updated_by) REFERENCES t_user (id_user),
+            CONSTRAINT foreign_key_t_program_item_id_event_t_event FOREIGN KEY(id_event) REFERENCES t_event (id_event),
+            CONSTRAINT foreign_key_t_program_item_id_location_t_location FOREIGN KEY(id_location) REFERENCES t_location (id_location)
+        )
+    """,
+    """
+        ALTER TABLE t_program_item ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+            setweight(to_tsvector('simple', coalesce(name, '')), 'A')
+            || setweight(to_tsvector('simple', coalesce(description, '')), 'B')
+        ) STORED
+    """,
+    """CREATE INDEX index_t_program_item_search_vector ON t_program_item USING gin (search_vector)""",
+    """CREATE EXTENSION IF NOT EXISTS btree_gist""",
+    """
+        CREATE TABLE t_program_session (
+            created_by UUID,
+            created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT NOW() NOT NULL,
+            updated_by UUID,
+            updated_at TIMESTAMP WITHOUT TIME ZONE,
+            id_program_session UUID NOT NULL,
+            id_program_item UUID NOT NULL,
+            id_location_override UUID,
+            start_time TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            end_time TIMESTAMP WITHOUT TIME ZONE,
+            note VARCHAR(1024),
+            status sessionstatus NOT NULL,
+            attendee_limit_override INTEGER,
+            attendee_count INTEGER DEFAULT 0 NOT NULL,
+            CONSTRAINT primary_key_t_program_session PRIMARY KEY (id_program_session),
+            CONSTRAINT foreign_key_t_program_session_created_by_t_user FOREIGN KEY(created_by) REFERENCES t_user (id_user),
+            CONSTRAINT foreign_key_t_program_session_updated_by_t_user FOREIGN KEY(updated_by) REFERENCES t_user (id_user),
+            CONSTRAINT foreign_key_t_program_session_id_program_item_t_program_item FOREIGN KEY(id_program_item) REFERENCES t_program_item (id_program_item),
+            CONSTRAINT foreign_key_t_program_session_id_location_override_t_location FOREIGN KEY(id_location_override) REFERENCES t_location (id_location)
+        )
+    """,
+    """ALTER TABLE t_program_session ADD COLUMN id_location_effective uuid, ADD COLUMN blocked_range tsrange""",
+    """
+        CREATE OR REPLACE FUNCTION f_program_session_blocked_range() RETURNS trigger AS $$
+        BEGIN
+            SELECT
+                COALESCE(NEW.id_location_override, pi.id_location),
+                tsrange(
+                    NEW.start_time - pi.before_time_buffer,
+                    COALESCE(NEW.end_time, NEW.start_time + pi.required_time) + pi.after_time_buffer
+                )
+            INTO NEW.id_location_effective, NEW.blocked_range
+            FROM t_program_item pi
+            WHERE pi.id_program_item = NEW.id_program_item;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """,
+    """
+        CREATE TRIGGER tr_program_session_blocked_range
+        BEFORE INSERT OR UPDATE OF id_program_item, id_location_override, start_time, end_time ON t_program_session
+        FOR EACH ROW EXECUTE FUNCTION f_program_session_blocked_range()
+    """,
+    """
+        CREATE OR REPLACE FUNCTION f_program_item_blocked_range() RETURNS trigger AS $$
+        BEGIN
+            UPDATE t_program_session SET id_program_item = id_program_item
+            WHERE id_program_item = NEW.id_program_item;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """,
+    """
+        CREATE TRIGGER tr_program_item_blocked_range
+        AFTER UPDATE OF id_location, required_time, before_time_buffer, after_time_buffer ON t_program_item
+        FOR EACH ROW EXECUTE FUNCTION f_program_item_blocked_range()
+    """,
+    """
+        ALTER TABLE t_program_session ADD CONSTRAINT exclude_t_program_session_location_overlap
+        EXCLUDE USING gist (id_location_effective WITH =, blocked_range WITH &&)
+        WHERE (status <> 'CANCELLED')
+    """,
+    """
+        CREATE OR REPLACE FUNCTION f_event_calendar_revision() RETURNS trigger AS $$
+        DECLARE
+            row_event UUID;
+        BEGIN
+            IF TG_TABLE_NAME = 't_program_session' THEN
+                SELECT id_event INTO row_event FROM t_program_item
+                WHERE id_program_item = COALESCE(NEW.id_program_item, OLD.id_program_item);
+            ELSIF TG_OP = 'DELETE' THEN
+                row_event := OLD.id_event;
+            ELSE
+                row_event := NEW.id_event;
+            END IF;
+            UPDATE t_event SET calendar_revision = calendar_revision + 1 WHERE id_event = row_event;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """,
+    """
+        CREATE TRIGGER tr_program_session_calendar_revision
+        AFTER INSERT OR DELETE OR UPDATE OF id_program_item, id_location_override, start_time, end_time, note, status
+        ON t_program_session
+        FOR EACH ROW EXECUTE FUNCTION f_event_calendar_revision()
+    """,
+    """
+        CREATE TRIGGER tr_program_item_calendar_revision
+        AFTER INSERT OR DELETE OR UPDATE OF name, description, type, id_location, required_time ON t_program_item
+        FOR EACH ROW EXECUTE FUNCTION f_event_calendar_revision()
+    """,
+    """
+        CREATE TRIGGER tr_location_calendar_revision
+        AFTER INSERT OR DELETE OR UPDATE OF name, lat, lon ON t_location
+        FOR EACH ROW EXECUTE FUNCTION f_event_calendar_revision()
+    """,
+    """
+        CREATE TABLE t_attendee_program_session (
+            id_attendee UUID NOT NULL,
+            id_program_session UUID NOT NULL,
+            created_at TIMESTAMP WITHOUT TIME ZONE,
+            note VARCHAR(1024),
+            CONSTRAINT primary_key_t_attendee_program_session PRIMARY KEY (id_attendee, id_program_session),
+            CONSTRAINT foreign_key_t_attendee_program_session_id_attendee_t_attendee FOREIGN KEY(id_attendee) REFERENCES t_attendee (id_attendee),
+            CONSTRAINT foreign_key_t_attendee_program_session_id_program_sessi_2b87 FOREIGN KEY(id_program_session) REFERENCES t_program_session (id_program_session)
+        )
+    """,
+    """
+        CREATE OR REPLACE FUNCTION f_attendee_program_session_count() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('DELETE', 'UPDATE') THEN
+                UPDATE t_program_session SET attendee_count = attendee_count - 1
+                WHERE id_program_session = OLD.id_program_session;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                UPDATE t_program_session SET attendee_count = attendee_count + 1
+                WHERE id_program_session = NEW.id_program_session;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """,
+    """
+        CREATE TRIGGER tr_attendee_program_session_count
+        AFTER INSERT OR DELETE OR UPDATE OF id_program_session ON t_attendee_program_session
+        FOR EACH ROW EXECUTE FUNCTION f_attendee_program_session_count()
+    """,
+    """
+        CREATE OR REPLACE FUNCTION f_attendee_calendar_revision() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('DELETE', 'UPDATE') THEN
+                UPDATE t_attendee SET calendar_revision = calendar_revision + 1 WHERE id_attendee = OLD.id_attendee;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                UPDATE t_attendee SET calendar_revision = calendar_revision + 1 WHERE id_attendee = NEW.id_attendee;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """,
+    """
+        CREATE TRIGGER tr_attendee_calendar_revision
+        AFTER INSERT OR DELETE OR UPDATE ON t_attendee_program_session
+        FOR EACH ROW EXECUTE FUNCTION f_attendee_calendar_revision()
+    """,
+    """
+        CREATE TABLE t_program_session_waitlist (
+            id_attendee UUID NOT NULL,
+            id_program_session UUID NOT NULL,
+            position BIGINT GENERATED BY DEFAULT AS IDENTITY,
+            created_at TIMESTAMP WITHOUT TIME ZONE,
+            note VARCHAR(1024),
+            CONSTRAINT primary_key_t_program_session_waitlist PRIMARY KEY (id_attendee, id_program_session),
+            CONSTRAINT foreign_key_t_program_session_waitlist_id_attendee_t_attendee FOREIGN KEY(id_attendee) REFERENCES t_attendee (id_attendee),
+            CONSTRAINT foreign_key_t_program_session_waitlist_id_program_sessi_1280 FOREIGN KEY(id_program_session) REFERENCES t_program_session (id_program_session)
+        )
+    """,
+    """CREATE UNIQUE INDEX index_t_program_session_waitlist_queue ON t_program_session_waitlist (id_program_session, position)""",
+)
+
+TABLES = (
+    "t_program_session_waitlist",
+    "t_attendee_program_session",
+    "t_program_session",
+    "t_program_item",
+    "t_location",
+    "t_attendee",
+    "t_event",
+    "t_user",
+)
+
+FUNCTIONS = (
+    "f_program_session_blocked_range",
+    "f_program_item_blocked_range",
+    "f_event_calendar_revision",
+    "f_attendee_program_session_count",
+    "f_attendee_calendar_revision",
+)
+
+TYPES = ("sessionstatus", "programtype", "eventstatus")
+
+
+def upgrade() -> None:
+    for statement in SCHEMA:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    # Dropping the tables drops their triggers, btree_gist stays as other databases objects may use it.
+    for table in TABLES:
+        op.execute(f"DROP TABLE IF EXISTS {table} CASCADE")
+    for function in FUNCTIONS:
+        op.execute(f"DROP FUNCTION IF EXISTS {function}()")
+    for type_ in TYPES:
+        op.execute(f"DROP TYPE IF EXISTS {type_}")
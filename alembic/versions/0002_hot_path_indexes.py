@@ -0,0 +1,51 @@
+"""
+Indexes for the foreign keys and time ranges filtered on the hot paths, built without blocking writes.
+
+`CREATE INDEX CONCURRENTLY` cannot run in a transaction, each index is built in an autocommit block. A build
+interrupted half way leaves an invalid index behind, the next upgrade drops it and builds it again.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2025-09-01 09:30:00
+"""
+from collections.abc import Sequence
+
+from alembic import context, op
+from sqlalchemy import text
+
+revision: str = "0002"
+down_revision: str | Sequence[str] | None = "0001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+INDEXES = (
+    ("index_t_program_item_id_event", "t_program_item", ["id_event"]),
+    ("index_t_location_id_event", "t_location", ["id_event"]),
+    ("index_t_attendee_id_event", "t_attendee", ["id_event"]),
+    # The primary key (id_attendee, id_program_session) cannot serve lookups by the session alone.
+    ("index_t_attendee_program_session_id_program_session", "t_attendee_program_session", ["id_program_session"]),
+    ("index_t_program_session_id_program_item_start_time", "t_program_session", ["id_program_item", "start_time"]),
+    ("index_t_event_status", "t_event", ["status"]),
+)
+
+
+def _is_invalid(name: str) -> bool:
+    if context.is_offline_mode():
+        return False
+    return bool(op.get_bind().execute(
+        text("SELECT NOT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"), {"name": name}
+    ).scalar())
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            if _is_invalid(name):
+                op.drop_index(name, table_name=table, postgresql_concurrently=True)
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,42 @@
+"""
+Bumps the calendar revision of an event when the event is renamed, its name is the name of all its calendars.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2025-09-08 09:00:00
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0003"
+down_revision: str | Sequence[str] | None = "0002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION f_event_name_calendar_revision() RETURNS trigger AS $$
+        BEGIN
+            IF NEW.name IS DISTINCT FROM OLD.name THEN
+                NEW.calendar_revision := OLD.calendar_revision + 1;
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER tr_event_name_calendar_revision
+        BEFORE UPDATE OF name ON t_event
+        FOR EACH ROW EXECUTE FUNCTION f_event_name_calendar_revision()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS tr_event_name_calendar_revision ON t_event")
+    op.execute("DROP FUNCTION IF EXISTS f_event_name_calendar_revision()")
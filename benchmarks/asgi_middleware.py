@@ -0,0 +1,109 @@
+"""
+Compares the throughput of the previous `BaseHTTPMiddleware` based exception middleware with the pure ASGI one
+on `/healthcheck` and on a streaming endpoint.
+
+The legacy middleware is copied here (minus the commented out code), no database is needed.
+
+Example:
+    python benchmarks/asgi_middleware.py --requests 2000 --chunks 100
+"""
+import argparse
+import asyncio
+import json
+import time
+from traceback import print_exception
+from uuid import uuid4
+
+import httpx
+from common import percentile
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import StreamingResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from route import ExceptionConfiguration, ExceptionHandlingMiddleware
+
+
+class LegacyExceptionHandlingMiddleware(BaseHTTPMiddleware):
+    def __init__(self, app, exception_map: list[ExceptionConfiguration], store_traceback: bool = False):
+        super().__init__(app)
+        self._exeption_map = exception_map
+
+    async def dispatch(self, request: Request, call_next):
+        excs = tuple([e.exception for e in self._exeption_map])
+        request_id = uuid4()
+        try:
+            response = await call_next(request)
+            response.headers["X-Request-ID"] = str(request_id)
+            return response
+        except excs as e:
+            for exc in self._exeption_map:
+                if isinstance(e, exc.exception):
+                    return Response(
+                        status_code=exc.status_code,
+                        content=json.dumps(dict(code=exc.app_code, message=str(e), request_id=str(request_id))),
+                        headers={"Content-type": "application/json", "X-Request-ID": str(request_id)}
+                    )
+        except Exception as e:
+            print_exception(e)
+            return Response(
+                status_code=500,
+                content=json.dumps(dict(code="FUCK...", message=str(e), request_id=str(request_id))),
+                headers={"Content-type": "application/json", "X-Request-ID": str(request_id)}
+            )
+
+
+def build_app(middleware: type, chunks: int) -> FastAPI:
+    app = FastAPI()
+    # A realistic map size, the legacy middleware rebuilds the tuple of it on every request.
+    exception_map = [ExceptionConfiguration(type(f"Error{i}", (Exception,), {}), 400, f"ERROR_{i}") for i in range(25)]
+    app.add_middleware(middleware, exception_map=exception_map)
+
+    @app.get("/healthcheck")
+    async def healthcheck():
+        return {"status": "ok"}
+
+    @app.get("/stream")
+    async def stream():
+        async def generate():
+            for _ in range(chunks):
+                yield b'{"id_program_item": "81f20f69-6f3f-4e55-af11-d173ff41ee4b", "name": "Knitting steel wires"}\n'
+        return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+    return app
+
+
+async def run(app: FastAPI, path: str, requests: int, concurrency: int) -> tuple[float, list[float]]:
+    latencies: list[float] = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        async def worker(count: int) -> None:
+            for _ in range(count):
+                start = time.perf_counter()
+                (await client.get(path)).raise_for_status()
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        await worker(50)  # warmup
+        latencies.clear()
+        wall_start = time.perf_counter()
+        await asyncio.gather(*(worker(requests // concurrency) for _ in range(concurrency)))
+        return time.perf_counter() - wall_start, latencies
+
+
+async def main(requests: int, concurrency: int, chunks: int) -> None:
+    print(f"{requests} requests, concurrency {concurrency}, streaming {chunks} chunks")
+    for path in ("/healthcheck", "/stream"):
+        for name, middleware in (("BaseHTTPMiddleware", LegacyExceptionHandlingMiddleware), ("pure ASGI", ExceptionHandlingMiddleware)):
+            wall, latencies = await run(build_app(middleware, chunks), path, requests, concurrency)
+            print(
+                f"{path:<14} {name:<20} {len(latencies) / wall:8.0f} req/s  "
+                f"p50={percentile(latencies, 50):7.3f} ms  p99={percentile(latencies, 99):7.3f} ms"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--chunks", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency, args.chunks))
@@ -0,0 +1,95 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Benchmarks are standalone scripts (not collected by pytest) which run against a throwaway database
+created next to the one configured in `Settings`, the same way `tests/unit/conftest.py` does it.
+
+Example:
+    python benchmarks/overview_attendee_count.py --registrations 100000
+"""
+import statistics
+import sys
+import time
+import uuid
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import asyncpg  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine  # noqa: E402
+from sqlmodel import SQLModel  # noqa: E402
+
+import service.core  # noqa: E402, F401 - registers all models in the metadata
+from settings import get_settings  # noqa: E402
+
+
+@asynccontextmanager
+async def temporary_database(**engine_kwargs: Any) -> AsyncGenerator[AsyncEngine, Any]:
+    """
+    Creates a temporary database with the full schema and drops it afterwards.
+
+    Args:
+        **engine_kwargs: Extra keyword arguments passed to `create_async_engine`.
+
+    Yields:
+        AsyncEngine: Engine bound to the temporary database.
+    """
+    settings = get_settings()
+    database_name = f"{settings.POSTGRES_DB}_bench_{uuid.uuid4()}"
+    conn = await asyncpg.connect(user=settings.POSTGRES_USER, password=settings.POSTGRES_PASSWORD, host=settings.POSTGRES_HOST, database="postgres")
+    await conn.execute(f'CREATE DATABASE "{database_name}" OWNER "{settings.POSTGRES_USER}"')
+    engine = create_async_engine(
+        f"postgresql+asyncpg://{settings.POSTGRES_USER}:{settings.POSTGRES_PASSWORD}@{settings.POSTGRES_HOST}/{database_name}",
+        echo=False,
+        **engine_kwargs
+    )
+    try:
+        async with engine.begin() as c:
+            await c.run_sync(SQLModel.metadata.create_all)
+        yield engine
+    finally:
+        await engine.dispose()
+        await conn.execute(f'DROP DATABASE "{database_name}" WITH (FORCE)')
+        await conn.close()
+
+
+async def measure(fn: Callable[[], Awaitable[Any]], *, repeat: int = 20, warmup: int = 3) -> list[float]:
+    """
+    Runs an awaitable factory repeatedly and returns the wall clock durations in milliseconds.
+
+    Args:
+        fn (Callable[[], Awaitable[Any]]): Factory of the awaitable to measure.
+        repeat (int): Number of measured runs.
+        warmup (int): Number of unmeasured runs executed first.
+
+    Returns:
+        list[float]: Durations of the measured runs in milliseconds.
+    """
+    for _ in range(warmup):
+        await fn()
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await fn()
+        durations.append((time.perf_counter() - start) * 1000)
+    return durations
+
+
+def percentile(durations: list[float], pct: float) -> float:
+    """Returns the `pct` percentile (0-100) of the given durations."""
+    ordered = sorted(durations)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def report(name: str, durations: list[float]) -> None:
+    """Prints a one line summary of the measured durations."""
+    print(
+        f"{name:<40} runs={len(durations):<5} "
+        f"median={statistics.median(durations):9.3f} ms  "
+        f"p99={percentile(durations, 99):9.3f} ms  "
+        f"min={min(durations):9.3f} ms"
+    )
@@ -0,0 +1,123 @@
+"""
+Compares the per-request cost of `Depends(service(...))` with the previous list based container and the current one.
+
+The legacy container is copied here verbatim (minus docstrings), it resolved services by walking a list and
+returned a synchronous `partial`, which FastAPI runs in its thread pool on every request. No database is needed.
+
+Example:
+    python benchmarks/di_container.py --services 16 --requests 2000
+"""
+import argparse
+import asyncio
+import timeit
+from functools import lru_cache, partial
+
+import httpx
+from common import measure, report
+from fastapi import Depends, FastAPI
+
+from di import Container, FutureService
+
+
+class LegacyContainer:
+    def __init__(self) -> None:
+        self._services: list = []
+
+    def add(self, signature, instance):
+        self._services.append((signature, instance))
+
+    @staticmethod
+    @lru_cache(typed=True)
+    def get_cached_instance(instance) -> type[object]:
+        return instance
+
+    def get(self, required_signature: object):
+        for signature, instance in self._services:
+            if signature is required_signature:
+                return partial(self.get_cached_instance, instance)
+        raise ValueError("No service %s found" % required_signature)
+
+    def spinup(self):
+        for signature, instance in self._services:
+            for property in dir(instance):
+                try:
+                    if isinstance(getattr(instance, property), FutureService):
+                        setattr(instance, property, self.get(getattr(instance, property)._signature)())
+                except AttributeError:
+                    continue
+
+
+class Cache:
+    pass
+
+
+class Repository:
+    def __init__(self) -> None:
+        self.cache = FutureService(Cache)
+
+
+def make_types(count: int) -> list[tuple[type, type]]:
+    pairs = []
+    for i in range(count):
+        repository = type(f"Repository{i}", (Repository,), {})
+
+        def __init__(self, repository: repository) -> None:  # type: ignore[valid-type]
+            self.repository = repository
+
+        pairs.append((repository, type(f"Service{i}", (), {"__init__": __init__})))
+    return pairs
+
+
+def build_app(container: LegacyContainer | Container, signature: type) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/")
+    async def endpoint(service=Depends(container.get(signature))) -> dict:
+        return {}
+
+    return app
+
+
+async def main(services: int, requests: int, repeat: int) -> None:
+    pairs = make_types(services)
+    # The last registered service is the worst case of the linear lookup.
+    signature = pairs[-1][1]
+
+    legacy = LegacyContainer()
+    legacy.add(Cache, Cache())
+    for repository_type, service_type in pairs:
+        repository = repository_type()
+        legacy.add(repository_type, repository)
+        legacy.add(service_type, service_type(repository))
+    legacy.spinup()
+
+    current = Container()
+    current.add(Cache, Cache())
+    for repository_type, service_type in pairs:
+        current.register(repository_type)
+        current.register(service_type)
+    current.spinup()
+
+    print(f"{services * 2 + 1} registered services, {requests} requests per run")
+    for name, container in (("legacy", legacy), ("current", current)):
+        lookups = 100_000
+        seconds = timeit.timeit(lambda: container.get(signature), number=lookups)
+        print(f"{name + ' get()':<40} {seconds / lookups * 1e9:9.0f} ns per lookup")
+
+    for name, container in (("legacy", legacy), ("current", current)):
+        transport = httpx.ASGITransport(app=build_app(container, signature))
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            async def run() -> None:
+                for _ in range(requests):
+                    (await client.get("/")).raise_for_status()
+            durations = await measure(run, repeat=repeat)
+        report(f"{name} request with Depends", [duration / requests for duration in durations])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--services", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.services, args.requests, args.repeat))
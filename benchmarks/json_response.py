@@ -0,0 +1,89 @@
+"""
+Compares the cost of turning an event overview into a JSON response, from the repository rows to the body bytes.
+
+before: entities built field by field, revalidated against the response model, `jsonable_encoder` and stdlib `json`
+        (the default FastAPI route).
+after:  entities validated from the rows at once and dumped by pydantic-core (`FastJSONRoute`).
+
+Both paths run through an in-process FastAPI app, the repository is replaced by prebuilt rows, no database is needed.
+
+Example:
+    python benchmarks/json_response.py --rows 5000
+"""
+import argparse
+import asyncio
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import httpx
+from common import measure, report
+from fastapi import APIRouter, FastAPI
+from fastapi.routing import APIRoute
+
+from route import FastJSONRoute
+from service.event import ProgramOverviewEntity
+from service.event.repository import OverviewResult
+from service.event.service import _overview_entities
+
+
+def legacy_overview_entity(row: OverviewResult) -> ProgramOverviewEntity:
+    return ProgramOverviewEntity(
+        id_program_item=row.id_program_item,
+        name=row.name,
+        type=row.type,
+        attendee_limit=row.attendee_limit,
+        attendee_limit_buffer=row.attendee_limit_buffer,
+        note=row.note,
+        status=row.status,
+        required_time=row.required_time,
+        before_time_buffer=row.before_time_buffer,
+        after_time_buffer=row.after_time_buffer,
+        start_time=row.start_time,
+        end_time=row.end_time,
+        attendee_count=row.attendee_count
+    )
+
+
+def build_app(rows: list[OverviewResult], fast: bool) -> FastAPI:
+    router = APIRouter(route_class=FastJSONRoute if fast else APIRoute)
+
+    @router.get("/overview")
+    async def overview() -> list[ProgramOverviewEntity]:
+        if fast:
+            return _overview_entities.validate_python(rows, from_attributes=True)
+        return [legacy_overview_entity(row) for row in rows]
+
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+async def main(rows: int, repeat: int) -> None:
+    start = datetime(2025, 7, 31, 9, 0)
+    overview = [
+        OverviewResult(
+            uuid4(), f"Program item {i}", "workshop", 20, 2, "Bring your own wire", "PUBLISHED",
+            timedelta(hours=1), timedelta(minutes=10), timedelta(minutes=10),
+            start + timedelta(minutes=15 * i), start + timedelta(minutes=15 * i + 60), i % 20
+        )
+        for i in range(rows)
+    ]
+    print(f"Overview of {rows} program items")
+
+    bodies = []
+    for name, fast in (("before", False), ("after", True)):
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=build_app(overview, fast)), base_url="http://benchmark") as client:
+            async def request() -> None:
+                (await client.get("/overview")).raise_for_status()
+
+            bodies.append((await client.get("/overview")).json())
+            report(name, await measure(request, repeat=repeat))
+    assert bodies[0] == bodies[1]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.repeat))
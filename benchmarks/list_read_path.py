@@ -0,0 +1,141 @@
+"""
+Compares the ORM list path (full models in a transaction, entities copied field by field) with the read path
+(explicit columns as row mappings in an autocommit session, entities validated at once) for locations and program items.
+
+Every run walks all pages of the list with the keyset cursor. With `--without-database` only the Python side
+of both paths is measured on rows built in memory: entities copied from models one by one against a page of
+row mappings validated at once. Query time and ORM hydration are not part of those figures.
+
+Example:
+    python benchmarks/list_read_path.py --rows 10000 --limit 500
+    python benchmarks/list_read_path.py --rows 10000 --limit 500 --without-database
+"""
+import argparse
+import asyncio
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+from common import measure, report, temporary_database
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel import text
+
+from service.core import ListCriterion, LocationModel, ProgramItemModel, ProgramType
+from service.event import EventRepository, EventService
+from service.event.entity import LocationEntity, location_list_options
+from service.event.service import _location_entities
+from service.programitem import ProgramItemRepository, ProgramItemService
+from service.programitem.entity import program_item_list_options
+from service.programitem.service import _program_item_entities, _program_item_entity
+
+
+async def without_database(rows: int, limit: int, repeat: int) -> None:
+    event_id, id_location, now = uuid4(), uuid4(), datetime.now(UTC)
+    locations = [
+        LocationModel(id_location=uuid4(), id_event=event_id, name=f"Location {i}", color="#FF4500", created_at=now)
+        for i in range(rows)
+    ]
+    program_items = [
+        ProgramItemModel(
+            id_program_item=uuid4(), id_event=event_id, id_location=id_location, name=f"Program item {i}", type=ProgramType.WORKSHOP,
+            required_time=timedelta(hours=1), before_time_buffer=timedelta(minutes=10), after_time_buffer=timedelta(minutes=10), created_at=now
+        )
+        for i in range(rows)
+    ]
+    # Shaped like the row mappings of LOCATION_COLUMNS and PROGRAM_ITEM_COLUMNS.
+    location_rows = [location.model_dump() for location in locations]
+    program_item_rows = [
+        item.model_dump() | {"type": "workshop", "required_time": 60, "before_time_buffer": 10, "after_time_buffer": 10}
+        for item in program_items
+    ]
+    pages = range(0, rows, limit)
+    print(f"{rows} locations and program items, pages of {limit}, without database")
+
+    async def orm_locations():
+        for offset in pages:
+            [LocationEntity.model_validate(location, from_attributes=True) for location in locations[offset:offset + limit]]
+
+    async def read_path_locations():
+        for offset in pages:
+            _location_entities.validate_python(location_rows[offset:offset + limit])
+
+    async def orm_program_items():
+        for offset in pages:
+            [_program_item_entity(item) for item in program_items[offset:offset + limit]]
+
+    async def read_path_program_items():
+        for offset in pages:
+            _program_item_entities.validate_python(program_item_rows[offset:offset + limit])
+
+    report("locations ORM", await measure(orm_locations, repeat=repeat))
+    report("locations read path", await measure(read_path_locations, repeat=repeat))
+    report("program items ORM", await measure(orm_program_items, repeat=repeat))
+    report("program items read path", await measure(read_path_program_items, repeat=repeat))
+
+
+async def main(rows: int, limit: int, repeat: int) -> None:
+    async with temporary_database() as engine:
+        event_id = uuid4()
+        async with engine.begin() as conn:
+            await conn.execute(text(
+                "INSERT INTO t_event (id_event, name, start_date, end_date, status, created_at) "
+                "VALUES (:id, 'Benchmark', '2025-07-31', '2025-08-02', 'PUBLISHED', NOW())"
+            ), {"id": event_id})
+            await conn.execute(text(
+                "INSERT INTO t_location (id_location, id_event, name, color, created_at) "
+                "SELECT gen_random_uuid(), :id, 'Location ' || i, '#FF4500', NOW() FROM generate_series(1, :rows) i"
+            ), {"id": event_id, "rows": rows})
+            await conn.execute(text(
+                "INSERT INTO t_program_item (id_program_item, id_event, id_location, name, type, required_time, before_time_buffer, after_time_buffer, created_at) "
+                "SELECT gen_random_uuid(), :id, (SELECT id_location FROM t_location LIMIT 1), 'Program item ' || i, 'WORKSHOP', "
+                "  INTERVAL '1 hour', INTERVAL '10 minutes', INTERVAL '10 minutes', NOW() "
+                "FROM generate_series(1, :rows) i"
+            ), {"id": event_id, "rows": rows})
+            await conn.execute(text("ANALYZE"))
+
+        sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
+        event_repository = EventRepository(sessionmaker)
+        event_service = EventService(event_repository)
+        programitem_repository = ProgramItemRepository(sessionmaker)
+        programitem_service = ProgramItemService(programitem_repository)
+        print(f"{rows} locations and program items, pages of {limit}")
+
+        async def walk(list_page) -> int:
+            count, cursor = 0, None
+            while True:
+                page = await list_page(ListCriterion(limit=limit, cursor=cursor))
+                count += len(page.data if hasattr(page, "data") else page.items)
+                cursor = page.next_cursor
+                if cursor is None:
+                    return count
+
+        async def orm_locations(criterion: ListCriterion):
+            async with event_repository.ensure_session() as session:
+                page = await event_repository.paginate(
+                    LocationModel, criterion, location_list_options, LocationModel.id_event == event_id, session=session  # type: ignore[arg-type]
+                )
+                entities = [LocationEntity.model_validate(location, from_attributes=True) for location in page.items]
+            return page._replace(items=entities)
+
+        async def orm_program_items(criterion: ListCriterion):
+            async with programitem_repository.ensure_session() as session:
+                page = await programitem_repository.paginate(
+                    ProgramItemModel, criterion, program_item_list_options, ProgramItemModel.id_event == event_id, session=session  # type: ignore[arg-type]
+                )
+                entities = [_program_item_entity(item) for item in page.items]
+            return page._replace(items=entities)
+
+        assert await walk(orm_locations) == await walk(lambda c: event_service.list_locations(event_id, c)) == rows
+        report("locations ORM", await measure(lambda: walk(orm_locations), repeat=repeat))
+        report("locations read path", await measure(lambda: walk(lambda c: event_service.list_locations(event_id, c)), repeat=repeat))
+        report("program items ORM", await measure(lambda: walk(orm_program_items), repeat=repeat))
+        report("program items read path", await measure(lambda: walk(lambda c: programitem_service.list_program_items(event_id, c)), repeat=repeat))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--limit", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--without-database", action="store_true", help="Measure only the Python side on rows built in memory")
+    args = parser.parse_args()
+    asyncio.run((without_database if args.without_database else main)(args.rows, args.limit, args.repeat))
@@ -0,0 +1,99 @@
+"""
+Compares the program overview with the correlated `COUNT(*)` against the maintained `attendee_count` counter.
+
+Example:
+    python benchmarks/overview_attendee_count.py --sessions 500 --registrations 120000
+"""
+import argparse
+import asyncio
+from uuid import uuid4
+
+from common import measure, report, temporary_database
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel import text
+
+from service.event import EventRepository
+
+CORRELATED_COUNT_OVERVIEW = """
+    SELECT
+        pi.id_program_item,
+        pi.name,
+        pi.type,
+        COALESCE(ps.attendee_limit_override, pi.attendee_limit) AS attendee_limit,
+        pi.attendee_limit_buffer,
+        ps.note,
+        ps.status,
+        pi.required_time,
+        pi.before_time_buffer,
+        pi.after_time_buffer,
+        ps.start_time,
+        ps.end_time,
+        (SELECT COUNT(*) FROM t_attendee_program_session aps WHERE aps.id_program_session = ps.id_program_session) AS attendee_count
+    FROM
+        t_program_session ps
+    LEFT JOIN
+        t_program_item pi USING (id_program_item)
+    WHERE
+        pi.id_event = :event_id
+    ORDER BY ps.start_time ASC
+"""
+
+
+async def main(sessions: int, registrations: int, repeat: int) -> None:
+    async with temporary_database() as engine:
+        event_id = uuid4()
+        async with engine.begin() as conn:
+            await conn.execute(text(
+                "INSERT INTO t_event (id_event, name, start_date, end_date, status, created_at) "
+                "VALUES (:id, 'Benchmark', '2025-07-31', '2025-08-02', 'PUBLISHED', NOW())"
+            ), {"id": event_id})
+            await conn.execute(text(
+                "INSERT INTO t_program_item (id_program_item, id_event, name, type, required_time, before_time_buffer, after_time_buffer, created_at) "
+                "SELECT gen_random_uuid(), :id, 'Item ' || i, 'WORKSHOP', INTERVAL '1 hour', INTERVAL '10 minutes', INTERVAL '10 minutes', NOW() "
+                "FROM generate_series(1, 50) i"
+            ), {"id": event_id})
+            await conn.execute(text(
+                "INSERT INTO t_program_session (id_program_session, id_program_item, start_time, status, attendee_count, created_at) "
+                "SELECT gen_random_uuid(), pi.id_program_item, TIMESTAMP '2025-07-31 08:00' + (i || ' minutes')::interval, 'PUBLISHED', 0, NOW() "
+                "FROM generate_series(1, :sessions) i "
+                "JOIN LATERAL (SELECT id_program_item FROM t_program_item ORDER BY id_program_item OFFSET i % 50 LIMIT 1) pi ON true"
+            ), {"sessions": sessions})
+            attendees = registrations // 4 + 1
+            await conn.execute(text(
+                "INSERT INTO t_attendee (id_attendee, id_event, email, invite_email_sent, created_at) "
+                "SELECT gen_random_uuid(), :id, 'attendee' || i || '@example.com', false, NOW() FROM generate_series(1, :attendees) i"
+            ), {"id": event_id, "attendees": attendees})
+            await conn.execute(text(
+                "INSERT INTO t_attendee_program_session (id_attendee, id_program_session, created_at) "
+                "SELECT a.id_attendee, s.id_program_session, NOW() "
+                "FROM (SELECT id_attendee, row_number() OVER () AS n FROM t_attendee) a "
+                "CROSS JOIN generate_series(0, 3) k "
+                "JOIN (SELECT id_program_session, row_number() OVER () - 1 AS n FROM t_program_session) s "
+                "  ON s.n = (a.n * 7 + k * 13) % :sessions "
+                "LIMIT :registrations "
+                "ON CONFLICT DO NOTHING"
+            ), {"sessions": sessions, "registrations": registrations})
+            await conn.execute(text("ANALYZE"))
+            total = (await conn.execute(text("SELECT COUNT(*) FROM t_attendee_program_session"))).scalar_one()
+
+        print(f"Event with {sessions} sessions and {total} registrations")
+
+        async with engine.connect() as conn:
+            async def correlated() -> None:
+                (await conn.execute(text(CORRELATED_COUNT_OVERVIEW), {"event_id": event_id})).fetchall()
+            report("correlated COUNT(*)", await measure(correlated, repeat=repeat))
+
+        repository = EventRepository(async_sessionmaker(engine, expire_on_commit=False))
+
+        async def maintained() -> None:
+            await repository.overview(event_id)
+        report("maintained attendee_count", await measure(maintained, repeat=repeat))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=500)
+    parser.add_argument("--registrations", type=int, default=120_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.sessions, args.registrations, args.repeat))
@@ -0,0 +1,63 @@
+"""
+Compares the program overview built in Python (rows -> entities -> JSON bytes through pydantic-core) with the
+grouped overview assembled as JSON text by Postgres (`EventRepository.overview_json`), both uncached.
+
+Example:
+    python benchmarks/overview_json.py --items 500 --sessions 10000
+"""
+import argparse
+import asyncio
+from uuid import uuid4
+
+from common import measure, report, temporary_database
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel import text
+
+from service.event import EventRepository
+from service.event.service import _overview_entities
+
+
+async def main(items: int, sessions: int, repeat: int) -> None:
+    async with temporary_database() as engine:
+        event_id = uuid4()
+        async with engine.begin() as conn:
+            await conn.execute(text(
+                "INSERT INTO t_event (id_event, name, start_date, end_date, status, created_at) "
+                "VALUES (:id, 'Benchmark', '2025-07-31', '2025-08-02', 'PUBLISHED', NOW())"
+            ), {"id": event_id})
+            await conn.execute(text(
+                "INSERT INTO t_program_item (id_program_item, id_event, name, type, attendee_limit, required_time, before_time_buffer, after_time_buffer, created_at) "
+                "SELECT gen_random_uuid(), :id, 'Item ' || i, 'WORKSHOP', 20, INTERVAL '1 hour', INTERVAL '10 minutes', INTERVAL '10 minutes', NOW() "
+                "FROM generate_series(1, :items) i"
+            ), {"id": event_id, "items": items})
+            await conn.execute(text(
+                "INSERT INTO t_program_session (id_program_session, id_program_item, start_time, end_time, note, status, attendee_count, created_at) "
+                "SELECT gen_random_uuid(), pi.id_program_item, TIMESTAMP '2025-07-31 08:00' + (i || ' minutes')::interval, "
+                "  TIMESTAMP '2025-07-31 09:00' + (i || ' minutes')::interval, 'Session ' || i, 'PUBLISHED', i % 20, NOW() "
+                "FROM generate_series(1, :sessions) i "
+                "JOIN LATERAL (SELECT id_program_item FROM t_program_item ORDER BY id_program_item OFFSET i % :items LIMIT 1) pi ON true"
+            ), {"sessions": sessions, "items": items})
+            await conn.execute(text("ANALYZE"))
+
+        repository = EventRepository(async_sessionmaker(engine, expire_on_commit=False))
+        print(f"Event with {items} program items and {sessions} sessions")
+
+        async def python_overview() -> bytes:
+            entities = _overview_entities.validate_python(await repository.overview(event_id), from_attributes=True)
+            return _overview_entities.dump_json(entities)
+
+        async def database_overview() -> bytes:
+            return (await repository.overview_json(event_id)).encode()
+
+        print(f"Body size: Python {len(await python_overview())} B, database {len(await database_overview())} B")
+        report("python rows -> entities -> JSON", await measure(python_overview, repeat=repeat))
+        report("database json_agg passthrough", await measure(database_overview, repeat=repeat))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=500)
+    parser.add_argument("--sessions", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.items, args.sessions, args.repeat))
@@ -0,0 +1,66 @@
+"""
+Compares searching program items with `ILIKE '%...%'` against the generated tsvector column with its GIN index.
+
+Example:
+    python benchmarks/programitem_search.py --items 1000000
+"""
+import argparse
+import asyncio
+from uuid import uuid4
+
+from common import measure, report, temporary_database
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel import text
+
+from service.programitem import ProgramItemRepository
+
+ILIKE_SEARCH = """
+    SELECT *
+    FROM t_program_item
+    WHERE id_event = :event_id AND (name ILIKE :pattern OR description ILIKE :pattern)
+    ORDER BY name
+    LIMIT 20
+"""
+
+WORDS = ["dragon", "dungeon", "larp", "painting", "miniature", "board", "game", "lecture", "cosplay", "workshop", "anime", "tabletop"]
+
+
+async def main(items: int, search: str, repeat: int) -> None:
+    async with temporary_database() as engine:
+        event_id = uuid4()
+        async with engine.begin() as conn:
+            await conn.execute(text(
+                "INSERT INTO t_event (id_event, name, start_date, end_date, status, created_at) "
+                "VALUES (:id, 'Benchmark', '2025-07-31', '2025-08-02', 'PUBLISHED', NOW())"
+            ), {"id": event_id})
+            await conn.execute(text(
+                "INSERT INTO t_program_item (id_program_item, id_event, name, description, type, required_time, before_time_buffer, after_time_buffer, created_at) "
+                "SELECT gen_random_uuid(), :id, "
+                "  (:words)[1 + i % 12] || ' ' || (:words)[1 + (i / 12) % 12] || ' ' || i, "
+                "  'Program item ' || i || ' about ' || (:words)[1 + (i / 144) % 12] || ' and ' || (:words)[1 + (i / 7) % 12], "
+                "  'WORKSHOP', INTERVAL '1 hour', INTERVAL '0 minutes', INTERVAL '0 minutes', NOW() "
+                "FROM generate_series(1, :items) i"
+            ), {"id": event_id, "items": items, "words": WORDS})
+            await conn.execute(text("ANALYZE"))
+
+        print(f"Event with {items} program items, searching for '{search}'")
+
+        async with engine.connect() as conn:
+            async def ilike() -> None:
+                (await conn.execute(text(ILIKE_SEARCH), {"event_id": event_id, "pattern": f"%{search}%"})).fetchall()
+            report("ILIKE substring", await measure(ilike, repeat=repeat))
+
+        repository = ProgramItemRepository(async_sessionmaker(engine, expire_on_commit=False))
+
+        async def full_text() -> None:
+            await repository.search_program_items(event_id=event_id, search=search)
+        report("tsvector + GIN, ranked", await measure(full_text, repeat=repeat))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=1_000_000)
+    parser.add_argument("--search", default="drag lectu")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.items, args.search, args.repeat))
@@ -0,0 +1,96 @@
+"""
+Load test of the registration engine: many concurrent registrations racing for one program session.
+
+Fails (exit code 1) when the session gets overbooked and reports p50/p99 latency of a single registration.
+
+Example:
+    python benchmarks/registration_load.py --concurrency 500 --limit 120 --buffer 5
+"""
+import argparse
+import asyncio
+import sys
+import time
+from uuid import uuid4
+
+from common import percentile, temporary_database
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel import text
+
+from service.registration import CreateRegistrationEntity, ProgramSessionFullException, RegistrationRepository, RegistrationService
+
+
+async def main(concurrency: int, limit: int, buffer: int, pool_size: int) -> int:
+    async with temporary_database(pool_size=pool_size, max_overflow=0, pool_timeout=60) as engine:
+        event_id, item_id, session_id = uuid4(), uuid4(), uuid4()
+        async with engine.begin() as conn:
+            await conn.execute(text(
+                "INSERT INTO t_event (id_event, name, start_date, end_date, status, created_at) "
+                "VALUES (:id, 'Benchmark', '2025-07-31', '2025-08-02', 'PUBLISHED', NOW())"
+            ), {"id": event_id})
+            await conn.execute(text(
+                "INSERT INTO t_program_item (id_program_item, id_event, name, type, attendee_limit, attendee_limit_buffer, "
+                "required_time, before_time_buffer, after_time_buffer, created_at) "
+                "VALUES (:item, :event, 'Popular workshop', 'WORKSHOP', :limit, :buffer, INTERVAL '1 hour', INTERVAL '0', INTERVAL '0', NOW())"
+            ), {"item": item_id, "event": event_id, "limit": limit, "buffer": buffer})
+            await conn.execute(text(
+                "INSERT INTO t_program_session (id_program_session, id_program_item, start_time, status, attendee_count, created_at) "
+                "VALUES (:session, :item, TIMESTAMP '2025-07-31 10:00', 'PUBLISHED', 0, NOW())"
+            ), {"session": session_id, "item": item_id})
+            attendees = (await conn.execute(text(
+                "INSERT INTO t_attendee (id_attendee, id_event, email, invite_email_sent, created_at) "
+                "SELECT gen_random_uuid(), :event, 'attendee' || i || '@example.com', false, NOW() "
+                "FROM generate_series(1, :n) i RETURNING id_attendee"
+            ), {"event": event_id, "n": concurrency})).scalars().all()
+
+        registration_service = RegistrationService(RegistrationRepository(async_sessionmaker(engine, expire_on_commit=False)))
+        latencies: list[float] = []
+        admitted = 0
+        start_gate = asyncio.Event()
+
+        async def register(id_attendee) -> None:
+            nonlocal admitted
+            await start_gate.wait()
+            start = time.perf_counter()
+            try:
+                await registration_service.register(event_id, session_id, CreateRegistrationEntity(id_attendee=id_attendee))
+                admitted += 1
+            except ProgramSessionFullException:
+                pass
+            finally:
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        tasks = [asyncio.create_task(register(id_attendee)) for id_attendee in attendees]
+        await asyncio.sleep(0)
+        wall_start = time.perf_counter()
+        start_gate.set()
+        await asyncio.gather(*tasks)
+        wall = time.perf_counter() - wall_start
+
+        async with engine.connect() as conn:
+            registered = (await conn.execute(text(
+                "SELECT COUNT(*) FROM t_attendee_program_session WHERE id_program_session = :session"
+            ), {"session": session_id})).scalar_one()
+            counter = (await conn.execute(text(
+                "SELECT attendee_count FROM t_program_session WHERE id_program_session = :session"
+            ), {"session": session_id})).scalar_one()
+
+        capacity = limit + buffer
+        print(f"{concurrency} concurrent registrations, capacity {capacity} ({limit} + buffer {buffer}), pool size {pool_size}")
+        print(f"admitted={admitted} registered={registered} counter={counter} wall={wall:.3f} s throughput={concurrency / wall:.0f} req/s")
+        print(f"latency p50={percentile(latencies, 50):.2f} ms p99={percentile(latencies, 99):.2f} ms max={max(latencies):.2f} ms")
+
+        if not (admitted == registered == counter == min(capacity, concurrency)):
+            print("FAIL: session was overbooked or the counter drifted")
+            return 1
+        print("OK: no overbooking")
+        return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--limit", type=int, default=120)
+    parser.add_argument("--buffer", type=int, default=5)
+    parser.add_argument("--pool-size", type=int, default=40)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.concurrency, args.limit, args.buffer, args.pool_size)))
@@ -0,0 +1,85 @@
+"""
+Runs the schedule solver on a synthetic event, without a database.
+
+Compares the greedy layout alone (no local search) with greedy + local search and checks that the result
+has no location overlaps.
+
+Example:
+    python benchmarks/schedule_solver.py --items 500 --locations 30 --days 3
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import common  # noqa: F401 - puts src on the path
+
+from service.solver import Solution, SolverItem, SolverWindow, solve
+
+
+def generate(items: int, locations: int, days: int, pinned: float, seed: int) -> tuple[list[SolverItem], list[SolverWindow]]:
+    rng = random.Random(seed)
+    location_ids = [uuid4() for _ in range(locations)]
+    windows = [
+        SolverWindow(location, datetime(2025, 7, 31, 9) + timedelta(days=day), datetime(2025, 7, 31, 21) + timedelta(days=day))
+        for location in location_ids
+        for day in range(days)
+    ]
+    generated = [
+        SolverItem(
+            id_program_item=uuid4(),
+            required_time=timedelta(minutes=rng.choice([30, 45, 60, 90, 120, 180, 240])),
+            before_time_buffer=timedelta(minutes=rng.choice([0, 10, 15])),
+            after_time_buffer=timedelta(minutes=rng.choice([0, 10, 15])),
+            id_location=rng.choice(location_ids) if rng.random() < pinned else None,
+            attendee_limit=rng.randrange(5, 60)
+        )
+        for _ in range(items)
+    ]
+    return generated, windows
+
+
+def check(solution: Solution, items: list[SolverItem]) -> None:
+    by_id = {item.id_program_item: item for item in items}
+    by_location: dict = {}
+    for placed in solution.sessions:
+        item = by_id[placed.id_program_item]
+        by_location.setdefault(placed.id_location, []).append(
+            (placed.start_time - item.before_time_buffer, placed.end_time + item.after_time_buffer)
+        )
+    for ranges in by_location.values():
+        ranges.sort()
+        assert all(previous[1] <= current[0] for previous, current in zip(ranges, ranges[1:])), "location overlap"
+
+
+def run(name: str, items: list[SolverItem], windows: list[SolverWindow], time_limit: float, seed: int) -> None:
+    started = time.perf_counter()
+    solution = solve(items, windows, time_limit=time_limit, seed=seed)
+    elapsed = time.perf_counter() - started
+    check(solution, items)
+    print(
+        f"{name:<24} {elapsed:6.2f} s  placed={len(solution.sessions):<5} unplaced={len(solution.unplaced):<5} "
+        f"idle={solution.idle_time}  iterations={solution.iterations}"
+    )
+
+
+def main(items: int, locations: int, days: int, pinned: float, time_limit: float, seed: int) -> None:
+    generated, windows = generate(items, locations, days, pinned, seed)
+    demand = sum((item.blocked_time for item in generated), timedelta())
+    capacity = sum((window.end - window.start for window in windows), timedelta())
+    print(f"{items} items ({demand} incl. buffers) into {locations} locations x {days} days ({capacity})")
+    run("greedy", generated, windows, 0, seed)
+    run("greedy + local search", generated, windows, time_limit, seed)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=500)
+    parser.add_argument("--locations", type=int, default=30)
+    parser.add_argument("--days", type=int, default=3)
+    parser.add_argument("--pinned", type=float, default=0.2, help="Share of items bound to a single location")
+    parser.add_argument("--time-limit", type=float, default=3.0)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    main(args.items, args.locations, args.days, args.pinned, args.time_limit, args.seed)
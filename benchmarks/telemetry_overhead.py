@@ -0,0 +1,108 @@
+"""
+Measures the per-request cost of tracing and latency histograms on an in-process endpoint calling a traced
+service, which calls a traced repository three times (the shape of a typical read endpoint).
+
+Every mode runs in a fresh interpreter, the global OpenTelemetry providers can only be installed once.
+`off` is the API without SDK (TELEMETRY_EXPORTER=none), the other modes install the SDK with a discarding
+span exporter and sample the given share of traces. No database is needed, so the SQL statement spans
+are not part of it, they cost about as much as a repository method span each.
+
+Example:
+    python benchmarks/telemetry_overhead.py --requests 5000
+"""
+import argparse
+import asyncio
+import subprocess
+import sys
+import time
+from collections.abc import Sequence
+
+import httpx
+from common import percentile
+from fastapi import FastAPI
+
+from route import ExceptionHandlingMiddleware, TelemetryMiddleware
+from service.core import traced
+
+MODES = {"off": None, "sampled 10%": 0.1, "sampled 100%": 1.0}
+
+
+@traced("repository")
+class BenchmarkRepository:
+    async def get(self, key: int) -> dict:
+        await asyncio.sleep(0)
+        return {"key": key}
+
+
+@traced("service")
+class BenchmarkService:
+    def __init__(self, repository: BenchmarkRepository) -> None:
+        self.repository = repository
+
+    async def get(self, key: int) -> list[dict]:
+        return [await self.repository.get(key + offset) for offset in range(3)]
+
+
+def install_sdk(ratio: float) -> None:
+    from opentelemetry import metrics, trace
+    from opentelemetry.sdk.metrics import AlwaysOffExemplarFilter, MeterProvider
+    from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+    from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, SpanExporter, SpanExportResult
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+    class DiscardingExporter(SpanExporter):
+        def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+            return SpanExportResult.SUCCESS
+
+    provider = TracerProvider(sampler=ParentBased(TraceIdRatioBased(ratio)))
+    provider.add_span_processor(BatchSpanProcessor(DiscardingExporter()))
+    trace.set_tracer_provider(provider)
+    # The same providers as `configure_telemetry` installs, with exporters doing nothing.
+    metrics.set_meter_provider(MeterProvider(metric_readers=[InMemoryMetricReader()], exemplar_filter=AlwaysOffExemplarFilter()))
+
+
+async def child(requests: int) -> None:
+    app = FastAPI()
+    service = BenchmarkService(BenchmarkRepository())
+    app.add_middleware(ExceptionHandlingMiddleware, exception_map=[])
+    app.add_middleware(TelemetryMiddleware)
+
+    @app.get("/items/{key}")
+    async def get_items(key: int):
+        return await service.get(key)
+
+    latencies: list[float] = []
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://benchmark") as client:
+        for index in range(requests + 200):
+            start = time.perf_counter()
+            (await client.get(f"/items/{index}")).raise_for_status()
+            if index >= 200:  # warmup
+                latencies.append((time.perf_counter() - start) * 1_000_000)
+    print(f"{sum(latencies) / len(latencies)} {percentile(latencies, 50)} {percentile(latencies, 99)}")
+
+
+def main(requests: int) -> None:
+    print(f"{requests} sequential requests, 1 service and 3 repository calls each")
+    baseline = None
+    for name, ratio in MODES.items():
+        arguments = [sys.executable, __file__, "--child", "--requests", str(requests)]
+        if ratio is not None:
+            arguments += ["--ratio", str(ratio)]
+        mean, p50, p99 = map(float, subprocess.run(arguments, capture_output=True, text=True, check=True).stdout.split())
+        baseline = baseline if baseline is not None else mean
+        print(f"{name:<14} mean={mean:7.1f} us  p50={p50:7.1f} us  p99={p99:7.1f} us  overhead={mean - baseline:6.1f} us")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--ratio", type=float, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        if args.ratio is not None:
+            install_sdk(args.ratio)
+        asyncio.run(child(args.requests))
+    else:
+        main(args.requests)
@@ -1,4 +1,5 @@
 import api from '../api'
+import type { ApiListResponse } from '../api.ts'
 import { Ref, ref } from 'vue'
 import moment from 'moment/min/moment-with-locales'
 import type { AutoFormConfig } from '../components/ui/AutoForm.d.ts'
@@ -58,9 +59,9 @@ export default function useEventLocation(): {
     const eventLocation = ref<Array<EventLocationEntity>>([])
 
     const fetchEventLocation = async (id_event: string) => {
-        const response = await api.get(`event/${id_event}/location`)
+        const response = await api.get(`event/${id_event}/location`, {searchParams: {limit: 999}})
         eventLocation.value = []
-        const data = await response.json<Array<EventLocationDTO>>()
+        const { data } = await response.json<ApiListResponse<EventLocationDTO>>()
         for (const dto of data) {
             eventLocation.value.push(mapDtoToEntity(dto))
         }
@@ -1,4 +1,5 @@
 import api from '../api'
+import type { ApiListResponse } from '../api.ts'
 import { Ref, ref } from 'vue'
 import moment from 'moment/min/moment-with-locales'
 
@@ -65,8 +66,8 @@ export default function useProgramItem(): {
     const programItems = ref<Array<EventProgramItemEntity>>([])
 
     const fetchProgramItems = async (id_event: string) => {
-        const response = await api.get(`event/${id_event}/programitem`)
-        const data = await response.json<Array<EventProgramItemDto>>()
+        const response = await api.get(`event/${id_event}/programitem`, {searchParams: {limit: 999}})
+        const { data } = await response.json<ApiListResponse<EventProgramItemDto>>()
         programItems.value = data.map(mapDtoToEntity)
     }
 
@@ -3,14 +3,37 @@ import logging.config
 from contextlib import asynccontextmanager
 from pathlib import Path
 
-import yaml
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
+from sqlalchemy.ext.asyncio import AsyncEngine
 
-from route import ExceptionHandlingMiddleware
+from container import container
+from route import ExceptionConfiguration, ExceptionHandlingMiddleware, TelemetryMiddleware, route_reads_to_replicas
+from route.attendee import attendee_router
+from route.calendar import calendar_router
 from route.event import event_router
 from route.location import location_router
 from route.program import program_router
 from route.programitem import programitem_router
+from route.programsession import programsession_router
+from route.registration import registration_router
+from route.schedule import schedule_router
+from route.solver import solver_router
+from service.attendee import AttendeeImportException
+from service.calendar import CalendarNotFoundException
+from service.core import InvalidListCriterionException, ReplicaRouter, configure_telemetry
+from service.programsession import LocationDoubleBookedException, LocationNotFoundException, ProgramItemNotFoundException
+from service.registration import (
+    AlreadyRegisteredException,
+    AlreadyWaitlistedException,
+    AttendeeNotFoundException,
+    ProgramSessionClosedException,
+    ProgramSessionFullException,
+    ProgramSessionNotFoundException,
+    RegistrationNotFoundException,
+)
+from service.schedule import ScheduledSessionNotFoundException
+from service.solver import SolverEventNotFoundException, SolverJobNotFoundException, SolverJobStateException, SolverLayoutOutdatedException
+from settings import Settings
 
 root_logger = logging.getLogger()
 
@@ -20,23 +43,47 @@ logger = logging.getLogger("app")
 src_path = Path(__file__).resolve()
 logging_config_path = f"{src_path.parent.parent}/logging.yaml"
 
-with Path(logging_config_path).open() as f:
-    logger.debug(f"Loading logging configuration from {logging_config_path}")
-    cfg = yaml.safe_load(f)
-    logging.config.dictConfig(cfg)
+
+def configure_logging() -> None:
+    """Applies `logging.yaml`, called on startup instead of at import so importing the app stays cheap."""
+    import yaml
+
+    with Path(logging_config_path).open() as f:
+        logger.debug(f"Loading logging configuration from {logging_config_path}")
+        cfg = yaml.safe_load(f)
+        logging.config.dictConfig(cfg)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    configure_logging()
+    container.spinup(eager=True)
+    settings = container.resolve(Settings)
+    shutdown_telemetry = configure_telemetry(
+        settings.TELEMETRY_EXPORTER,
+        service_name=settings.TELEMETRY_SERVICE_NAME,
+        sample_ratio=settings.TELEMETRY_SAMPLE_RATIO,
+        metric_interval_ms=settings.TELEMETRY_METRIC_INTERVAL_MS
+    )
+    await container.run_postspinup()
     logger.info("Application startup")
     yield
     logger.info("Application shutdown")
+    await container.resolve(ReplicaRouter).close()
+    await container.resolve(AsyncEngine).dispose()
+    shutdown_telemetry()
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, dependencies=[Depends(route_reads_to_replicas)])
 app.include_router(event_router, prefix="/public/event", tags=["event"])
 app.include_router(program_router, prefix="/public/event", tags=["program"])
 app.include_router(location_router, prefix="/public/event/{id_event}/location", tags=["location"])
 app.include_router(programitem_router, prefix="/public/event/{event_id}/programitem", tags=["programitem"])
+app.include_router(programsession_router, prefix="/public/event/{event_id}/session", tags=["programsession"])
+app.include_router(attendee_router, prefix="/public/event/{event_id}/attendee", tags=["attendee"])
+app.include_router(registration_router, prefix="/public/event/{event_id}/session/{session_id}/registration", tags=["registration"])
+app.include_router(schedule_router, prefix="/public/event/{event_id}/schedule", tags=["schedule"])
+app.include_router(solver_router, prefix="/public/event/{event_id}/solver", tags=["solver"])
+app.include_router(calendar_router, prefix="/public/event/{event_id}/calendar", tags=["calendar"])
 
 exception_map = [
     # ExceptionConfiguration(
@@ -44,9 +91,100 @@ exception_map = [
     #     status_code=404,
     #     app_code="KREDSYS_BALANCE_NOT_FOUND",
     # )
+    ExceptionConfiguration(
+        exception=InvalidListCriterionException,
+        status_code=400,
+        app_code="LIST_INVALID_CRITERION",
+    ),
+    ExceptionConfiguration(
+        exception=AttendeeImportException,
+        status_code=422,
+        app_code="ATTENDEE_IMPORT_INVALID_FILE",
+    ),
+    ExceptionConfiguration(
+        exception=ProgramSessionNotFoundException,
+        status_code=404,
+        app_code="REGISTRATION_SESSION_NOT_FOUND",
+    ),
+    ExceptionConfiguration(
+        exception=AttendeeNotFoundException,
+        status_code=404,
+        app_code="REGISTRATION_ATTENDEE_NOT_FOUND",
+    ),
+    ExceptionConfiguration(
+        exception=AlreadyRegisteredException,
+        status_code=409,
+        app_code="REGISTRATION_ALREADY_REGISTERED",
+    ),
+    ExceptionConfiguration(
+        exception=AlreadyWaitlistedException,
+        status_code=409,
+        app_code="REGISTRATION_ALREADY_WAITLISTED",
+    ),
+    ExceptionConfiguration(
+        exception=RegistrationNotFoundException,
+        status_code=404,
+        app_code="REGISTRATION_NOT_FOUND",
+    ),
+    ExceptionConfiguration(
+        exception=ProgramSessionClosedException,
+        status_code=409,
+        app_code="REGISTRATION_SESSION_CLOSED",
+    ),
+    ExceptionConfiguration(
+        exception=ProgramSessionFullException,
+        status_code=409,
+        app_code="REGISTRATION_SESSION_FULL",
+    ),
+    ExceptionConfiguration(
+        exception=ScheduledSessionNotFoundException,
+        status_code=404,
+        app_code="SCHEDULE_SESSION_NOT_FOUND",
+    ),
+    ExceptionConfiguration(
+        exception=ProgramItemNotFoundException,
+        status_code=404,
+        app_code="PROGRAM_SESSION_ITEM_NOT_FOUND",
+    ),
+    ExceptionConfiguration(
+        exception=LocationNotFoundException,
+        status_code=404,
+        app_code="PROGRAM_SESSION_LOCATION_NOT_FOUND",
+    ),
+    ExceptionConfiguration(
+        exception=LocationDoubleBookedException,
+        status_code=409,
+        app_code="PROGRAM_SESSION_LOCATION_DOUBLE_BOOKED",
+    ),
+    ExceptionConfiguration(
+        exception=SolverEventNotFoundException,
+        status_code=404,
+        app_code="SOLVER_EVENT_NOT_FOUND",
+    ),
+    ExceptionConfiguration(
+        exception=SolverJobNotFoundException,
+        status_code=404,
+        app_code="SOLVER_JOB_NOT_FOUND",
+    ),
+    ExceptionConfiguration(
+        exception=SolverJobStateException,
+        status_code=409,
+        app_code="SOLVER_JOB_NOT_FINISHED",
+    ),
+    ExceptionConfiguration(
+        exception=SolverLayoutOutdatedException,
+        status_code=409,
+        app_code="SOLVER_LAYOUT_OUTDATED",
+    ),
+    ExceptionConfiguration(
+        exception=CalendarNotFoundException,
+        status_code=404,
+        app_code="CALENDAR_NOT_FOUND",
+    ),
 ]
 
 app.add_middleware(ExceptionHandlingMiddleware, exception_map=exception_map)
+app.add_middleware(TelemetryMiddleware)
 
 
 @app.get("/healthcheck")
@@ -1,15 +1,23 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+from uuid import UUID
+
 import asyncclick as click
+from sqlalchemy.ext.asyncio import AsyncEngine
 
-from container import engine
+from container import container
+from service.attendee import AttendeeService
+from service.core import SessionStatus
 from service.core.model import create_db
-from settings import get_settings
+from service.event import EventService
+from service.programsession import ProgramSessionService, RecurrenceEntity
+from service.schedule import ScheduleService
 from utils import provision_events, provision_users
-
-settings = get_settings()
+from utils.importtime import breakdown, measure_imports
 
 @click.group()
 async def console():
-    ...
+    container.spinup()
 
 @console.group()
 async def db():
@@ -17,7 +25,7 @@ async def db():
 
 @db.command("create")
 async def db_create():
-    await create_db(engine)
+    await create_db(container.resolve(AsyncEngine))
 
 @db.command("provision")
 async def db_provision():
@@ -26,9 +34,94 @@ async def db_provision():
 
 @db.command("recreate")
 async def db_recreate():
-    await create_db(engine)
+    await create_db(container.resolve(AsyncEngine))
     await provision_users()
     await provision_events()
 
+@db.command("reconcile-counters")
+@click.option("--event-id", type=click.UUID, default=None, help="Reconcile only sessions of this event")
+async def db_reconcile_counters(event_id: UUID | None):
+    repaired = await container.resolve(EventService).reconcile_attendee_counts(event_id)
+    click.echo(f"Repaired attendee counters of {len(repaired)} program sessions")
+    for id_program_session in repaired:
+        click.echo(f"  {id_program_session}")
+
+@db.command("import-attendees")
+@click.argument("event_id", type=click.UUID)
+@click.argument("path", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+async def db_import_attendees(event_id: UUID, path: Path):
+    with path.open("rb") as f:
+        result = await container.resolve(AttendeeService).import_csv(event_id, f)
+    click.echo(
+        f"Imported {result.rows} rows in {result.elapsed:.2f} s ({result.rows_per_second:.0f} rows/s): "
+        f"{result.inserted} inserted, {result.updated} updated, {result.skipped} skipped"
+    )
+
+@console.group()
+async def schedule():
+    ...
+
+@schedule.command("conflicts")
+@click.argument("event_id", type=click.UUID)
+async def schedule_conflicts(event_id: UUID):
+    conflicts = await container.resolve(ScheduleService).list_conflicts(event_id)
+    for conflict in conflicts:
+        click.echo(
+            f"{conflict.id_attendee}: "
+            f"{conflict.first.name} ({conflict.first.start_time:%Y-%m-%d %H:%M}-{conflict.first.end_time:%H:%M}) overlaps "
+            f"{conflict.second.name} ({conflict.second.start_time:%Y-%m-%d %H:%M}-{conflict.second.end_time:%H:%M})"
+        )
+    attendees = len({conflict.id_attendee for conflict in conflicts})
+    click.echo(f"Found {len(conflicts)} conflicting pairs of sessions of {attendees} attendees")
+
+@schedule.command("generate")
+@click.argument("event_id", type=click.UUID)
+@click.argument("program_item_id", type=click.UUID)
+@click.option("--day-start", type=click.DateTime(["%H:%M"]), required=True, help="Start of the first session of each day (HH:MM)")
+@click.option("--day-end", type=click.DateTime(["%H:%M"]), default=None, help="Sessions end by this time of each day (HH:MM), midnight if not set")
+@click.option("--every", type=click.IntRange(min=1), required=True, help="Minutes between the starts of two sessions")
+@click.option("--location-id", type=click.UUID, default=None, help="Location overriding the location of the program item")
+@click.option("--status", type=click.Choice([status.name for status in SessionStatus]), default=SessionStatus.DRAFT.name, show_default=True)
+async def schedule_generate(
+    event_id: UUID,
+    program_item_id: UUID,
+    day_start: datetime,
+    day_end: datetime | None,
+    every: int,
+    location_id: UUID | None,
+    status: str
+):
+    result = await container.resolve(ProgramSessionService).generate_program_sessions(
+        event_id,
+        RecurrenceEntity(
+            id_program_item=program_item_id,
+            id_location_override=location_id,
+            day_start=day_start.time(),
+            day_end=day_end.time() if day_end is not None else None,
+            every=timedelta(minutes=every),
+            status=SessionStatus[status]
+        )
+    )
+    for program_session in result.created:
+        click.echo(f"  {program_session.start_time:%Y-%m-%d %H:%M} {program_session.id_program_session}")
+    click.echo(f"Created {len(result.created)} sessions, skipped {result.skipped} double-booking their location")
+
+@console.group()
+async def debug():
+    ...
+
+@debug.command("import-time")
+@click.option("--module", default="app", show_default=True, help="Module whose cold import is measured")
+@click.option("--budget-ms", type=float, default=1500, show_default=True, help="Fail when the import takes longer")
+@click.option("--top", type=int, default=15, show_default=True, help="Number of packages listed")
+async def debug_import_time(module: str, budget_ms: float, top: int):
+    entries = measure_imports(module)
+    total_us = sum(entry.self_us for entry in entries)
+    for package, us in breakdown(entries)[:top]:
+        click.echo(f"{package:<32} {us / 1000:8.1f} ms {us / total_us:6.1%}")
+    click.echo(f"{'total':<32} {total_us / 1000:8.1f} ms (budget {budget_ms:.0f} ms)")
+    if total_us / 1000 > budget_ms:
+        raise click.ClickException(f"Importing {module} exceeds the budget of {budget_ms:.0f} ms")
+
 if __name__ == "__main__":
     console()
@@ -4,33 +4,81 @@ from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.asyncio.engine import AsyncEngine
 
 from di import Container
+from service.attendee import AttendeeRepository, AttendeeService
+from service.calendar import CalendarRepository, CalendarService
+from service.core import CacheBackend, InstrumentedAsyncPool, Replica, ReplicaRouter, create_cache, instrument_engine
 from service.event import EventRepository, EventService
 from service.programitem import ProgramItemRepository, ProgramItemService
+from service.programsession import ProgramSessionRepository, ProgramSessionService
+from service.registration import RegistrationRepository, RegistrationService
+from service.schedule import ScheduleRepository, ScheduleService
+from service.solver import SolverRepository, SolverService
 from settings import Settings, get_settings
 
 logger = logging.getLogger("container")
 container = Container()
 
-settings: Settings = get_settings()
 
-DATABASE_URL = f"postgresql+asyncpg://{settings.POSTGRES_USER}:{settings.POSTGRES_PASSWORD}@{settings.POSTGRES_HOST}/{settings.POSTGRES_DB}"
+def _create_engine(settings: Settings, host: str, name: str) -> AsyncEngine:
+    database_url = f"postgresql+asyncpg://{settings.POSTGRES_USER}:{settings.POSTGRES_PASSWORD}@{host}/{settings.POSTGRES_DB}"
+    engine = create_async_engine(
+        database_url,
+        echo=False,
+        poolclass=InstrumentedAsyncPool,
+        pool_logging_name=name,
+        pool_size=settings.POSTGRES_POOL_SIZE,
+        max_overflow=settings.POSTGRES_POOL_MAX_OVERFLOW,
+        pool_timeout=settings.POSTGRES_POOL_TIMEOUT,
+        pool_pre_ping=settings.POSTGRES_POOL_PRE_PING,
+        pool_recycle=settings.POSTGRES_POOL_RECYCLE,
+        connect_args={"statement_cache_size": settings.POSTGRES_STATEMENT_CACHE_SIZE}
+    )
+    instrument_engine(engine)
+    return engine
 
-engine: AsyncEngine = create_async_engine(DATABASE_URL, echo=False)
 
-async_session: async_sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
+def create_engine(settings: Settings) -> AsyncEngine:
+    return _create_engine(settings, settings.POSTGRES_HOST, "primary")
 
-event_repository = EventRepository(async_session)
-container.add(EventRepository, event_repository)
 
-event_service = EventService(event_repository)
-container.add(EventService, event_service)
+def create_replica_router(settings: Settings) -> ReplicaRouter:
+    replicas = []
+    for index, host in enumerate(settings.POSTGRES_REPLICA_HOSTS):
+        engine = _create_engine(settings, host, f"replica-{index}")
+        replicas.append(Replica(host, engine, async_sessionmaker(engine, expire_on_commit=False)))
+    return ReplicaRouter(replicas, health_check_interval=settings.POSTGRES_REPLICA_HEALTH_CHECK_INTERVAL)
 
-programitem_repository = ProgramItemRepository(async_session)
-container.add(ProgramItemRepository, programitem_repository)
 
-programitem_service = ProgramItemService(programitem_repository)
-container.add(ProgramItemService, programitem_service)
+def create_sessionmaker(engine: AsyncEngine) -> async_sessionmaker:
+    return async_sessionmaker(engine, expire_on_commit=False)
 
-container.spinup()
+
+def create_cache_backend(settings: Settings) -> CacheBackend:
+    return create_cache(settings.REDIS_OM_URL, settings.CACHE_MAX_ENTRIES)
+
+
+# Nothing is built at import, the application lifespan (or the console) calls `container.spinup(eager=True)`.
+container.register(Settings, get_settings)
+container.register(AsyncEngine, create_engine)
+container.register(async_sessionmaker, create_sessionmaker)
+container.register(CacheBackend, create_cache_backend)
+container.register(ReplicaRouter, create_replica_router)
+
+container.register(EventRepository)
+container.register(EventService)
+container.register(ProgramItemRepository)
+container.register(ProgramItemService)
+container.register(ProgramSessionRepository)
+container.register(ProgramSessionService)
+container.register(RegistrationRepository)
+container.register(RegistrationService)
+container.register(AttendeeRepository)
+container.register(AttendeeService)
+container.register(ScheduleRepository)
+container.register(ScheduleService)
+container.register(SolverRepository)
+container.register(SolverService)
+container.register(CalendarRepository)
+container.register(CalendarService)
 
 service = container.get
@@ -1,6 +1,9 @@
+import inspect
 import logging
-from collections.abc import Callable
-from functools import lru_cache, partial
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any, get_origin, get_type_hints
 
 logger = logging.getLogger("di")
 
@@ -29,116 +32,224 @@ class FutureService:
         return f"FutureService({self._signature})"
 
 
+class Lifetime(StrEnum):
+    """
+    How long an instance created by the container lives.
+
+    SINGLETON instances are created once, on first use. REQUEST instances are created once per resolution,
+    which in FastAPI means once per request (FastAPI caches dependencies within a request). TRANSIENT instances
+    are created on every injection.
+    """
+    SINGLETON = "singleton"
+    REQUEST = "request"
+    TRANSIENT = "transient"
+
+
+@dataclass(slots=True)
+class _Registration:
+    signature: Any
+    factory: Callable[..., Any] | None
+    lifetime: Lifetime
+    instance: Any = None
+    # Constructor argument name -> signature, resolved from the factory's type hints on first use.
+    dependencies: dict[str, Any] | None = None
+
+
 class Container:
     """
     A service container class that manages the lifecycle and dependencies of services.
 
-    The `Container` class allows you to register service instances, retrieve cached instances,
-    and initialize dependencies for services. It provides methods to add services, get cached
-    instances, and spin up the services by injecting their dependencies.
+    Services are either added as ready instances or registered as factories (usually the class itself),
+    which are called lazily on first use with their constructor arguments resolved from the container by
+    type hint. Attributes holding a `FutureService` are replaced by the service with the given signature
+    when the instance is created, or in `spinup` for added instances.
 
     Attributes:
-        _services (list): A list to store the registered services and their instances.
+        _registrations (dict): The registered services by signature.
+        _providers (dict): Dependency callables handed out by `get`, one per signature.
 
     Methods:
-        add(signature: str, instance: object) -> None:
-        get_cached_instance(instance: object) -> Type[object]:
+        add(signature: object, instance: object) -> None:
+        register(signature: object, factory: Callable | None, lifetime: Lifetime) -> None:
+        resolve(signature: object) -> object:
         get(required_signature: object) -> Callable:
         spinup() -> None:
     Examples:
         >>> container = Container()
-        >>> container.add('database', DatabaseService())
-        >>> container.add('cache', CacheService())
-        >>> db_service = container.get('database')()
-        >>> cache_service = container.get('cache')()
+        >>> container.add(async_sessionmaker, sessionmaker)
+        >>> container.register(EventRepository)
+        >>> container.register(EventService)
         >>> container.spinup()
+        >>> event_service = container.resolve(EventService)
+        >>> event_service_dependency = Depends(container.get(EventService))
     """
 
     def __init__(self) -> None:
-        self._services: list = []
+        self._registrations: dict[Any, _Registration] = {}
+        self._providers: dict[Any, Callable[[], Awaitable[Any]]] = {}
 
     def add(self, signature, instance):
         """
-        Adds a service instance to the service container.
+        Adds a service instance to the service container, it is a singleton.
 
         Args:
-            signature (str): The unique identifier for the service.
+            signature (object): The unique identifier for the service, usually its type.
             instance (object): The instance of the service to be added.
 
         Returns:
             None
         """
         logger.debug(f"Instance for {signature} added as {instance}")
-        self._services.append((signature, instance))
+        self._registrations[signature] = _Registration(signature, None, Lifetime.SINGLETON, instance)
 
-    @staticmethod
-    @lru_cache(typed=True)
-    def get_cached_instance(instance) -> type[object]:
+    def register(self, signature, factory: Callable[..., Any] | None = None, lifetime: Lifetime = Lifetime.SINGLETON):
         """
-        Retrieve and return a cached instance.
+        Registers a factory creating the service on demand.
+
+        The factory's parameters are injected by their type hints (string annotations are resolved against the
+        registered types, so services may import their dependencies under `TYPE_CHECKING` only). Parameters
+        with a default and no registered type are left to the default.
 
         Args:
-            instance: The instance to be retrieved from the cache.
+            signature (object): The unique identifier for the service, usually its type.
+            factory (Callable, optional): Creates the service, defaults to the signature itself.
+            lifetime (Lifetime): How long a created instance lives.
 
         Returns:
-            Type[object]: The cached instance.
+            None
         """
-        logger.debug(f"Returning instance {instance}")
-        return instance
+        logger.debug(f"Factory for {signature} registered as {lifetime}")
+        self._registrations[signature] = _Registration(signature, factory or signature, lifetime)
+        self._providers.pop(signature, None)
 
-    def get(self, required_signature: object) -> Callable:
+    def resolve(self, signature, scope: dict | None = None):
         """
-        Retrieve a cached instance of a service based on the required signature.
+        Returns the service for a signature, creating it when its lifetime requires.
 
         Args:
-            required_signature (object): The signature of the required service.
+            signature (object): The signature of the required service.
+            scope (dict, optional): Instances with the REQUEST lifetime created so far in this resolution.
 
         Returns:
-            Callable: A partial function that returns the cached instance of the service.
+            object: The service instance.
 
         Raises:
-            ValueError: If no service with the required signature is found.
+            ValueError: If no service with the required signature is registered, or a dependency of its factory is not.
         """
-        for signature, instance in self._services:
-            if signature is required_signature:
-                return partial(self.get_cached_instance, instance)
-        raise ValueError("No service %s found" % required_signature)
+        registration = self._registrations.get(signature)
+        if registration is None:
+            raise ValueError(f"No service {signature} found")
+        if registration.instance is not None:
+            return registration.instance
+        if registration.lifetime is Lifetime.REQUEST:
+            scope = {} if scope is None else scope
+            if signature in scope:
+                return scope[signature]
+
+        instance = self._create(registration, scope)
+        if registration.lifetime is Lifetime.SINGLETON:
+            registration.instance = instance
+        elif registration.lifetime is Lifetime.REQUEST:
+            scope[signature] = instance  # type: ignore[index]
+        return instance
 
-    def spinup(self):
+    def get(self, required_signature: object) -> Callable[[], Awaitable[Any]]:
         """
-        Initializes and injects dependencies for services.
+        Returns a dependency callable providing the service, meant for `fastapi.Depends`.
 
-        This method iterates over the registered services and their properties.
-        If a property is an instance of FutureService, it replaces it with an
-        initialized service instance based on the signature.
-        You are required to call this method before using the services.
+        The callable is asynchronous, so FastAPI calls it on the event loop instead of dispatching it to the
+        thread pool. The same callable is returned for every call except for TRANSIENT services, which get a
+        new one, so FastAPI's per-request dependency cache does not share their instances.
+
+        Args:
+            required_signature (object): The signature of the required service.
+
+        Returns:
+            Callable: An async function returning the service instance.
 
         Raises:
-            AttributeError: If a property does not exist on the instance.
-            TypeError: If the property is not an instance of FutureService.
+            ValueError: If no service with the required signature is registered.
+        """
+        provider = self._providers.get(required_signature)
+        if provider is not None:
+            return provider
+        registration = self._registrations.get(required_signature)
+        if registration is None:
+            raise ValueError(f"No service {required_signature} found")
+
+        async def provide():
+            instance = registration.instance
+            return instance if instance is not None else self.resolve(required_signature)
+
+        if registration.lifetime is not Lifetime.TRANSIENT:
+            self._providers[required_signature] = provide
+        return provide
+
+    def spinup(self, eager: bool = False):
         """
-        for signature, instance in self._services:
-            for property in dir(instance):
-                try:
-                    if isinstance(getattr(instance, property), FutureService):
-                        setattr(
-                            instance,
-                            property,
-                            self.get(getattr(instance, property)._signature)(),
-                        )
-                except AttributeError:
-                    continue
-            logger.debug(f"Service {signature} is {instance}")
+        Injects dependencies of added instances and resolves the wiring of registered factories.
+
+        Every `FutureService` attribute of an added instance is replaced by the service with its signature.
+        Unless `eager`, factories are not called and their services are created on first use, but missing
+        dependencies are reported here already. You are required to call this method before using the services.
 
+        Args:
+            eager (bool): Create every singleton now, e.g. in the application lifespan.
+
+        Raises:
+            ValueError: If a dependency is not registered.
+        """
+        for registration in list(self._registrations.values()):
+            if registration.instance is not None:
+                self._wire(registration.instance, None)
+            elif registration.dependencies is None:
+                registration.dependencies = self._dependencies(registration.factory)  # type: ignore[arg-type]
+        if eager:
+            for registration in list(self._registrations.values()):
+                if registration.lifetime is Lifetime.SINGLETON:
+                    self.resolve(registration.signature)
+        for registration in self._registrations.values():
+            logger.debug(f"Service {registration.signature} is {registration.instance or registration.factory}")
 
     async def run_postspinup(self):
         """
         Runs the post-spinup method for services.
 
-        This method iterates over the registered services and checks if they have a post-spinup method.
+        This method iterates over the created singleton services and checks if they have a post-spinup method.
         If a service has a post-spinup method, it is called asynchronously.
         """
-        for signature, instance in self._services:
-            if hasattr(instance, "post_spinup"):
-                logger.debug(f"Running post-spinup for {signature}")
-                await instance.post_spinup()
+        for registration in list(self._registrations.values()):
+            if registration.instance is not None and hasattr(registration.instance, "post_spinup"):
+                logger.debug(f"Running post-spinup for {registration.signature}")
+                await registration.instance.post_spinup()
+
+    def _create(self, registration: _Registration, scope: dict | None):
+        if registration.dependencies is None:
+            registration.dependencies = self._dependencies(registration.factory)  # type: ignore[arg-type]
+        arguments = {name: self.resolve(signature, scope) for name, signature in registration.dependencies.items()}
+        instance = registration.factory(**arguments)  # type: ignore[misc]
+        self._wire(instance, scope)
+        logger.debug(f"Created {registration.signature} as {instance}")
+        return instance
+
+    def _wire(self, instance, scope: dict | None):
+        # Only the instance's own attributes, FutureService placeholders are always assigned in __init__.
+        for name, value in list(getattr(instance, "__dict__", {}).items()):
+            if isinstance(value, FutureService):
+                setattr(instance, name, self.resolve(value._signature, scope))
+
+    def _dependencies(self, factory: Callable[..., Any]) -> dict[str, Any]:
+        names = {signature.__name__: signature for signature in self._registrations if isinstance(signature, type)}
+        target = factory.__init__ if isinstance(factory, type) else factory
+        hints = get_type_hints(target, localns=names)
+        dependencies = {}
+        for name, parameter in inspect.signature(factory).parameters.items():
+            if parameter.kind in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD):
+                continue
+            hint = hints.get(name)
+            signature = hint if hint in self._registrations else get_origin(hint)
+            if signature in self._registrations:
+                dependencies[name] = signature
+            elif parameter.default is parameter.empty:
+                raise ValueError(f"No service {hint} found for argument {name} of {factory}")
+        return dependencies
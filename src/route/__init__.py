@@ -1,6 +1,13 @@
-from .middleware import ExceptionConfiguration, ExceptionHandlingMiddleware
+from .dependency import route_reads_to_replicas
+from .response import FastJSONRoute
+from .middleware import ExceptionConfiguration, ExceptionHandlingMiddleware, RequestIdFilter, TelemetryMiddleware, request_id
 
 __all__ = [
     "ExceptionConfiguration",
     "ExceptionHandlingMiddleware",
+    "FastJSONRoute",
+    "RequestIdFilter",
+    "TelemetryMiddleware",
+    "request_id",
+    "route_reads_to_replicas",
 ]
@@ -0,0 +1,40 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
+
+from container import service
+from route.export import ExportFormat, export_response
+from service.attendee import AttendeeEntity, AttendeeImportEntity, AttendeeService
+
+attendee_router = APIRouter()
+
+attendee_service_dependency = Depends(service(AttendeeService))
+
+
+# The CSV is the raw request body, it is parsed and copied into the database while it is being received.
+@attendee_router.post(
+    "/import",
+    openapi_extra={"requestBody": {"required": True, "content": {"text/csv": {"schema": {"type": "string", "format": "binary"}}}}},
+)
+async def import_attendees(
+    event_id: UUID,
+    request: Request,
+    attendee_service: AttendeeService = attendee_service_dependency,
+) -> AttendeeImportEntity:
+    return await attendee_service.import_csv(event_id, request.stream())
+
+
+@attendee_router.get("/export", response_class=StreamingResponse)
+async def export_attendees(
+    event_id: UUID,
+    format: ExportFormat = "ndjson",  # noqa: A002
+    chunk_size: int = Query(default=1000, ge=1, le=10000),
+    attendee_service: AttendeeService = attendee_service_dependency,
+):
+    return export_response(
+        attendee_service.export_attendees(event_id, chunk_size),
+        AttendeeEntity,
+        format,
+        f"attendees-{event_id}"
+    )
@@ -0,0 +1,47 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Header, Response
+
+from container import service
+from service.calendar import CalendarFeed, CalendarService
+
+calendar_router = APIRouter()
+
+calendar_service_dependency = Depends(service(CalendarService))
+
+
+def calendar_response(feed: CalendarFeed) -> Response:
+    # no-cache lets clients and proxies keep the feed but revalidate it with the ETag on every poll.
+    headers = {"ETag": feed.etag, "Cache-Control": "no-cache"}
+    if feed.body is None:
+        return Response(status_code=304, headers=headers)
+    return Response(content=feed.body, media_type="text/calendar; charset=utf-8", headers=headers)
+
+
+@calendar_router.get("/event.ics", response_class=Response)
+async def get_event_calendar(
+    event_id: UUID,
+    if_none_match: str | None = Header(default=None),
+    calendar_service: CalendarService = calendar_service_dependency,
+):
+    return calendar_response(await calendar_service.event_feed(event_id, if_none_match))
+
+
+@calendar_router.get("/location/{location_id}.ics", response_class=Response)
+async def get_location_calendar(
+    event_id: UUID,
+    location_id: UUID,
+    if_none_match: str | None = Header(default=None),
+    calendar_service: CalendarService = calendar_service_dependency,
+):
+    return calendar_response(await calendar_service.location_feed(event_id, location_id, if_none_match))
+
+
+@calendar_router.get("/attendee/{attendee_id}.ics", response_class=Response)
+async def get_attendee_calendar(
+    event_id: UUID,
+    attendee_id: UUID,
+    if_none_match: str | None = Header(default=None),
+    calendar_service: CalendarService = calendar_service_dependency,
+):
+    return calendar_response(await calendar_service.attendee_feed(event_id, attendee_id, if_none_match))
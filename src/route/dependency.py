@@ -0,0 +1,14 @@
+from fastapi import Request
+
+from service.core import read_intent
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+async def route_reads_to_replicas(request: Request) -> None:
+    """
+    Application wide dependency marking requests with a safe method as read-only, their sessions go to replicas.
+
+    It is async on purpose: FastAPI awaits it in the request's task, so the context variable is visible to the endpoint.
+    """
+    read_intent.set(request.method in SAFE_METHODS)
@@ -1,26 +1,27 @@
+from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Response
 
 from container import service
-from service.core import ListResponse
-from service.event import EventEntity, EventService, ProgramOverviewEntity
+from route.response import FastJSONRoute
+from service.core import ListCriterion, ListOptions, ListResponse
+from service.event import EventEntity, EventService, ProgramOverviewEntity, ProgramOverviewItemEntity, event_list_options
 
-event_router = APIRouter()
+event_router = APIRouter(route_class=FastJSONRoute)
 
 event_service_dependency = Depends(service(EventService))
 
 @event_router.get("")
 async def list_events(
+    criterion: Annotated[ListCriterion, Query()],
     event_service: EventService = event_service_dependency,
 ) -> ListResponse[EventEntity]:
-    events = await event_service.list_events()
-    return ListResponse(
-        data=events,
-        limit=999,
-        offset=0,
-        total=len(events)
-    )
+    return await event_service.list_events(criterion)
+
+@event_router.get("/$options")
+async def get_event_list_options() -> ListOptions:
+    return event_list_options
 
 @event_router.get("/{event_id}/overview")
 async def get_event_overview(
@@ -28,3 +29,11 @@ async def get_event_overview(
     event_service: EventService = event_service_dependency,
 ) -> list[ProgramOverviewEntity]:
     return await event_service.overview(event_id)
+
+@event_router.get("/{event_id}/overview/grouped", response_model=list[ProgramOverviewItemEntity])
+async def get_event_overview_grouped(
+    event_id: UUID,
+    event_service: EventService = event_service_dependency,
+) -> Response:
+    # The body comes as JSON from the database, it is passed through untouched.
+    return Response(await event_service.overview_json(event_id), media_type="application/json")
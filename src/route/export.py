@@ -0,0 +1,65 @@
+import csv
+import io
+from collections.abc import AsyncGenerator, AsyncIterable, Sequence
+from typing import Literal
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+
+ExportFormat = Literal["ndjson", "csv"]
+
+media_types: dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+async def _ndjson(chunks: AsyncIterable[Sequence[BaseModel]], entity: type[BaseModel]) -> AsyncGenerator[bytes, None]:
+    adapter = TypeAdapter(entity)
+    async for chunk in chunks:
+        if chunk:
+            yield b"\n".join(adapter.dump_json(item) for item in chunk) + b"\n"
+
+
+async def _csv(chunks: AsyncIterable[Sequence[BaseModel]], entity: type[BaseModel]) -> AsyncGenerator[bytes, None]:
+    adapter = TypeAdapter(list[entity])  # type: ignore[valid-type]
+    fields = list(entity.model_fields)
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fields, extrasaction="ignore")
+    writer.writeheader()
+    # The header goes out before the query produces the first row.
+    yield buffer.getvalue().encode()
+    async for chunk in chunks:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(adapter.dump_python(list(chunk), mode="json"))
+        yield buffer.getvalue().encode()
+
+
+def export_response(
+    chunks: AsyncIterable[Sequence[BaseModel]],
+    entity: type[BaseModel],
+    export_format: ExportFormat,
+    filename: str,
+) -> StreamingResponse:
+    """
+    Builds a streaming download of entities produced chunk by chunk.
+
+    Each chunk is serialized and sent as soon as it is produced, so the peak memory is bounded by the chunk
+    size and not by the size of the whole export.
+
+    Args:
+        chunks (AsyncIterable[Sequence[BaseModel]]): Chunks of entities, typically a service export generator.
+        entity (type[BaseModel]): The entity type, its fields become the CSV columns.
+        export_format (ExportFormat): "ndjson" (one JSON object per line) or "csv".
+        filename (str): Download file name without the extension.
+
+    Returns:
+        StreamingResponse: The response streaming the serialized chunks.
+    """
+    body = _ndjson(chunks, entity) if export_format == "ndjson" else _csv(chunks, entity)
+    return StreamingResponse(
+        body,
+        media_type=media_types[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format}"'},
+    )
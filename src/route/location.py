@@ -1,15 +1,21 @@
 from asyncio import sleep
+from datetime import datetime, timedelta
+from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Body, Depends, Query
 from pydantic import BaseModel
 
 from container import service
-from service.event import CreateLocationEntity, EventService, LocationEntity
+from route.response import FastJSONRoute
+from service.core import BATCH_MAX_ITEMS, BatchResponse, ListCriterion, ListOptions, ListResponse
+from service.event import CreateLocationEntity, EventService, LocationEntity, location_list_options
+from service.programsession import FreeSlotEntity, ProgramSessionService
 
-location_router = APIRouter()
+location_router = APIRouter(route_class=FastJSONRoute)
 
 event_service_dependency = Depends(service(EventService))
+programsession_service_dependency = Depends(service(ProgramSessionService))
 
 
 class AutoFormField(BaseModel):
@@ -32,9 +38,10 @@ class AutoFormConfig(BaseModel):
 @location_router.get("")
 async def get_event_locations(
     id_event: UUID,
+    criterion: Annotated[ListCriterion, Query()],
     event_service: EventService = event_service_dependency,
-) -> list[LocationEntity]:
-    return await event_service.list_locations(id_event)
+) -> ListResponse[LocationEntity]:
+    return await event_service.list_locations(id_event, criterion)
 
 
 @location_router.post("")
@@ -42,9 +49,17 @@ async def create_event_location(
     id_event: UUID,
     location: CreateLocationEntity,
     event_service: EventService = event_service_dependency,
-):
-    new_location_id = await event_service.create_location(id_event, location)
-    return await event_service.get_location_by_id(new_location_id)
+) -> LocationEntity:
+    return await event_service.create_location(id_event, location)
+
+
+@location_router.post("/$batch")
+async def create_event_locations(
+    id_event: UUID,
+    locations: Annotated[list[CreateLocationEntity], Body(min_length=1, max_length=BATCH_MAX_ITEMS)],
+    event_service: EventService = event_service_dependency,
+) -> BatchResponse[LocationEntity]:
+    return await event_service.create_locations(id_event, locations)
 
 @location_router.delete("/{location_id}")
 async def delete_event_location(
@@ -53,6 +68,21 @@ async def delete_event_location(
 ):
     await event_service.delete_location(location_id)
 
+@location_router.get("/{location_id}/free-slots")
+async def get_event_location_free_slots(
+    id_event: UUID,
+    location_id: UUID,
+    start_time: datetime | None = Query(default=None, description="Start of the searched window, defaults to the first day of the event"),
+    end_time: datetime | None = Query(default=None, description="End of the searched window, defaults to the end of the event"),
+    min_duration: timedelta = Query(default=timedelta(0), description="Leave out shorter slots"),
+    programsession_service: ProgramSessionService = programsession_service_dependency,
+) -> list[FreeSlotEntity]:
+    return await programsession_service.free_slots(id_event, location_id, start_time, end_time, min_duration)
+
+@location_router.get("/$options")
+async def get_event_location_list_options() -> ListOptions:
+    return location_list_options
+
 @location_router.get("/$autoform")
 async def get_event_location_options() -> AutoFormConfig:
     return AutoFormConfig(
@@ -1,13 +1,25 @@
 import json
 import logging
+import time
+from contextvars import ContextVar
 from dataclasses import dataclass
-from traceback import format_exc, print_exception
+from traceback import print_exception
 from uuid import uuid4
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from opentelemetry import metrics, propagate, trace
+from opentelemetry.trace import Span, SpanKind, Status, StatusCode
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger("route.middleware")
+tracer = trace.get_tracer("rzbportal.route.tracer")
+meter = metrics.get_meter("rzbportal.route.meter")
+
+request_duration = meter.create_histogram(
+    "http.server.request.duration", unit="ms", description="Duration of HTTP requests, until the last body chunk was sent"
+)
+
+# Id of the request being handled, also sent back in the X-Request-ID header.
+request_id: ContextVar[str] = ContextVar("request_id", default="-")
 
 
 @dataclass
@@ -25,10 +37,29 @@ class ExceptionConfiguration:
     app_code: str
 
 
-class ExceptionHandlingMiddleware(BaseHTTPMiddleware):
+class RequestIdFilter(logging.Filter):
+    """
+    Logging filter adding the id of the current request as `request_id` to every record ("-" outside of requests).
+
+    Example (logging.yaml):
+        filters:
+          request_id:
+            "()": route.middleware.RequestIdFilter
+    """
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id.get()
+        return True
+
+
+class ExceptionHandlingMiddleware:
     """
     Middleware for handling exceptions in an HTTP application.
 
+    Every response carries an `X-Request-ID` header, the id is also available in the `request_id` context
+    variable while the request is handled. Exceptions from the exception map are turned into JSON responses
+    with their status and app code, any other exception into a JSON 500. It is a plain ASGI middleware, the
+    response is passed through untouched, which keeps streaming responses streaming.
+
     Args:
         app: The ASGI application.
         exception_map (list[ExceptionConfiguration]): A list of exception configurations to handle.
@@ -40,58 +71,120 @@ class ExceptionHandlingMiddleware(BaseHTTPMiddleware):
         ]
         app.add_middleware(ExceptionHandlingMiddleware, exception_map=exception_map)
     """
-    def __init__(self, app, exception_map: list[ExceptionConfiguration], store_traceback: bool = False):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, exception_map: list[ExceptionConfiguration], store_traceback: bool = False):
+        self.app = app
         self._exeption_map = exception_map
         self._store_traceback = store_traceback
+        self._exceptions = tuple(e.exception for e in exception_map)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        id = str(uuid4())
+        header = (b"x-request-id", id.encode())
+        token = request_id.set(id)
+        response_started = False
+
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                message["headers"] = [*message.get("headers", ()), header]
+            await send(message)
 
-    async def dispatch(self, request: Request, call_next):
-        excs = tuple([e.exception for e in self._exeption_map])
-        request_id = uuid4()
         try:
-            response = await call_next(request)
-            response.headers["X-Request-ID"] = str(request_id)
-            return response
-        except excs as e:
-            logger.exception(e, extra=dict(request_id=request_id))
-            # if not self._store_traceback:
-            #     traceback_file = f"/logs/{request_id}.{e.__class__.__name__}.log"
-            #     logger.debug(f"Traceback stored in {traceback_file}")
-            #     with open (traceback_file, "w+") as f:
-            #         f.write(f"{e!s}\n\n")
-            #         f.write(format_exc())
-            # for exc in self._exeption_map:
-            #     if isinstance(e, exc.exception):
-            #         return Response(
-            #             status_code=exc.status_code,
-            #             content=json.dumps(dict(
-            #                 code=exc.app_code,
-            #                 message=str(e),
-            #                 request_id=str(request_id)
-            #             )),
-            #             headers={
-            #                 "Content-type": "application/json",
-            #                 "X-Request-ID": str(request_id)
-            #             }
-            #         )
+            await self.app(scope, receive, send_with_request_id)
+        except self._exceptions as e:
+            logger.warning(e, extra=dict(request_id=id))
+            if response_started:
+                raise
+            exc = next(exc for exc in self._exeption_map if isinstance(e, exc.exception))
+            await self._send_error(send, exc.status_code, exc.app_code, str(e), header)
         except Exception as e:
-            logger.error(e, extra=dict(request_id=request_id))
+            logger.error(e, extra=dict(request_id=id))
             print_exception(e)
-            # if not self._store_traceback:
-            #     traceback_file = f"/logs/{request_id}.{e.__class__.__name__}.log"
-            #     logger.debug(f"Traceback stored in {traceback_file}")
-            #     with open (traceback_file, "w+") as f:
-            #         f.write(f"{e!s}\n\n")
-            #         f.write(format_exc())
-            return Response(
-                status_code=500,
-                content=json.dumps(dict(
-                    code="FUCK...",
-                    message=str(e),
-                    request_id=str(request_id)
-                )),
-                headers={
-                    "Content-type": "application/json",
-                    "X-Request-ID": str(request_id)
-                }
-            )
+            if response_started:
+                raise
+            await self._send_error(send, 500, "FUCK...", str(e), header)
+        finally:
+            request_id.reset(token)
+
+    @staticmethod
+    async def _send_error(send: Send, status_code: int, code: str, message: str, header: tuple[bytes, bytes]) -> None:
+        body = json.dumps(dict(code=code, message=message, request_id=header[1].decode())).encode()
+        await send({
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode()), header],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+class TelemetryMiddleware:
+    """
+    Middleware recording a server span and the latency of every HTTP request.
+
+    The span continues an incoming `traceparent` and is named after the matched route template
+    (`GET /public/event/{event_id}/overview`), so requests of one endpoint group together. Spans of
+    services, repositories and SQL statements called by the endpoint become its children. The latency
+    goes to the `http.server.request.duration` histogram, tagged with method, route and status code.
+
+    Add it last, so it is the outermost middleware and sees the responses of `ExceptionHandlingMiddleware`.
+
+    Example:
+        app.add_middleware(TelemetryMiddleware)
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        method = scope["method"]
+        status_code = 500
+        # Only requests coming with a trace context continue it, the others start a trace of their own.
+        parent = None
+        if any(name == b"traceparent" for name, _ in scope["headers"]):
+            parent = propagate.extract({name.decode("latin-1"): value.decode("latin-1") for name, value in scope["headers"]})
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if span.is_recording():
+                    span.set_attribute("http.response.status_code", status_code)
+                    for name, value in message.get("headers", ()):
+                        if name == b"x-request-id":
+                            span.set_attribute("http.request.id", value.decode())
+            await send(message)
+
+        with tracer.start_as_current_span(
+            method, context=parent, kind=SpanKind.SERVER, record_exception=True
+        ) as span:
+            if span.is_recording():
+                span.set_attributes({"http.request.method": method, "url.path": scope["path"]})
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                self._finish(span, scope, status_code, start)
+
+    @staticmethod
+    def _finish(span: Span, scope: Scope, status_code: int, start: float) -> None:
+        # The router stores the matched route in the scope, unmatched paths are not grouped by path.
+        method = scope["method"]
+        route_path = getattr(scope.get("route"), "path", None) or ""
+        if span.is_recording():
+            span.update_name(f"{method} {route_path}".rstrip())
+            if route_path:
+                span.set_attribute("http.route", route_path)
+            if status_code >= 500:
+                span.set_status(Status(StatusCode.ERROR))
+        request_duration.record(
+            (time.perf_counter() - start) * 1000,
+            {"http.request.method": method, "http.route": route_path, "http.response.status_code": status_code}
+        )
@@ -1,8 +1,10 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 
 from container import service
+from route.export import ExportFormat, export_response
 from service.core import ListResponse
 from service.event import EventEntity, EventService, ProgramOverviewEntity
 
@@ -17,3 +19,18 @@ async def get_program_overview(
     event_service: EventService = event_service_dependency,
 ) -> list[ProgramOverviewEntity]:
     return await event_service.overview(event_id)
+
+
+@program_router.get("/{event_id}/program/overview/export", response_class=StreamingResponse)
+async def export_program_overview(
+    event_id: UUID,
+    format: ExportFormat = "ndjson",  # noqa: A002
+    chunk_size: int = Query(default=1000, ge=1, le=10000),
+    event_service: EventService = event_service_dependency,
+):
+    return export_response(
+        event_service.export_overview(event_id, chunk_size),
+        ProgramOverviewEntity,
+        format,
+        f"program-overview-{event_id}"
+    )
@@ -1,11 +1,14 @@
+from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Body, Depends, Query
 
 from container import service
-from service.programitem import CreateProgramItemEntity, ProgramItemEntity, ProgramItemService
+from route.response import FastJSONRoute
+from service.core import BATCH_MAX_ITEMS, BatchResponse, ListCriterion, ListOptions, ListResponse
+from service.programitem import CreateProgramItemEntity, ProgramItemEntity, ProgramItemSearchEntity, ProgramItemService, program_item_list_options
 
-programitem_router = APIRouter()
+programitem_router = APIRouter(route_class=FastJSONRoute)
 
 event_service_dependency = Depends(service(ProgramItemService))
 
@@ -13,9 +16,25 @@ event_service_dependency = Depends(service(ProgramItemService))
 @programitem_router.get("")
 async def list_program_items(
     event_id: UUID,
+    criterion: Annotated[ListCriterion, Query()],
     event_service: ProgramItemService = event_service_dependency,
-) -> list[ProgramItemEntity]:
-    return await event_service.list_program_items(event_id)
+) -> ListResponse[ProgramItemEntity]:
+    return await event_service.list_program_items(event_id, criterion)
+
+
+@programitem_router.get("/search")
+async def search_program_items(
+    event_id: UUID,
+    q: str = Query(min_length=1, max_length=255, description="Search string, words are matched as prefixes"),
+    limit: int = Query(default=20, ge=1, le=100),
+    event_service: ProgramItemService = event_service_dependency,
+) -> list[ProgramItemSearchEntity]:
+    return await event_service.search_program_items(event_id, q, limit)
+
+
+@programitem_router.get("/$options")
+async def get_program_item_list_options() -> ListOptions:
+    return program_item_list_options
 
 
 @programitem_router.post("")
@@ -25,3 +44,12 @@ async def create_program_item(
     event_service: ProgramItemService = event_service_dependency,
 ):
     return await event_service.create_program_item(event_id, program_item)
+
+
+@programitem_router.post("/$batch")
+async def create_program_items(
+    event_id: UUID,
+    program_items: Annotated[list[CreateProgramItemEntity], Body(min_length=1, max_length=BATCH_MAX_ITEMS)],
+    event_service: ProgramItemService = event_service_dependency,
+) -> BatchResponse[ProgramItemEntity]:
+    return await event_service.create_program_items(event_id, program_items)
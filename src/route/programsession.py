@@ -0,0 +1,45 @@
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Body, Depends
+
+from container import service
+from service.core import BATCH_MAX_ITEMS, BatchResponse
+from service.programsession import (
+    CreateProgramSessionEntity,
+    GeneratedSessionsEntity,
+    ProgramSessionEntity,
+    ProgramSessionService,
+    RecurrenceEntity,
+)
+
+programsession_router = APIRouter()
+
+programsession_service_dependency = Depends(service(ProgramSessionService))
+
+
+@programsession_router.post("")
+async def create_program_session(
+    event_id: UUID,
+    program_session: CreateProgramSessionEntity,
+    programsession_service: ProgramSessionService = programsession_service_dependency,
+) -> ProgramSessionEntity:
+    return await programsession_service.create_program_session(event_id, program_session)
+
+
+@programsession_router.post("/$batch")
+async def create_program_sessions(
+    event_id: UUID,
+    program_sessions: Annotated[list[CreateProgramSessionEntity], Body(min_length=1, max_length=BATCH_MAX_ITEMS)],
+    programsession_service: ProgramSessionService = programsession_service_dependency,
+) -> BatchResponse[ProgramSessionEntity]:
+    return await programsession_service.create_program_sessions(event_id, program_sessions)
+
+
+@programsession_router.post("/$generate")
+async def generate_program_sessions(
+    event_id: UUID,
+    recurrence: RecurrenceEntity,
+    programsession_service: ProgramSessionService = programsession_service_dependency,
+) -> GeneratedSessionsEntity:
+    return await programsession_service.generate_program_sessions(event_id, recurrence)
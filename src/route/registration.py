@@ -0,0 +1,30 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends
+
+from container import service
+from service.registration import CancellationEntity, CreateRegistrationEntity, RegistrationEntity, RegistrationService
+
+registration_router = APIRouter()
+
+registration_service_dependency = Depends(service(RegistrationService))
+
+
+@registration_router.post("")
+async def register_attendee(
+    event_id: UUID,
+    session_id: UUID,
+    registration: CreateRegistrationEntity,
+    registration_service: RegistrationService = registration_service_dependency,
+) -> RegistrationEntity:
+    return await registration_service.register(event_id, session_id, registration)
+
+
+@registration_router.delete("/{attendee_id}")
+async def cancel_registration(
+    event_id: UUID,
+    session_id: UUID,
+    attendee_id: UUID,
+    registration_service: RegistrationService = registration_service_dependency,
+) -> CancellationEntity:
+    return await registration_service.cancel(event_id, session_id, attendee_id)
@@ -0,0 +1,61 @@
+import functools
+import inspect
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from pydantic import TypeAdapter
+
+
+class FastJSONRoute(APIRoute):
+    """
+    Route serializing the endpoint's return value straight to JSON bytes with pydantic-core.
+
+    FastAPI validates a return value against the response model again, converts it with `jsonable_encoder`
+    and encodes it with the stdlib `json`. This route dumps it once through a `TypeAdapter` of the response
+    model instead, which is several times faster for large lists. The output is the same, the response
+    model's alias and exclude options are honored.
+
+    The return value is trusted, it must already be an instance of the response model (entities built by a
+    service are). Headers and status codes set on an injected `Response` parameter are lost, endpoints needing
+    them should return a `Response` themselves, which is passed through. Routes without a response model
+    behave as usual.
+
+    Opt in per router:
+        event_router = APIRouter(route_class=FastJSONRoute)
+    """
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        if self.response_model is not None and not getattr(self.dependant.call, "__fast_json__", False):
+            self.dependant.call = self._serializing(self.dependant.call)
+        return super().get_route_handler()
+
+    def _serializing(self, call: Callable[..., Any]) -> Callable[..., Any]:
+        adapter = TypeAdapter(self.response_model)
+        options = dict(
+            include=self.response_model_include,
+            exclude=self.response_model_exclude,
+            by_alias=self.response_model_by_alias,
+            exclude_unset=self.response_model_exclude_unset,
+            exclude_defaults=self.response_model_exclude_defaults,
+            exclude_none=self.response_model_exclude_none,
+        )
+        status_code = self.status_code or 200
+
+        def respond(content: Any) -> Response:
+            if isinstance(content, Response):
+                return content
+            return Response(adapter.dump_json(content, **options), status_code=status_code, media_type="application/json")
+
+        # FastAPI runs sync endpoints in a thread pool, the wrapper has to stay sync for them.
+        if inspect.iscoroutinefunction(call):
+            @functools.wraps(call)
+            async def endpoint(*args: Any, **kwargs: Any) -> Response:
+                return respond(await call(*args, **kwargs))
+        else:
+            @functools.wraps(call)
+            def endpoint(*args: Any, **kwargs: Any) -> Response:
+                return respond(call(*args, **kwargs))
+
+        endpoint.__fast_json__ = True  # type: ignore[attr-defined]
+        return endpoint
@@ -0,0 +1,28 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+
+from container import service
+from service.schedule import RegistrationConflictEntity, ScheduleConflictEntity, ScheduleService
+
+schedule_router = APIRouter()
+
+schedule_service_dependency = Depends(service(ScheduleService))
+
+
+@schedule_router.get("/conflicts")
+async def list_schedule_conflicts(
+    event_id: UUID,
+    schedule_service: ScheduleService = schedule_service_dependency,
+) -> list[ScheduleConflictEntity]:
+    return await schedule_service.list_conflicts(event_id)
+
+
+@schedule_router.get("/attendee/{attendee_id}/conflicts")
+async def check_registration_conflicts(
+    event_id: UUID,
+    attendee_id: UUID,
+    session_id: UUID = Query(description="The program session the attendee wants to register to"),
+    schedule_service: ScheduleService = schedule_service_dependency,
+) -> RegistrationConflictEntity:
+    return await schedule_service.check_registration(event_id, session_id, attendee_id)
@@ -0,0 +1,37 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends
+
+from container import service
+from service.solver import SolverApplyEntity, SolverJobEntity, SolverRequestEntity, SolverService
+
+solver_router = APIRouter()
+
+solver_service_dependency = Depends(service(SolverService))
+
+
+@solver_router.post("", status_code=202)
+async def start_solver_job(
+    event_id: UUID,
+    request: SolverRequestEntity,
+    solver_service: SolverService = solver_service_dependency,
+) -> SolverJobEntity:
+    return await solver_service.start_job(event_id, request)
+
+
+@solver_router.get("/{job_id}")
+async def get_solver_job(
+    event_id: UUID,
+    job_id: UUID,
+    solver_service: SolverService = solver_service_dependency,
+) -> SolverJobEntity:
+    return solver_service.get_job(event_id, job_id)
+
+
+@solver_router.post("/{job_id}/apply")
+async def apply_solver_job(
+    event_id: UUID,
+    job_id: UUID,
+    solver_service: SolverService = solver_service_dependency,
+) -> SolverApplyEntity:
+    return await solver_service.apply_job(event_id, job_id)
@@ -0,0 +1,6 @@
+from .entity import AttendeeEntity, AttendeeImportEntity
+from .exception import AttendeeImportException
+from .repository import AttendeeRepository
+from .service import AttendeeService
+
+__all__ = ["AttendeeRepository", "AttendeeService", "AttendeeEntity", "AttendeeImportEntity", "AttendeeImportException"]
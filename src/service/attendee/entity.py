@@ -0,0 +1,24 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class AttendeeEntity(BaseModel):
+    id_attendee: UUID
+    id_event: UUID
+    email: str
+    full_name: str | None = None
+    can_register_from: datetime | None = None
+    invite_email_sent: bool = False
+    registration_count: int = Field(default=0, description="Number of program sessions the attendee is registered to")
+    created_at: datetime | None = None
+
+
+class AttendeeImportEntity(BaseModel):
+    rows: int = Field(description="Number of data rows read from the file")
+    inserted: int = Field(description="Number of new attendees")
+    updated: int = Field(description="Number of existing attendees (matched by email) which were updated")
+    skipped: int = Field(description="Rows without an email and duplicate emails within the file")
+    elapsed: float = Field(description="Duration of the import in seconds")
+    rows_per_second: float = Field(description="Import throughput")
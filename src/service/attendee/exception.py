@@ -0,0 +1,2 @@
+class AttendeeImportException(Exception):
+    """Raised when an attendee import file cannot be processed."""
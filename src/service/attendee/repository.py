@@ -0,0 +1,130 @@
+from collections.abc import AsyncGenerator, AsyncIterable, Iterable, Sequence
+from datetime import datetime
+from typing import NamedTuple
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio.session import AsyncSession
+from sqlmodel import text
+
+from service.core import BaseRepository
+
+
+class UpsertResult(NamedTuple):
+    inserted: int
+    updated: int
+
+
+class AttendeeResult(NamedTuple):
+    id_attendee: UUID
+    id_event: UUID
+    email: str
+    full_name: str | None
+    can_register_from: datetime | None
+    invite_email_sent: bool
+    registration_count: int
+    created_at: datetime | None
+
+
+class AttendeeRepository(BaseRepository):
+    async def stream_attendees(
+        self,
+        event_id: UUID,
+        chunk_size: int = 1000,
+        *,
+        session: AsyncSession | None = None
+    ) -> AsyncGenerator[Sequence[AttendeeResult], None]:
+        """
+        Streams the attendees of an event ordered by email, in chunks read from a server-side cursor.
+
+        Args:
+            event_id (UUID): The unique identifier of the event.
+            chunk_size (int): Number of rows fetched from the cursor at once.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session is created.
+
+        Yields:
+            Sequence[AttendeeResult]: Chunks of at most `chunk_size` attendees.
+        """
+        async with self.ensure_session(session) as session:
+            result = await session.stream(text(
+                """
+                    SELECT
+                        a.id_attendee,
+                        a.id_event,
+                        a.email,
+                        a.full_name,
+                        a.can_register_from,
+                        a.invite_email_sent,
+                        (SELECT COUNT(*) FROM t_attendee_program_session aps WHERE aps.id_attendee = a.id_attendee) AS registration_count,
+                        a.created_at
+                    FROM
+                        t_attendee a
+                    WHERE
+                        a.id_event = :event_id
+                    ORDER BY a.email ASC
+                """
+            ), {"event_id": event_id}, execution_options={"yield_per": chunk_size})
+            async for partition in result.partitions():
+                yield [AttendeeResult(*row) for row in partition]
+
+    async def import_records(
+        self,
+        event_id: UUID,
+        records: Iterable[tuple[str, str | None]] | AsyncIterable[tuple[str, str | None]],
+        *,
+        session: AsyncSession | None = None
+    ) -> UpsertResult:
+        """
+        Bulk loads attendees of an event and upserts them by email.
+
+        The records are streamed through asyncpg `COPY` into a temporary staging table, which is then merged
+        into `t_attendee` with a single `INSERT ... ON CONFLICT` on the `uq_attendee_email` constraint. The
+        records are consumed lazily, so memory usage does not depend on the number of records. When an email
+        occurs more than once, the last occurrence wins.
+
+        Args:
+            event_id (UUID): The unique identifier of the event the attendees belong to.
+            records (Iterable[tuple[str, str | None]] | AsyncIterable[tuple[str, str | None]]): (email, full_name) tuples.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session is created.
+
+        Returns:
+            UpsertResult: Number of inserted and updated attendees.
+        """
+        async with self.ensure_session(session) as session:
+            await session.execute(text(
+                """
+                    CREATE TEMPORARY TABLE tmp_attendee_import (
+                        position BIGINT GENERATED ALWAYS AS IDENTITY,
+                        email VARCHAR(255) NOT NULL,
+                        full_name VARCHAR(255)
+                    ) ON COMMIT DROP
+                """
+            ))
+            connection = await session.connection()
+            raw_connection = await connection.get_raw_connection()
+            await raw_connection.driver_connection.copy_records_to_table(
+                "tmp_attendee_import",
+                records=records,
+                columns=["email", "full_name"]
+            )
+            result = await session.execute(text(
+                """
+                    WITH upserted AS (
+                        INSERT INTO t_attendee (id_attendee, id_event, email, full_name, invite_email_sent, created_at)
+                        SELECT DISTINCT ON (email)
+                            gen_random_uuid(), :event_id, email, full_name, false, NOW()
+                        FROM
+                            tmp_attendee_import
+                        ORDER BY email, position DESC
+                        ON CONFLICT ON CONSTRAINT uq_attendee_email DO UPDATE
+                        SET
+                            full_name = COALESCE(EXCLUDED.full_name, t_attendee.full_name),
+                            updated_at = NOW()
+                        RETURNING (xmax = 0) AS inserted
+                    )
+                    SELECT
+                        COUNT(*) FILTER (WHERE inserted) AS inserted,
+                        COUNT(*) FILTER (WHERE NOT inserted) AS updated
+                    FROM upserted
+                """
+            ), {"event_id": event_id})
+            return UpsertResult(*result.one())
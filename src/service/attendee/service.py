@@ -0,0 +1,153 @@
+import codecs
+import csv
+import io
+import logging
+import time
+from collections.abc import AsyncGenerator, AsyncIterable
+from typing import TYPE_CHECKING, BinaryIO
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio.session import AsyncSession
+
+from service.core import traced
+
+from .entity import AttendeeEntity, AttendeeImportEntity
+from .exception import AttendeeImportException
+
+if TYPE_CHECKING:
+    from .repository import AttendeeRepository
+
+logger = logging.getLogger("service.attendee")
+
+_CHUNK_SIZE = 64 * 1024
+
+
+async def _read_chunks(file: BinaryIO) -> AsyncGenerator[bytes, None]:
+    while chunk := file.read(_CHUNK_SIZE):
+        yield chunk
+
+
+def _complete_records_end(text: str) -> int:
+    # A line break ends a record unless it is inside a quoted field, i.e. after an odd number of quotes.
+    # Escaped quotes are doubled and do not change the parity.
+    end = text.rfind("\n")
+    while end >= 0 and text.count('"', 0, end) % 2:
+        end = text.rfind("\n", 0, end)
+    return end + 1
+
+
+async def _csv_rows(chunks: AsyncIterable[bytes]) -> AsyncGenerator[list[str], None]:
+    """Parses CSV rows as the chunks arrive, only complete records of the received text go to the csv module."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        end = _complete_records_end(pending)
+        if end:
+            for row in csv.reader(io.StringIO(pending[:end], newline="")):
+                yield row
+            pending = pending[end:]
+    pending += decoder.decode(b"", final=True)
+    for row in csv.reader(io.StringIO(pending, newline="")):
+        yield row
+
+
+@traced("service")
+class AttendeeService:
+    def __init__(self, repository: "AttendeeRepository"):
+        self.repository = repository
+
+    async def import_csv(
+        self,
+        event_id: UUID,
+        file: AsyncIterable[bytes] | BinaryIO,
+        *,
+        session: AsyncSession | None = None
+    ) -> AttendeeImportEntity:
+        """
+        Imports attendees of an event from a CSV file.
+
+        The file must have a header row with an `email` column, the `full_name` column is optional. Rows are
+        parsed chunk by chunk while they are being copied into the database, the file is never loaded into
+        memory as a whole and the event loop is not blocked for longer than one chunk takes to parse.
+        Existing attendees (same email within the event) are updated.
+
+        Args:
+            event_id (UUID): The unique identifier of the event the attendees belong to.
+            file (AsyncIterable[bytes] | BinaryIO): UTF-8 encoded CSV, as chunks (e.g. a request body stream) or a file opened in binary mode.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session will be created.
+
+        Returns:
+            AttendeeImportEntity: Row counts and throughput of the import.
+
+        Raises:
+            AttendeeImportException: If the file is not a CSV with an `email` column.
+        """
+        rows = _csv_rows(file if isinstance(file, AsyncIterable) else _read_chunks(file))
+        try:
+            header = await anext(rows, None)
+            if header is None or "email" not in header:
+                raise AttendeeImportException("The attendee import file must have a header row with an 'email' column")
+            email_index = header.index("email")
+            full_name_index = header.index("full_name") if "full_name" in header else None
+
+            counter = {"rows": 0, "blank": 0}
+
+            async def records() -> AsyncGenerator[tuple[str, str | None], None]:
+                async for row in rows:
+                    # Empty lines are no rows, as with csv.DictReader.
+                    if not row:
+                        continue
+                    counter["rows"] += 1
+                    email = row[email_index].strip() if email_index < len(row) else ""
+                    if not email:
+                        counter["blank"] += 1
+                        continue
+                    full_name = row[full_name_index].strip() if full_name_index is not None and full_name_index < len(row) else ""
+                    yield email, full_name or None
+
+            start = time.perf_counter()
+            async with self.repository.ensure_session(session) as session:
+                result = await self.repository.import_records(event_id, records(), session=session)
+            elapsed = time.perf_counter() - start
+        except (UnicodeDecodeError, csv.Error) as e:
+            raise AttendeeImportException(f"The attendee import file is not a valid UTF-8 CSV: {e}")
+        finally:
+            await rows.aclose()
+
+        imported = AttendeeImportEntity(
+            rows=counter["rows"],
+            inserted=result.inserted,
+            updated=result.updated,
+            skipped=counter["rows"] - result.inserted - result.updated,
+            elapsed=elapsed,
+            rows_per_second=counter["rows"] / elapsed if elapsed > 0 else 0.0
+        )
+        logger.info(
+            f"Imported attendees of event {event_id}: {imported.rows} rows, {imported.inserted} inserted, "
+            f"{imported.updated} updated, {imported.skipped} skipped, {imported.rows_per_second:.0f} rows/s"
+        )
+        return imported
+
+    async def export_attendees(self, event_id: UUID, chunk_size: int = 1000) -> AsyncGenerator[list[AttendeeEntity], None]:
+        """
+        Streams the attendee roster of an event in chunks, for exports of large events.
+
+        Args:
+            event_id (UUID): The unique identifier of the event.
+            chunk_size (int): Maximal number of entities per chunk.
+
+        Yields:
+            list[AttendeeEntity]: Chunks of attendees ordered by email.
+        """
+        async for rows in self.repository.stream_attendees(event_id, chunk_size):
+            yield [AttendeeEntity(
+                id_attendee=row.id_attendee,
+                id_event=row.id_event,
+                email=row.email,
+                full_name=row.full_name,
+                can_register_from=row.can_register_from,
+                invite_email_sent=row.invite_email_sent,
+                registration_count=row.registration_count,
+                created_at=row.created_at
+            ) for row in rows]
@@ -0,0 +1,5 @@
+from .exception import CalendarNotFoundException
+from .repository import CalendarRepository
+from .service import CalendarFeed, CalendarService
+
+__all__ = ["CalendarRepository", "CalendarService", "CalendarFeed", "CalendarNotFoundException"]
@@ -0,0 +1,6 @@
+from uuid import UUID
+
+
+class CalendarNotFoundException(Exception):
+    def __init__(self, kind: str, id: UUID) -> None:
+        super().__init__(f"No calendar for {kind} {id} in this event")
@@ -0,0 +1,93 @@
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from typing import NamedTuple
+from uuid import UUID
+
+PRODUCT_ID = "-//RZB//Eventually//CS"
+MAX_LINE_OCTETS = 75
+
+
+class CalendarEvent(NamedTuple):
+    uid: UUID
+    start: datetime
+    end: datetime
+    summary: str
+    description: str | None = None
+    location: str | None = None
+    cancelled: bool = False
+
+
+def escape_text(value: str) -> str:
+    """Escapes a TEXT property value (RFC 5545, section 3.3.11)."""
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+        .replace("\r", "\\n")
+    )
+
+
+def fold_line(line: str) -> str:
+    """Folds a content line into chunks of at most 75 octets without splitting UTF-8 characters (RFC 5545, section 3.1)."""
+    if len(line.encode()) <= MAX_LINE_OCTETS:
+        return line
+    chunks = []
+    current, size, limit = [], 0, MAX_LINE_OCTETS
+    for char in line:
+        char_size = len(char.encode())
+        if size + char_size > limit:
+            chunks.append("".join(current))
+            # Continuation lines start with a space which counts into the limit.
+            current, size, limit = [], 0, MAX_LINE_OCTETS - 1
+        current.append(char)
+        size += char_size
+    chunks.append("".join(current))
+    return "\r\n ".join(chunks)
+
+
+def _datetime(value: datetime) -> str:
+    # Session times are stored without a time zone, they are written as floating local times.
+    return value.strftime("%Y%m%dT%H%M%S")
+
+
+def render_calendar(name: str, events: Iterable[CalendarEvent], *, stamp: datetime) -> str:
+    """
+    Renders a VCALENDAR with one VEVENT per event.
+
+    Args:
+        name (str): Calendar name shown by clients (X-WR-CALNAME).
+        events (Iterable[CalendarEvent]): The events.
+        stamp (datetime): Value of DTSTAMP, the time the calendar was rendered (time zone aware).
+
+    Returns:
+        str: The calendar with CRLF line endings and folded lines.
+    """
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{PRODUCT_ID}",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{escape_text(name)}",
+    ]
+    for event in events:
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:{event.uid}",
+            f"DTSTAMP:{_datetime(stamp.astimezone(UTC))}Z",
+            f"DTSTART:{_datetime(event.start)}",
+            f"DTEND:{_datetime(event.end)}",
+            f"SUMMARY:{escape_text(event.summary)}",
+        ]
+        if event.description:
+            lines.append(f"DESCRIPTION:{escape_text(event.description)}")
+        if event.location:
+            lines.append(f"LOCATION:{escape_text(event.location)}")
+        lines += [
+            f"STATUS:{'CANCELLED' if event.cancelled else 'CONFIRMED'}",
+            "END:VEVENT",
+        ]
+    lines.append("END:VCALENDAR")
+    return "".join(f"{fold_line(line)}\r\n" for line in lines)
@@ -0,0 +1,116 @@
+from collections.abc import Sequence
+from datetime import datetime
+from typing import NamedTuple
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio.session import AsyncSession
+from sqlmodel import text
+
+from service.core import BaseRepository
+
+CALENDAR_SESSION_QUERY = """
+    SELECT
+        ps.id_program_session,
+        ps.start_time,
+        COALESCE(ps.end_time, ps.start_time + pi.required_time) AS end_time,
+        pi.name,
+        concat_ws(E'\\n\\n', pi.description, ps.note) AS description,
+        l.name AS location,
+        ps.status = 'CANCELLED' AS cancelled
+    FROM
+        t_program_session ps
+    JOIN
+        t_program_item pi USING (id_program_item)
+    LEFT JOIN
+        t_location l ON l.id_location = COALESCE(ps.id_location_override, pi.id_location)
+"""
+
+
+class CalendarRevisionResult(NamedTuple):
+    name: str
+    revision: str
+
+
+class CalendarSessionResult(NamedTuple):
+    id_program_session: UUID
+    start_time: datetime
+    end_time: datetime
+    name: str
+    description: str | None
+    location: str | None
+    cancelled: bool
+
+
+class CalendarRepository(BaseRepository):
+    async def event_revision(self, event_id: UUID, *, session: AsyncSession | None = None) -> CalendarRevisionResult | None:
+        """Returns the name and calendar revision of an event, or None if it does not exist."""
+        async with self.ensure_session(session) as session:
+            result = await session.execute(text(
+                "SELECT name, CAST(calendar_revision AS text) FROM t_event WHERE id_event = :event_id"
+            ), {"event_id": event_id})
+            row = result.first()
+            return CalendarRevisionResult(*row) if row else None
+
+    async def location_revision(self, event_id: UUID, id_location: UUID, *, session: AsyncSession | None = None) -> CalendarRevisionResult | None:
+        """Returns the name of a location and the calendar revision of its event, or None if it does not exist in the event."""
+        async with self.ensure_session(session) as session:
+            result = await session.execute(text(
+                """
+                    SELECT e.name || ' - ' || l.name, CAST(e.calendar_revision AS text)
+                    FROM t_location l JOIN t_event e USING (id_event)
+                    WHERE l.id_location = :id_location AND l.id_event = :event_id
+                """
+            ), {"event_id": event_id, "id_location": id_location})
+            row = result.first()
+            return CalendarRevisionResult(*row) if row else None
+
+    async def attendee_revision(self, event_id: UUID, id_attendee: UUID, *, session: AsyncSession | None = None) -> CalendarRevisionResult | None:
+        """Returns the event name and the combined event and attendee calendar revision, or None if the attendee does not exist in the event."""
+        async with self.ensure_session(session) as session:
+            result = await session.execute(text(
+                """
+                    SELECT e.name, e.calendar_revision || '.' || a.calendar_revision
+                    FROM t_attendee a JOIN t_event e USING (id_event)
+                    WHERE a.id_attendee = :id_attendee AND a.id_event = :event_id
+                """
+            ), {"event_id": event_id, "id_attendee": id_attendee})
+            row = result.first()
+            return CalendarRevisionResult(*row) if row else None
+
+    async def event_sessions(self, event_id: UUID, *, session: AsyncSession | None = None) -> Sequence[CalendarSessionResult]:
+        """Lists the non-draft sessions of an event ordered by start time."""
+        async with self.ensure_session(session) as session:
+            result = await session.execute(text(
+                f"""
+                    {CALENDAR_SESSION_QUERY}
+                    WHERE pi.id_event = :event_id AND ps.status <> 'DRAFT'
+                    ORDER BY ps.start_time
+                """
+            ), {"event_id": event_id})
+            return [CalendarSessionResult(*row) for row in result.all()]
+
+    async def location_sessions(self, event_id: UUID, id_location: UUID, *, session: AsyncSession | None = None) -> Sequence[CalendarSessionResult]:
+        """Lists the non-draft sessions taking place in a location ordered by start time."""
+        async with self.ensure_session(session) as session:
+            result = await session.execute(text(
+                f"""
+                    {CALENDAR_SESSION_QUERY}
+                    WHERE pi.id_event = :event_id AND ps.id_location_effective = :id_location AND ps.status <> 'DRAFT'
+                    ORDER BY ps.start_time
+                """
+            ), {"event_id": event_id, "id_location": id_location})
+            return [CalendarSessionResult(*row) for row in result.all()]
+
+    async def attendee_sessions(self, event_id: UUID, id_attendee: UUID, *, session: AsyncSession | None = None) -> Sequence[CalendarSessionResult]:
+        """Lists the non-draft sessions an attendee is registered to ordered by start time."""
+        async with self.ensure_session(session) as session:
+            result = await session.execute(text(
+                f"""
+                    {CALENDAR_SESSION_QUERY}
+                    JOIN
+                        t_attendee_program_session aps ON aps.id_program_session = ps.id_program_session AND aps.id_attendee = :id_attendee
+                    WHERE pi.id_event = :event_id AND ps.status <> 'DRAFT'
+                    ORDER BY ps.start_time
+                """
+            ), {"event_id": event_id, "id_attendee": id_attendee})
+            return [CalendarSessionResult(*row) for row in result.all()]
@@ -0,0 +1,159 @@
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Sequence
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, NamedTuple
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio.session import AsyncSession
+
+from service.core import traced
+
+from .exception import CalendarNotFoundException
+from .ical import CalendarEvent, render_calendar
+
+if TYPE_CHECKING:
+    from .repository import CalendarRepository, CalendarRevisionResult, CalendarSessionResult
+
+
+class CalendarFeed(NamedTuple):
+    etag: str
+    # The rendered calendar, None when the client's copy is current.
+    body: bytes | None
+
+
+@traced("service")
+class CalendarService:
+    """
+    Serves iCalendar feeds of events, locations and attendees.
+
+    Every feed is versioned by revision counters which triggers bump whenever a session, program item or
+    location of the event (or a registration of the attendee) changes. The ETag is derived from the
+    revision, so a poll costs one primary key lookup: a matching `If-None-Match` is answered right away
+    and otherwise the feed rendered for that revision is served from memory. Only the first poll after a
+    change queries the sessions and renders the feed again.
+    """
+    max_cached_feeds = 1024
+
+    def __init__(self, repository: "CalendarRepository"):
+        self.repository = repository
+        self._feeds: OrderedDict[str, CalendarFeed] = OrderedDict()
+
+    async def event_feed(self, event_id: UUID, if_none_match: str | None = None) -> CalendarFeed:
+        """
+        Returns the calendar of the non-draft sessions of an event.
+
+        Args:
+            event_id (UUID): The unique identifier of the event.
+            if_none_match (str | None): The `If-None-Match` header of the request, if any.
+
+        Returns:
+            CalendarFeed: The ETag of the current revision and the rendered calendar, without a body when the client's copy is current.
+
+        Raises:
+            CalendarNotFoundException: If the event does not exist.
+        """
+        return await self._feed(
+            "event",
+            event_id,
+            lambda session: self.repository.event_revision(event_id, session=session),
+            lambda session: self.repository.event_sessions(event_id, session=session),
+            if_none_match
+        )
+
+    async def location_feed(self, event_id: UUID, id_location: UUID, if_none_match: str | None = None) -> CalendarFeed:
+        """
+        Returns the calendar of the non-draft sessions of an event taking place at a location.
+
+        Args:
+            event_id (UUID): The unique identifier of the event.
+            id_location (UUID): The unique identifier of the location.
+            if_none_match (str | None): The `If-None-Match` header of the request, if any.
+
+        Returns:
+            CalendarFeed: The ETag of the current revision and the rendered calendar, without a body when the client's copy is current.
+
+        Raises:
+            CalendarNotFoundException: If the location does not exist in the event.
+        """
+        return await self._feed(
+            "location",
+            id_location,
+            lambda session: self.repository.location_revision(event_id, id_location, session=session),
+            lambda session: self.repository.location_sessions(event_id, id_location, session=session),
+            if_none_match
+        )
+
+    async def attendee_feed(self, event_id: UUID, id_attendee: UUID, if_none_match: str | None = None) -> CalendarFeed:
+        """
+        Returns the personal calendar of the non-draft sessions an attendee of an event is registered to.
+
+        Args:
+            event_id (UUID): The unique identifier of the event.
+            id_attendee (UUID): The unique identifier of the attendee.
+            if_none_match (str | None): The `If-None-Match` header of the request, if any.
+
+        Returns:
+            CalendarFeed: The ETag of the current revision and the rendered calendar, without a body when the client's copy is current.
+
+        Raises:
+            CalendarNotFoundException: If the attendee does not exist in the event.
+        """
+        return await self._feed(
+            "attendee",
+            id_attendee,
+            lambda session: self.repository.attendee_revision(event_id, id_attendee, session=session),
+            lambda session: self.repository.attendee_sessions(event_id, id_attendee, session=session),
+            if_none_match
+        )
+
+    async def _feed(
+        self,
+        kind: str,
+        id: UUID,
+        revision: Callable[[AsyncSession], Awaitable["CalendarRevisionResult | None"]],
+        sessions: Callable[[AsyncSession], Awaitable[Sequence["CalendarSessionResult"]]],
+        if_none_match: str | None
+    ) -> CalendarFeed:
+        # Both reads share a session, so on GET requests they go to the same replica, one after the other.
+        async with self.repository.ensure_session() as session:
+            current = await revision(session)
+            if current is None:
+                raise CalendarNotFoundException(kind, id)
+            key = f"{kind}-{id}"
+            etag = f'"{key}-{current.revision}"'
+            if if_none_match is not None:
+                tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+                if etag in tags or "*" in tags:
+                    return CalendarFeed(etag, None)
+
+            cached = self._feeds.get(key)
+            if cached is not None and cached.etag == etag:
+                self._feeds.move_to_end(key)
+                return cached
+
+            # The revision is read before the sessions: a change committed in between makes this feed newer
+            # than its ETag, never older, and the next poll renders it again under the new revision.
+            rows = await sessions(session)
+
+        body = render_calendar(
+            current.name,
+            (
+                CalendarEvent(
+                    uid=row.id_program_session,
+                    start=row.start_time,
+                    end=row.end_time,
+                    summary=row.name,
+                    description=row.description,
+                    location=row.location,
+                    cancelled=row.cancelled
+                )
+                for row in rows
+            ),
+            stamp=datetime.now(UTC)
+        ).encode()
+        feed = CalendarFeed(etag, body)
+        self._feeds[key] = feed
+        self._feeds.move_to_end(key)
+        while len(self._feeds) > self.max_cached_feeds:
+            self._feeds.popitem(last=False)
+        return feed
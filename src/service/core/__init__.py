@@ -1,20 +1,60 @@
-from .entity import ErrorEntity, FilterDefinition, ListCriterion, ListOptionField, ListOptions, ListResponse
-from .model import AttendeeModel, AttendeeProgramSessionModel, EventModel, EventStatus, LocationModel, ProgramItemModel, ProgramSessionModel, ProgramType, SessionStatus, UserModel, create_db
-from .repository import BaseRepository
+from .cache import CacheBackend, MemoryCache, RedisCache, create_cache
+from .entity import BATCH_MAX_ITEMS, BatchFailureEntity, BatchResponse, ErrorEntity, FilterDefinition, ListCriterion, ListOptionField, ListOptions, ListResponse
+from .exception import InvalidListCriterionException, is_exclusion_violation
+from .listing import ListResult
+from .model import (
+    AttendeeModel,
+    AttendeeProgramSessionModel,
+    EventModel,
+    EventStatus,
+    LocationModel,
+    ProgramItemModel,
+    ProgramSessionModel,
+    ProgramSessionWaitlistModel,
+    ProgramType,
+    SessionStatus,
+    UserModel,
+    create_db,
+)
+from .pool import InstrumentedAsyncPool
+from .replica import Replica, ReplicaRouter, read_intent
+from .repository import BaseRepository, cached
+from .service import singleflight
+from .telemetry import configure_telemetry, instrument_engine, traced
 
 __all__ = [
     "create_db",
     "ErrorEntity",
     "ListCriterion",
     "ListResponse",
+    "BATCH_MAX_ITEMS",
+    "BatchFailureEntity",
+    "BatchResponse",
+    "ListResult",
+    "InvalidListCriterionException",
+    "is_exclusion_violation",
     "FilterDefinition",
     "ListOptionField",
     "ListOptions",
     "ProgramItemModel",
     "ProgramSessionModel",
+    "ProgramSessionWaitlistModel",
     "UserModel",
     "EventModel",
     "BaseRepository",
+    "cached",
+    "CacheBackend",
+    "MemoryCache",
+    "RedisCache",
+    "create_cache",
+    "singleflight",
+    "configure_telemetry",
+    "instrument_engine",
+    "traced",
+    "InstrumentedAsyncPool",
+    "Replica",
+    "ReplicaRouter",
+    "read_intent",
     "EventStatus",
     "SessionStatus",
     "AttendeeModel",
@@ -0,0 +1,102 @@
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+logger = logging.getLogger("service.core.cache")
+
+
+class CacheBackend(ABC):
+    """Key-value store for cached repository reads, values are serialized bytes."""
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        """Returns the value stored under the key, None if it is missing or expired."""
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Stores the value under the key for `ttl` seconds."""
+
+    @abstractmethod
+    async def version(self, tag: str) -> int:
+        """Returns the current version of an invalidation tag, 0 if it was never invalidated."""
+
+    @abstractmethod
+    async def invalidate(self, tag: str) -> None:
+        """Bumps the version of an invalidation tag, which orphans every entry stored under the old version."""
+
+
+class MemoryCache(CacheBackend):
+    """
+    In-process TTL and LRU cache, used when Redis is not configured.
+
+    Tag versions never expire and do not count into `max_entries`, there is one per event at most.
+    """
+
+    def __init__(self, max_entries: int = 4096) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._versions: dict[str, int] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        """Returns the value stored under the key and marks it as recently used, None if it is missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Stores the value under the key for `ttl` seconds, evicting the least recently used entries over `max_entries`."""
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def version(self, tag: str) -> int:
+        """Returns the current version of an invalidation tag, 0 if it was never invalidated."""
+        return self._versions.get(tag, 0)
+
+    async def invalidate(self, tag: str) -> None:
+        """Bumps the version of an invalidation tag, entries under the old version are evicted as they age out."""
+        self._versions[tag] = self._versions.get(tag, 0) + 1
+
+
+class RedisCache(CacheBackend):
+    """Cache shared by all application instances, stored in the Redis configured by `REDIS_OM_URL`."""
+
+    def __init__(self, url: str, prefix: str = "rzbportal:cache:") -> None:
+        from aredis_om import get_redis_connection
+
+        self._redis = get_redis_connection(url=url, decode_responses=False)
+        self._prefix = prefix
+
+    async def get(self, key: str) -> bytes | None:
+        """Returns the value stored under the prefixed key, None if it is missing or expired."""
+        return await self._redis.get(self._prefix + key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Stores the value under the prefixed key, Redis expires it after `ttl` seconds."""
+        await self._redis.set(self._prefix + key, value, px=int(ttl * 1000))
+
+    async def version(self, tag: str) -> int:
+        """Returns the current version of an invalidation tag, 0 if it was never invalidated."""
+        value = await self._redis.get(f"{self._prefix}tag:{tag}")
+        return int(value) if value is not None else 0
+
+    async def invalidate(self, tag: str) -> None:
+        """Atomically bumps the version of an invalidation tag, shared by all application instances."""
+        await self._redis.incr(f"{self._prefix}tag:{tag}")
+
+
+def create_cache(redis_url: str | None, max_entries: int = 4096) -> CacheBackend:
+    """Returns a Redis backed cache when a URL is configured, an in-process one otherwise."""
+    if redis_url:
+        logger.info("Using Redis cache backend")
+        return RedisCache(redis_url)
+    logger.info("Redis is not configured, using in-process cache backend")
+    return MemoryCache(max_entries)
@@ -24,6 +24,10 @@ class ListCriterion(BaseModel):
         default=None,
         description="Filter to apply to the list. Must be a valid JSON string.",
     )
+    cursor: str | None = Field(
+        default=None,
+        description="Cursor of the next page returned by the previous response. Enables keyset pagination, offset is ignored.",
+    )
 
 
 class ListResponse[DataType](BaseModel):
@@ -35,11 +39,39 @@ class ListResponse[DataType](BaseModel):
         limit (int): The maximum number of items per page.
         offset (int): The starting index of the current page.
         total (int): The total number of items available.
+        next_cursor (str | None): Cursor of the next page for keyset pagination, None on the last page.
     """
     data: Sequence[DataType] = Field(description="List of items")
     limit: int = Field(description="Page size")
     offset: int = Field(description="Page number")
     total: int = Field(description="Total number of items")
+    next_cursor: str | None = Field(default=None, description="Pass as cursor to get the next page")
+
+
+# Upper bound of items in one batch request, keeps a batch within one reasonably short transaction.
+BATCH_MAX_ITEMS = 1000
+
+
+class BatchFailureEntity(BaseModel):
+    index: int = Field(description="Position of the failed item in the request")
+    code: str = Field(description="Application error code, the same as the single item endpoint would return")
+    message: str
+
+    @classmethod
+    def from_exception(cls, index: int, code: str, exception: Exception) -> "BatchFailureEntity":
+        return cls(index=index, code=code, message=str(exception))
+
+
+class BatchResponse[DataType](BaseModel):
+    """
+    Result of a batch create, every item of the request is either created or failed.
+
+    Attributes:
+        created (list[DataType]): The created items in the order of the request.
+        failed (list[BatchFailureEntity]): The items which were not created, with the reason.
+    """
+    created: list[DataType] = Field(description="Created items in the order of the request")
+    failed: list[BatchFailureEntity] = Field(default_factory=list, description="Items which were not created")
 
 
 class FilterDefinition(BaseModel):
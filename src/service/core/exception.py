@@ -0,0 +1,12 @@
+from sqlalchemy.exc import IntegrityError
+
+# SQLSTATE of a violated exclusion constraint, e.g. the location double-booking constraint of t_program_session.
+EXCLUSION_VIOLATION = "23P01"
+
+
+def is_exclusion_violation(error: IntegrityError) -> bool:
+    return getattr(error.orig, "sqlstate", None) == EXCLUSION_VIOLATION
+
+
+class InvalidListCriterionException(ValueError):
+    """Raised when a list criterion sorts or filters by a field which is not allowed, or is malformed."""
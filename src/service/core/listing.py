@@ -0,0 +1,263 @@
+import base64
+import binascii
+import enum
+import json
+import logging
+import re
+from collections.abc import Sequence
+from typing import Any, NamedTuple
+
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import to_jsonable_python
+from sqlalchemy import Column, ColumnElement, Enum, and_, false, func, inspect, literal_column, or_, select, true
+from sqlalchemy.sql import Select
+from sqlmodel import SQLModel
+
+from .entity import ListCriterion, ListOptions
+from .exception import InvalidListCriterionException
+
+logger = logging.getLogger("service.core.listing")
+
+
+class ListResult[ModelType](NamedTuple):
+    items: Sequence[ModelType]
+    total: int
+    next_cursor: str | None
+
+
+def _column(model: type[SQLModel], field: str) -> Column:
+    column = model.__table__.columns.get(field)  # type: ignore[attr-defined]
+    if column is None:
+        raise InvalidListCriterionException(f"Field '{field}' does not exist")
+    return column
+
+
+def _coerce(column: Column, value: Any) -> Any:
+    """Converts a JSON value from the client to the python type of the column, asyncpg does not cast strings."""
+    if value is None:
+        return None
+    if isinstance(column.type, Enum) and column.type.enum_class is not None:
+        enum_class: type[enum.Enum] = column.type.enum_class
+        try:
+            return enum_class(value)
+        except ValueError:
+            try:
+                return enum_class[value]
+            except KeyError:
+                raise InvalidListCriterionException(f"Invalid value '{value}' for field '{column.name}'")
+    try:
+        return TypeAdapter(column.type.python_type).validate_python(value)
+    except (ValidationError, NotImplementedError) as e:
+        raise InvalidListCriterionException(f"Invalid value '{value}' for field '{column.name}': {e}")
+
+
+def prefix_tsquery(search: str) -> str | None:
+    """
+    Turns user input into a `to_tsquery` expression matching all words as prefixes.
+
+    Every word is matched as a prefix (`word:*`) so that the query works for search-as-you-type. Only word
+    characters are kept, which makes the result safe to pass to `to_tsquery`.
+
+    Args:
+        search (str): The raw search string.
+
+    Returns:
+        str | None: The tsquery expression, or None if the input has no words.
+    """
+    words = re.findall(r"\w+", search.lower())
+    if not words:
+        return None
+    return " & ".join(f"{word}:*" for word in words)
+
+
+def search_vector(model: type[SQLModel]) -> ColumnElement | None:
+    """Returns the generated tsvector column of a model declaring `__search_vector__`, or None."""
+    name = getattr(model, "__search_vector__", None)
+    if name is None:
+        return None
+    return literal_column(f"{model.__tablename__}.{name}")
+
+
+def _fts_condition(model: type[SQLModel], column: Column, value: Any) -> ColumnElement[bool]:
+    vector = search_vector(model)
+    if vector is not None:
+        query = prefix_tsquery(str(value))
+        if query is None:
+            return true()
+        return vector.op("@@")(func.to_tsquery("simple", query))
+    escaped = str(value).replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return column.ilike(f"%{escaped}%", escape="\\")
+
+
+def filter_conditions(model: type[SQLModel], criterion: ListCriterion, options: ListOptions) -> list[ColumnElement[bool]]:
+    """
+    Translates the JSON filter of a list criterion into SQL conditions.
+
+    The filter is a JSON object keyed by field name. Only fields declared as filterable in `options` are
+    accepted, the value format depends on the filter type:
+        - "select": a single value, or a list of values for multiselect filters.
+        - "date_range": an object with optional "from" and "to" keys (both inclusive).
+        - "fts": a search string. Matched against the model's generated tsvector column when the model
+          declares `__search_vector__` (the column then only selects which filter is used), otherwise
+          a case-insensitive substring match of the column.
+
+    Args:
+        model (type[SQLModel]): The listed model.
+        criterion (ListCriterion): The list criterion from the request.
+        options (ListOptions): The list options whitelisting the filterable fields.
+
+    Returns:
+        list[ColumnElement[bool]]: Conditions to be combined with AND.
+
+    Raises:
+        InvalidListCriterionException: If the filter is not valid JSON or uses a field which is not filterable.
+    """
+    if not criterion.filter:
+        return []
+    try:
+        filters = json.loads(criterion.filter)
+    except json.JSONDecodeError as e:
+        raise InvalidListCriterionException(f"Filter is not a valid JSON: {e}")
+    if not isinstance(filters, dict):
+        raise InvalidListCriterionException("Filter must be a JSON object keyed by field name")
+
+    conditions = []
+    for field, value in filters.items():
+        option = options.fields.get(field)
+        if option is None or option.filterable is None:
+            raise InvalidListCriterionException(f"Field '{field}' is not filterable")
+        column = _column(model, field)
+        match option.filterable.type:
+            case "select" if isinstance(value, list):
+                if not option.filterable.is_multiselect:
+                    raise InvalidListCriterionException(f"Field '{field}' does not accept multiple values")
+                conditions.append(column.in_([_coerce(column, v) for v in value]) if value else false())
+            case "select":
+                conditions.append(column == _coerce(column, value))
+            case "date_range":
+                if not isinstance(value, dict):
+                    raise InvalidListCriterionException(f"Field '{field}' expects an object with 'from' and/or 'to'")
+                if value.get("from") is not None:
+                    conditions.append(column >= _coerce(column, value["from"]))
+                if value.get("to") is not None:
+                    conditions.append(column <= _coerce(column, value["to"]))
+            case "fts":
+                conditions.append(_fts_condition(model, column, value))
+    return conditions
+
+
+def sort_column(model: type[SQLModel], criterion: ListCriterion, options: ListOptions) -> Column | None:
+    """
+    Returns the column to sort by, the sort field must be declared sortable in `options`.
+
+    Raises:
+        InvalidListCriterionException: If the sort field is not sortable.
+    """
+    if criterion.sort_field is None:
+        return None
+    option = options.fields.get(criterion.sort_field)
+    if option is None or not option.is_sortable:
+        raise InvalidListCriterionException(f"Field '{criterion.sort_field}' is not sortable")
+    return _column(model, criterion.sort_field)
+
+
+def encode_cursor(sort_value: Any, primary_key: Any) -> str:
+    payload = json.dumps(to_jsonable_python([sort_value, primary_key]), separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str, sort: Column | None, primary_key: Column) -> tuple[Any, Any]:
+    try:
+        sort_value, primary_key_value = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise InvalidListCriterionException("Invalid cursor")
+    return (
+        _coerce(sort, sort_value) if sort is not None else None,
+        _coerce(primary_key, primary_key_value)
+    )
+
+
+def keyset_condition(sort: Column | None, primary_key: Column, descending: bool, sort_value: Any, primary_key_value: Any) -> ColumnElement[bool]:
+    """
+    Builds the "rows after the cursor" condition for ordering by (sort NULLS LAST, primary key).
+
+    Args:
+        sort (Column | None): The sort column, None when ordering by the primary key only.
+        primary_key (Column): The primary key column used as a tie breaker.
+        descending (bool): Sort direction.
+        sort_value (Any): Sort column value of the last row of the previous page.
+        primary_key_value (Any): Primary key of the last row of the previous page.
+
+    Returns:
+        ColumnElement[bool]: The condition.
+    """
+    after_primary_key = primary_key < primary_key_value if descending else primary_key > primary_key_value
+    if sort is None:
+        return after_primary_key
+    if sort_value is None:
+        return and_(sort.is_(None), after_primary_key)
+    after_sort = sort < sort_value if descending else sort > sort_value
+    return or_(after_sort, and_(sort == sort_value, after_primary_key), sort.is_(None))
+
+
+def list_statement(
+    model: type[SQLModel],
+    criterion: ListCriterion,
+    options: ListOptions,
+    where: Sequence[ColumnElement[bool]] = (),
+    columns: Sequence[ColumnElement] | None = None,
+) -> tuple[Select, Select, Column | None, Column]:
+    """
+    Builds the page query of the generic list engine and the count query of all rows matching the filter.
+
+    The total number of matching rows is selected as a second column in the same query, computed with
+    `COUNT(*) OVER ()` for offset pagination or with a scalar subquery over the filtered rows for keyset
+    pagination (the window would only count the rows after the cursor there). One more row than `limit`
+    is fetched to find out whether a next page exists.
+
+    With explicit `columns`, only those are selected instead of the model (plain rows, no ORM instances),
+    plus the sort and primary key columns labeled `cursor_sort` and `cursor_primary_key` for the next cursor.
+
+    An empty page carries no total, the separate count query (the same conditions without the cursor,
+    ordering and limit) is then needed, e.g. past the last page or when nothing matches the filter.
+
+    Args:
+        model (type[SQLModel]): The listed model, must have a single column primary key.
+        criterion (ListCriterion): The list criterion from the request.
+        options (ListOptions): The list options whitelisting sortable and filterable fields.
+        where (Sequence[ColumnElement[bool]]): Additional conditions, e.g. the owning event.
+        columns (Sequence[ColumnElement] | None): Columns or labeled expressions to select instead of the model.
+
+    Returns:
+        tuple[Select, Select, Column | None, Column]: The statement, the count statement, the sort column and the primary key column.
+    """
+    primary_key = inspect(model).primary_key[0]
+    sort = sort_column(model, criterion, options)
+    descending = criterion.sort_direction == "desc"
+    conditions = [*where, *filter_conditions(model, criterion, options)]
+
+    order_by = []
+    if sort is not None:
+        order_by.append((sort.desc() if descending else sort.asc()).nulls_last())
+    order_by.append(primary_key.desc() if descending else primary_key.asc())
+
+    selected: list[Any] = [model]
+    if columns is not None:
+        selected = [*columns, primary_key.label("cursor_primary_key")]
+        if sort is not None:
+            selected.append(sort.label("cursor_sort"))
+
+    count = select(func.count()).select_from(model).where(*conditions)
+    if criterion.cursor:
+        total = count.correlate(None).scalar_subquery()
+        conditions.append(keyset_condition(sort, primary_key, descending, *decode_cursor(criterion.cursor, sort, primary_key)))
+        statement = select(*selected, total.label("total")).where(*conditions).order_by(*order_by).limit(criterion.limit + 1)
+    else:
+        statement = (
+            select(*selected, func.count().over().label("total"))
+            .where(*conditions)
+            .order_by(*order_by)
+            .offset(criterion.offset)
+            .limit(criterion.limit + 1)
+        )
+    return statement, count, sort, primary_key
@@ -1,9 +1,10 @@
 import enum
 from datetime import date as date_type
 from datetime import datetime, timedelta
+from typing import ClassVar
 from uuid import UUID, uuid4
 
-from sqlalchemy import CheckConstraint, UniqueConstraint
+from sqlalchemy import DDL, BigInteger, CheckConstraint, Column, Identity, Index, UniqueConstraint, event
 from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION
 from sqlmodel import DateTime, Field, SQLModel, text
 
@@ -79,13 +80,18 @@ class UserModel(LifecycleMixin, table=True):
 class AttendeeModel(LifecycleMixin, table=True):
     __tablename__ = "t_attendee" # pyright: ignore[reportAssignmentType]
     id_attendee: UUID = Field(default_factory=uuid4, primary_key=True)
-    id_event: UUID = Field(foreign_key="t_event.id_event", nullable=False)
+    id_event: UUID = Field(foreign_key="t_event.id_event", nullable=False, index=True)
     email: str = Field(max_length=255, nullable=False)
     full_name: str | None = Field(max_length=255, nullable=True)
 
     can_register_from: datetime | None = Field(default=None)
     access_token: str | None = Field(default=None, max_length=255)
     invite_email_sent: bool = Field(default=False)
+    calendar_revision: int = Field(
+        default=0,
+        sa_column_kwargs={"server_default": text("0")},
+        description="Bumped whenever the attendee's registrations change, maintained by the t_attendee_program_session trigger"
+    )
 
     __table_args__ = (
         UniqueConstraint("email", "id_event", name="uq_attendee_email"),
@@ -94,11 +100,11 @@ class AttendeeModel(LifecycleMixin, table=True):
 class LocationModel(LifecycleMixin, table=True):
     __tablename__ = "t_location"  # pyright: ignore[reportAssignmentType]
     id_location: UUID = Field(default_factory=uuid4, primary_key=True)
-    id_event: UUID= Field(foreign_key="t_event.id_event", nullable=False)
+    id_event: UUID= Field(foreign_key="t_event.id_event", nullable=False, index=True)
     name: str = Field(max_length=255, nullable=False)
     lat: float | None = Field(default=None, sa_type=DOUBLE_PRECISION)
     lon: float | None = Field(default=None, sa_type=DOUBLE_PRECISION)
-    color: str = Field(regex=r"^#[0-9A-Fa-f]{6}$", le=7)
+    color: str = Field(regex=r"^#[0-9A-Fa-f]{6}$", max_length=7)
 
 class EventModel(LifecycleMixin, table=True):
     __tablename__ = "t_event" # pyright: ignore[reportAssignmentType]
@@ -107,7 +113,12 @@ class EventModel(LifecycleMixin, table=True):
     description: str | None = Field(default=None, max_length=1024)
     start_date: date_type = Field()
     end_date: date_type = Field()
-    status: EventStatus = Field(default=EventStatus.DRAFT)
+    status: EventStatus = Field(default=EventStatus.DRAFT, index=True)
+    calendar_revision: int = Field(
+        default=0,
+        sa_column_kwargs={"server_default": text("0")},
+        description="Bumped whenever a session, program item or location of the event changes, maintained by triggers"
+    )
 
     __table_args__ = (
         CheckConstraint("start_date <= end_date", name="check_event_start_before_end"),
@@ -116,8 +127,8 @@ class EventModel(LifecycleMixin, table=True):
 
 class ProgramItemModel(LifecycleMixin, table=True):
     __tablename__ = "t_program_item" # pyright: ignore[reportAssignmentType]
-    id_program_item: UUID = Field(default=None, primary_key=True)
-    id_event: UUID = Field(foreign_key="t_event.id_event", nullable=False)
+    id_program_item: UUID = Field(default_factory=uuid4, primary_key=True)
+    id_event: UUID = Field(foreign_key="t_event.id_event", nullable=False, index=True)
     id_location: UUID = Field(default=None, foreign_key="t_location.id_location", nullable=True)
     name: str = Field(max_length=255, nullable=False)
     description: str | None = Field(default=None, max_length=1024)
@@ -128,6 +139,9 @@ class ProgramItemModel(LifecycleMixin, table=True):
     before_time_buffer: timedelta = Field(default=timedelta(minutes=10))
     after_time_buffer: timedelta = Field(default=timedelta(minutes=10))
 
+    # Generated tsvector column (see the DDL below), not mapped so that ORM loads stay lean.
+    __search_vector__: ClassVar[str] = "search_vector"
+
 
 class ProgramSessionModel(LifecycleMixin, table=True):
     __tablename__ = "t_program_session"  # pyright: ignore[reportAssignmentType]
@@ -139,6 +153,18 @@ class ProgramSessionModel(LifecycleMixin, table=True):
     note: str | None = Field(default=None, max_length=1024)
     status: SessionStatus = Field(default=SessionStatus.DRAFT)
     attendee_limit_override: int | None = Field(default=None, nullable=True)
+    attendee_count: int = Field(
+        default=0,
+        sa_column_kwargs={"server_default": text("0")},
+        description="Number of attendees registered for the session, maintained by the t_attendee_program_session trigger"
+    )
+
+    __table_args__ = (
+        Index("index_t_program_session_id_program_item_start_time", "id_program_item", "start_time"),
+    )
+
+    # id_location_effective and blocked_range are maintained by triggers for the location double-booking
+    # exclusion constraint (see the DDL below), not mapped as they are derived from the program item.
 
 
 class AttendeeProgramSessionModel(SQLModel, table=True):
@@ -148,14 +174,304 @@ class AttendeeProgramSessionModel(SQLModel, table=True):
         nullable=False,
         primary_key=True
     )
+    id_program_session: UUID | None = Field(
+        foreign_key="t_program_session.id_program_session",
+        nullable=False,
+        primary_key=True,
+        index=True
+    )
+    created_at: datetime | None = Field(default_factory=default_datetime_tz, sa_type=DateTime)
+    note: str | None = Field(default=None, max_length=1024)
+
+
+class ProgramSessionWaitlistModel(SQLModel, table=True):
+    __tablename__ = "t_program_session_waitlist"  # pyright: ignore[reportAssignmentType]
+    id_attendee: UUID | None = Field(
+        foreign_key="t_attendee.id_attendee",
+        nullable=False,
+        primary_key=True
+    )
     id_program_session: UUID | None = Field(
         foreign_key="t_program_session.id_program_session",
         nullable=False,
         primary_key=True
     )
+    position: int | None = Field(
+        default=None,
+        sa_column=Column(BigInteger, Identity(), nullable=False),
+        description="Queue position, lower is earlier. Positions are increasing but not contiguous."
+    )
     created_at: datetime | None = Field(default_factory=default_datetime_tz, sa_type=DateTime)
     note: str | None = Field(default=None, max_length=1024)
 
+    __table_args__ = (
+        Index("index_t_program_session_waitlist_queue", "id_program_session", "position", unique=True),
+    )
+
+
+# Keeps t_program_session.attendee_count in sync with t_attendee_program_session, no matter
+# which code path (ORM, raw SQL, COPY) writes the registrations.
+event.listen(
+    AttendeeProgramSessionModel.__table__,
+    "after_create",
+    DDL(
+        """
+            CREATE OR REPLACE FUNCTION f_attendee_program_session_count() RETURNS trigger AS $$
+            BEGIN
+                IF TG_OP IN ('DELETE', 'UPDATE') THEN
+                    UPDATE t_program_session SET attendee_count = attendee_count - 1
+                    WHERE id_program_session = OLD.id_program_session;
+                END IF;
+                IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                    UPDATE t_program_session SET attendee_count = attendee_count + 1
+                    WHERE id_program_session = NEW.id_program_session;
+                END IF;
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql
+        """
+    )
+)
+event.listen(
+    AttendeeProgramSessionModel.__table__,
+    "after_create",
+    DDL(
+        """
+            CREATE TRIGGER tr_attendee_program_session_count
+            AFTER INSERT OR DELETE OR UPDATE OF id_program_session ON t_attendee_program_session
+            FOR EACH ROW EXECUTE FUNCTION f_attendee_program_session_count()
+        """
+    )
+)
+
+# Full-text search over program items: a generated tsvector (name weighted above description)
+# backed by a GIN index. The 'simple' configuration is used as the content is mostly Czech,
+# which has no built-in PostgreSQL dictionary.
+event.listen(
+    ProgramItemModel.__table__,
+    "after_create",
+    DDL(
+        """
+            ALTER TABLE t_program_item ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+                setweight(to_tsvector('simple', coalesce(name, '')), 'A')
+                || setweight(to_tsvector('simple', coalesce(description, '')), 'B')
+            ) STORED
+        """
+    )
+)
+event.listen(
+    ProgramItemModel.__table__,
+    "after_create",
+    DDL("CREATE INDEX index_t_program_item_search_vector ON t_program_item USING gin (search_vector)")
+)
+
+# Location double-booking prevention. A session occupies its effective location (the override or the
+# item's location) from start - before_time_buffer until end + after_time_buffer. Both are copied onto
+# the session by triggers so that a GiST exclusion constraint can reject overlapping sessions with a
+# single index probe. Cancelled sessions and sessions without a location never conflict.
+event.listen(
+    ProgramSessionModel.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS btree_gist")
+)
+event.listen(
+    ProgramSessionModel.__table__,
+    "after_create",
+    DDL("ALTER TABLE t_program_session ADD COLUMN id_location_effective uuid, ADD COLUMN blocked_range tsrange")
+)
+event.listen(
+    ProgramSessionModel.__table__,
+    "after_create",
+    DDL(
+        """
+            CREATE OR REPLACE FUNCTION f_program_session_blocked_range() RETURNS trigger AS $$
+            BEGIN
+                SELECT
+                    COALESCE(NEW.id_location_override, pi.id_location),
+                    tsrange(
+                        NEW.start_time - pi.before_time_buffer,
+                        COALESCE(NEW.end_time, NEW.start_time + pi.required_time) + pi.after_time_buffer
+                    )
+                INTO NEW.id_location_effective, NEW.blocked_range
+                FROM t_program_item pi
+                WHERE pi.id_program_item = NEW.id_program_item;
+                RETURN NEW;
+            END;
+            $$ LANGUAGE plpgsql
+        """
+    )
+)
+event.listen(
+    ProgramSessionModel.__table__,
+    "after_create",
+    DDL(
+        """
+            CREATE TRIGGER tr_program_session_blocked_range
+            BEFORE INSERT OR UPDATE OF id_program_item, id_location_override, start_time, end_time ON t_program_session
+            FOR EACH ROW EXECUTE FUNCTION f_program_session_blocked_range()
+        """
+    )
+)
+# Changing the item's location or times recomputes its sessions, assigning id_program_item to itself
+# is enough to fire the trigger above.
+event.listen(
+    ProgramSessionModel.__table__,
+    "after_create",
+    DDL(
+        """
+            CREATE OR REPLACE FUNCTION f_program_item_blocked_range() RETURNS trigger AS $$
+            BEGIN
+                UPDATE t_program_session SET id_program_item = id_program_item
+                WHERE id_program_item = NEW.id_program_item;
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql
+        """
+    )
+)
+event.listen(
+    ProgramSessionModel.__table__,
+    "after_create",
+    DDL(
+        """
+            CREATE TRIGGER tr_program_item_blocked_range
+            AFTER UPDATE OF id_location, required_time, before_time_buffer, after_time_buffer ON t_program_item
+            FOR EACH ROW EXECUTE FUNCTION f_program_item_blocked_range()
+        """
+    )
+)
+event.listen(
+    ProgramSessionModel.__table__,
+    "after_create",
+    DDL(
+        """
+            ALTER TABLE t_program_session ADD CONSTRAINT exclude_t_program_session_location_overlap
+            EXCLUDE USING gist (id_location_effective WITH =, blocked_range WITH &&)
+            WHERE (status <> 'CANCELLED')
+        """
+    )
+)
+
+# Calendar feed revisions. Any change of what a calendar shows bumps t_event.calendar_revision, registration
+# changes bump t_attendee.calendar_revision, so feeds can be cached and revalidated by the revision alone.
+# The column lists keep the frequent attendee_count updates from touching the event row.
+event.listen(
+    ProgramSessionModel.__table__,
+    "after_create",
+    DDL(
+        """
+            CREATE OR REPLACE FUNCTION f_event_calendar_revision() RETURNS trigger AS $$
+            DECLARE
+                row_event UUID;
+            BEGIN
+                IF TG_TABLE_NAME = 't_program_session' THEN
+                    SELECT id_event INTO row_event FROM t_program_item
+                    WHERE id_program_item = COALESCE(NEW.id_program_item, OLD.id_program_item);
+                ELSIF TG_OP = 'DELETE' THEN
+                    row_event := OLD.id_event;
+                ELSE
+                    row_event := NEW.id_event;
+                END IF;
+                UPDATE t_event SET calendar_revision = calendar_revision + 1 WHERE id_event = row_event;
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql
+        """
+    )
+)
+event.listen(
+    ProgramSessionModel.__table__,
+    "after_create",
+    DDL(
+        """
+            CREATE TRIGGER tr_program_session_calendar_revision
+            AFTER INSERT OR DELETE OR UPDATE OF id_program_item, id_location_override, start_time, end_time, note, status
+            ON t_program_session
+            FOR EACH ROW EXECUTE FUNCTION f_event_calendar_revision()
+        """
+    )
+)
+event.listen(
+    ProgramSessionModel.__table__,
+    "after_create",
+    DDL(
+        """
+            CREATE TRIGGER tr_program_item_calendar_revision
+            AFTER INSERT OR DELETE OR UPDATE OF name, description, type, id_location, required_time ON t_program_item
+            FOR EACH ROW EXECUTE FUNCTION f_event_calendar_revision()
+        """
+    )
+)
+event.listen(
+    ProgramSessionModel.__table__,
+    "after_create",
+    DDL(
+        """
+            CREATE TRIGGER tr_location_calendar_revision
+            AFTER INSERT OR DELETE OR UPDATE OF name, lat, lon ON t_location
+            FOR EACH ROW EXECUTE FUNCTION f_event_calendar_revision()
+        """
+    )
+)
+# The event name is the calendar name (X-WR-CALNAME) of all feeds of the event.
+event.listen(
+    EventModel.__table__,
+    "after_create",
+    DDL(
+        """
+            CREATE OR REPLACE FUNCTION f_event_name_calendar_revision() RETURNS trigger AS $$
+            BEGIN
+                IF NEW.name IS DISTINCT FROM OLD.name THEN
+                    NEW.calendar_revision := OLD.calendar_revision + 1;
+                END IF;
+                RETURN NEW;
+            END;
+            $$ LANGUAGE plpgsql
+        """
+    )
+)
+event.listen(
+    EventModel.__table__,
+    "after_create",
+    DDL(
+        """
+            CREATE TRIGGER tr_event_name_calendar_revision
+            BEFORE UPDATE OF name ON t_event
+            FOR EACH ROW EXECUTE FUNCTION f_event_name_calendar_revision()
+        """
+    )
+)
+event.listen(
+    AttendeeProgramSessionModel.__table__,
+    "after_create",
+    DDL(
+        """
+            CREATE OR REPLACE FUNCTION f_attendee_calendar_revision() RETURNS trigger AS $$
+            BEGIN
+                IF TG_OP IN ('DELETE', 'UPDATE') THEN
+                    UPDATE t_attendee SET calendar_revision = calendar_revision + 1 WHERE id_attendee = OLD.id_attendee;
+                END IF;
+                IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                    UPDATE t_attendee SET calendar_revision = calendar_revision + 1 WHERE id_attendee = NEW.id_attendee;
+                END IF;
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql
+        """
+    )
+)
+event.listen(
+    AttendeeProgramSessionModel.__table__,
+    "after_create",
+    DDL(
+        """
+            CREATE TRIGGER tr_attendee_calendar_revision
+            AFTER INSERT OR DELETE OR UPDATE ON t_attendee_program_session
+            FOR EACH ROW EXECUTE FUNCTION f_attendee_calendar_revision()
+        """
+    )
+)
+
 
 from sqlalchemy.ext.asyncio.engine import AsyncEngine  # noqa: E402
 
@@ -177,4 +493,5 @@ async def create_db(engine: AsyncEngine):
         await conn.execute(text("DROP TABLE IF EXISTS t_program_item CASCADE;"))
         await conn.execute(text("DROP TABLE IF EXISTS t_program_session CASCADE;"))
         await conn.execute(text("DROP TABLE IF EXISTS t_attendee_program_session CASCADE;"))
+        await conn.execute(text("DROP TABLE IF EXISTS t_program_session_waitlist CASCADE;"))
         await conn.run_sync(SQLModel.metadata.create_all)
@@ -0,0 +1,64 @@
+import time
+import weakref
+from collections.abc import Iterable
+
+from opentelemetry.metrics import CallbackOptions, Observation
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+from .repository import meter
+
+_pools: "weakref.WeakSet[InstrumentedAsyncPool]" = weakref.WeakSet()
+
+checkout_wait = meter.create_histogram(
+    "db.pool.checkout.wait", unit="ms", description="Time spent waiting for a connection from the pool, including connecting"
+)
+checkout_timeouts = meter.create_counter("db.pool.checkout.timeouts", description="Checkouts which gave up after the pool timeout")
+
+
+def _observe_in_use(options: CallbackOptions) -> Iterable[Observation]:
+    return [Observation(pool.checkedout(), pool.attributes) for pool in list(_pools)]
+
+
+def _observe_overflow(options: CallbackOptions) -> Iterable[Observation]:
+    # QueuePool counts overflow from -pool_size, it is only positive once the pool is exhausted.
+    return [Observation(max(0, pool.overflow()), pool.attributes) for pool in list(_pools)]
+
+
+meter.create_observable_gauge(
+    "db.pool.connections.in_use", callbacks=[_observe_in_use], description="Connections checked out of the pool"
+)
+meter.create_observable_gauge(
+    "db.pool.connections.overflow", callbacks=[_observe_overflow], description="Connections open beyond the pool size"
+)
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """
+    Async queue pool publishing checkout wait time, connections in use and overflow as OpenTelemetry metrics.
+
+    Pass it as `poolclass` to `create_async_engine`. Metrics are tagged with the engine's `pool_logging_name`,
+    so pools of several engines can be told apart. Pools recreated by `engine.dispose()` keep reporting.
+
+    Example:
+        engine = create_async_engine(url, poolclass=InstrumentedAsyncPool, pool_logging_name="primary")
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.attributes = {"db.pool.name": self._orig_logging_name or "default"}
+        _pools.add(self)
+
+    def dispose(self) -> None:
+        super().dispose()
+        _pools.discard(self)
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            checkout_timeouts.add(1, self.attributes)
+            raise
+        finally:
+            checkout_wait.record((time.perf_counter() - start) * 1000, self.attributes)
@@ -0,0 +1,90 @@
+import asyncio
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+logger = logging.getLogger("rzbportal.replica")
+
+# Set for requests which only read (GET routes), `BaseRepository.ensure_session` then prefers a replica.
+read_intent: ContextVar[bool] = ContextVar("read_intent", default=False)
+# Set once the current request committed a write, its further reads stay on the primary (read-your-writes).
+wrote: ContextVar[bool] = ContextVar("wrote", default=False)
+
+
+@dataclass(slots=True)
+class Replica:
+    name: str
+    engine: AsyncEngine
+    sessionmaker: async_sessionmaker[AsyncSession]
+    healthy: bool = True
+    # A replica marked down by a failed connection is skipped until then, even if it looks healthy.
+    down_until: float = 0.0
+
+
+class ReplicaRouter:
+    """
+    Round-robin over read replicas, skipping replicas which failed their health check or a connection attempt.
+
+    Health is checked by a background task started in `post_spinup` (run by the container on startup).
+    `pick` returns None when there is no usable replica, callers fall back to the primary.
+    """
+
+    def __init__(self, replicas: list[Replica], *, health_check_interval: float = 5.0) -> None:
+        """
+        Args:
+            replicas (list[Replica]): The replicas, may be empty.
+            health_check_interval (float): Seconds between health checks, also the cooldown of a replica marked down.
+        """
+        self.replicas = replicas
+        self.health_check_interval = health_check_interval
+        self._next = 0
+        self._task: asyncio.Task | None = None
+
+    def pick(self) -> Replica | None:
+        """Returns the next usable replica in round-robin order, or None if there is none."""
+        now = time.monotonic()
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[self._next % len(self.replicas)]
+            self._next += 1
+            if replica.healthy and replica.down_until <= now:
+                return replica
+        return None
+
+    def mark_down(self, replica: Replica) -> None:
+        """Takes a replica out of rotation for one health check interval, e.g. after a failed connection."""
+        logger.warning(f"Replica {replica.name} failed, routing reads elsewhere for {self.health_check_interval} s")
+        replica.down_until = time.monotonic() + self.health_check_interval
+
+    async def check_health(self) -> None:
+        """Checks every replica with `SELECT 1`, bounded by the health check interval."""
+        for replica in self.replicas:
+            try:
+                async with asyncio.timeout(self.health_check_interval), replica.engine.connect() as connection:
+                    await connection.execute(text("SELECT 1"))
+                healthy = True
+            except Exception:
+                healthy = False
+            if healthy != replica.healthy:
+                logger.warning(f"Replica {replica.name} is {'healthy' if healthy else 'unhealthy'}")
+            replica.healthy = healthy
+
+    async def post_spinup(self) -> None:
+        if self.replicas and self._task is None:
+            self._task = asyncio.create_task(self._watch())
+
+    async def close(self) -> None:
+        """Stops the health checks and disposes the replica engines."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    async def _watch(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            await self.check_health()
@@ -1,19 +1,126 @@
+import functools
+import inspect
+import json
 import logging
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable, Callable, Sequence
 from contextlib import asynccontextmanager
-from typing import Any
+from typing import Any, get_args, get_origin, get_type_hints
 
 from opentelemetry import metrics, trace
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+from sqlalchemy import ColumnElement
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from sqlmodel import SQLModel
 
+from di import FutureService
+
+from .cache import CacheBackend
+from .entity import ListCriterion, ListOptions
+from .listing import ListResult, encode_cursor, list_statement
+from .replica import Replica, ReplicaRouter, read_intent, wrote
+from .telemetry import traced
+
 logger = logging.getLogger("rzbportal.repository")
 tracer = trace.get_tracer("rzbportal.repository.tracer")
 meter = metrics.get_meter("rzbportal.repository.meter")
 
+cache_hits = meter.create_counter("repository.cache.hits", description="Repository reads answered from the cache")
+cache_misses = meter.create_counter("repository.cache.misses", description="Repository reads which had to query the database")
+
+
+def _is_table(hint: Any) -> bool:
+    return isinstance(hint, type) and issubclass(hint, SQLModel) and hasattr(hint, "__table__")
+
+
+def _row_to_dict(value: Any) -> Any:
+    if isinstance(value, RowMapping):
+        return dict(value)
+    raise TypeError(type(value))
+
+
+def _loader(hint: Any) -> Callable[[bytes], Any]:
+    # Table models skip validation when built through a TypeAdapter, they have to go through model_validate.
+    origin, args = get_origin(hint), get_args(hint)
+    if origin in (list, Sequence) and len(args) == 1 and _is_table(args[0]):
+        model = args[0]
+        return lambda data: [model.model_validate(item) for item in json.loads(data)]
+    if _is_table(hint):
+        return lambda data: hint.model_validate(json.loads(data))
+    if origin is ListResult and args == (RowMapping,):
+        # Rows come back as plain dicts, the services validate them into entities either way.
+        return TypeAdapter(ListResult[dict[str, Any]]).validate_json
+    return TypeAdapter(hint).validate_json
+
+
+def cached[**P, R](namespace: str, *, ttl: float = 60, tag: str | None = None) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """
+    Caches the result of a repository read method in the repository's cache backend.
+
+    The key is made of the namespace and the call arguments. Results are serialized to JSON and validated
+    back into the annotated return type. When `tag` names an argument (typically `event_id`), the entry
+    is stored under the current version of that argument's value, so `BaseRepository.invalidate(event_id)`
+    drops every cached read of the event at once.
+
+    The cache is bypassed when the caller passes its own `session` (it may read its own uncommitted
+    writes) and when the repository has no cache backend, e.g. in tests. A miss is always read from the
+    primary, a lagging replica would store rows older than the invalidation under the new version.
+
+    Args:
+        namespace (str): Unique name of the cached method.
+        ttl (float): Seconds an entry lives.
+        tag (str | None): Name of the argument whose value is the invalidation key.
+
+    Example:
+        @cached("event.locations", ttl=300, tag="event_id")
+        async def list_locations(self, event_id: UUID, criterion: ListCriterion, *, session: AsyncSession | None = None) -> ListResult[RowMapping]:
+            ...
+    """
+    def decorator(fn: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        signature = inspect.signature(fn)
+        attributes = {"namespace": namespace}
+        load: Callable[[bytes], Any] | None = None
+
+        @functools.wraps(fn)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            nonlocal load
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = bound.arguments
+            cache = getattr(arguments["self"], "cache", None)
+            if not isinstance(cache, CacheBackend) or arguments.get("session") is not None:
+                return await fn(*args, **kwargs)
+
+            key_arguments = ",".join(f"{name}={value}" for name, value in arguments.items() if name not in ("self", "session"))
+            version = await cache.version(str(arguments[tag])) if tag else 0
+            key = f"{namespace}:{version}:{key_arguments}"
+            if load is None:
+                load = _loader(get_type_hints(fn)["return"])
+
+            data = await cache.get(key)
+            if data is not None:
+                cache_hits.add(1, attributes)
+                return load(data)
+            cache_misses.add(1, attributes)
+            async with arguments["self"]._sessionmaker() as session:
+                arguments["session"] = session
+                result = await fn(*bound.args, **bound.kwargs)
+            await cache.set(key, to_json(result, fallback=_row_to_dict), ttl)
+            return result
+
+        return wrapper
+    return decorator
+
 
 class BaseRepository:
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        # Every repository method gets a span and a latency histogram, see `traced`.
+        super().__init_subclass__(**kwargs)
+        traced("repository")(cls)
+
     def __init__(self, sessionmaker: async_sessionmaker[AsyncSession]) -> None:
         """
         Initializes the repository with a sessionmaker.
@@ -22,9 +129,28 @@ class BaseRepository:
             sessionmaker (async_sessionmaker[AsyncSession]): The sessionmaker to be used for creating database sessions.
         """
         self._sessionmaker = sessionmaker
+        # Injected by the container, repositories created outside of it (tests, scripts) do not cache.
+        self.cache: CacheBackend | FutureService = FutureService(CacheBackend)
+        self.replicas: ReplicaRouter | FutureService = FutureService(ReplicaRouter)
+
+    async def invalidate(self, *tags: Any) -> None:
+        """
+        Drops every cached read tagged with one of the given values, see `cached`.
+
+        Call it after the transaction which changed the data has committed, otherwise a concurrent read
+        could cache the old data again under the new version. Services therefore invalidate only after
+        transactions they own, a caller passing its own session to a writing service method has to
+        invalidate after its commit.
+
+        Args:
+            *tags (Any): Tag values, typically event ids.
+        """
+        if isinstance(self.cache, CacheBackend):
+            for tag in tags:
+                await self.cache.invalidate(str(tag))
 
     @asynccontextmanager
-    async def ensure_session(self, session: AsyncSession | None = None) -> AsyncGenerator[AsyncSession, Any]:
+    async def ensure_session(self, session: AsyncSession | None = None, read_only: bool | None = None) -> AsyncGenerator[AsyncSession, Any]:
         """
         Ensures that an asynchronous session is available for database operations.
 
@@ -32,8 +158,13 @@ class BaseRepository:
         using the sessionmaker, begins a transaction, and yields the new session. The session is committed
         if no exceptions occur, otherwise it is rolled back.
 
+        Read-only sessions go to a read replica when replicas are configured and healthy, falling back to the
+        primary. By default a session is read-only within GET requests (see `read_intent`), unless the request
+        has already written, then it stays on the primary to read its own writes.
+
         Args:
             session (AsyncSession | None): An optional existing session to use.
+            read_only (bool | None): Whether the session only reads, None to follow the request's intent.
 
         Yields:
             AsyncGenerator[AsyncSession, Any]: An asynchronous generator yielding the session.
@@ -50,17 +181,64 @@ class BaseRepository:
         """
         if session is not None:
             yield session
-        else:
-            async with self._sessionmaker(expire_on_commit=True) as session, session.begin():
-                with tracer.start_as_current_span("database_session"):
-                    try:
-                        yield session
-                        if session.in_transaction():
-                            logger.debug("Transaction already commited")
-                            await session.commit()
-                    except Exception:
-                        await session.rollback()
-                        raise
+            return
+
+        if read_only is None:
+            read_only = read_intent.get()
+        sessionmaker = await self._route(read_only)
+
+        async with sessionmaker(expire_on_commit=True) as session, session.begin():
+            with tracer.start_as_current_span("database_session"):
+                try:
+                    yield session
+                    if session.in_transaction():
+                        logger.debug("Transaction already commited")
+                        await session.commit()
+                except Exception:
+                    await session.rollback()
+                    raise
+        if not read_only:
+            wrote.set(True)
+
+    @asynccontextmanager
+    async def read_session(self, session: AsyncSession | None = None) -> AsyncGenerator[AsyncSession, Any]:
+        """
+        Provides a session for a read-only query, cheaper than `ensure_session`.
+
+        The session runs in autocommit mode, so no BEGIN and COMMIT round trips are made, and it is routed
+        to a replica like any read-only session. Meant for single statement reads returning plain rows,
+        several statements are not guaranteed to see the same snapshot.
+
+        Args:
+            session (AsyncSession | None): An optional existing session to use instead.
+
+        Yields:
+            AsyncGenerator[AsyncSession, Any]: An asynchronous generator yielding the session.
+        """
+        if session is not None:
+            yield session
+            return
+        async with (await self._route(True))() as session:
+            with tracer.start_as_current_span("database_read_session"):
+                await session.connection(execution_options={"isolation_level": "AUTOCOMMIT"})
+                yield session
+
+    async def _route(self, read_only: bool) -> async_sessionmaker[AsyncSession]:
+        if read_only and not wrote.get() and isinstance(self.replicas, ReplicaRouter):
+            replica = self.replicas.pick()
+            if replica is not None:
+                return await self._connectable(replica)
+        return self._sessionmaker
+
+    async def _connectable(self, replica: Replica) -> async_sessionmaker[AsyncSession]:
+        # Connect before handing out the session, a failure can then still fall back to the primary.
+        try:
+            async with replica.engine.connect():
+                pass
+        except (DBAPIError, OSError):
+            self.replicas.mark_down(replica)  # type: ignore[union-attr]
+            return self._sessionmaker
+        return replica.sessionmaker
 
     async def create(self, model: SQLModel, session: AsyncSession | None = None):
         """
@@ -74,3 +252,97 @@ class BaseRepository:
         async with self.ensure_session(session) as session:
             session.add(model)
             return model
+
+    async def paginate[ModelType: SQLModel](
+        self,
+        model: type[ModelType],
+        criterion: ListCriterion,
+        options: ListOptions,
+        *where: ColumnElement[bool],
+        session: AsyncSession | None = None
+    ) -> ListResult[ModelType]:
+        """
+        Lists instances of any model according to a list criterion, sorting, filtering and paginating in SQL.
+
+        Only fields declared in `options` as sortable or filterable may be used, anything else raises
+        `InvalidListCriterionException`. Offset pagination is used unless the criterion carries a cursor,
+        which switches to keyset pagination (constant cost for deep pages). The total count is fetched in
+        the same round trip as the page.
+
+        Args:
+            model (type[ModelType]): The model to list, must have a single column primary key.
+            criterion (ListCriterion): The list criterion from the request.
+            options (ListOptions): The list options whitelisting sortable and filterable fields.
+            *where (ColumnElement[bool]): Additional conditions, e.g. the owning event.
+            session (AsyncSession | None, optional): An existing asynchronous database session.
+                If None, a new session is created and managed internally.
+
+        Returns:
+            ListResult[ModelType]: The page, the total count and the cursor of the next page (None on the last page).
+
+        Raises:
+            InvalidListCriterionException: If the criterion is not allowed by the options or is malformed.
+        """
+        statement, count, sort, primary_key = list_statement(model, criterion, options, where)
+        async with self.ensure_session(session) as session:
+            rows = (await session.execute(statement)).all()
+            if rows:
+                total = rows[0].total
+            else:
+                # The total has no row to ride on, past the last page or when nothing matches the filter.
+                total = (await session.execute(count)).scalar_one()
+
+        items = [row[0] for row in rows[:criterion.limit]]
+        next_cursor = None
+        if len(rows) > criterion.limit:
+            last = items[-1]
+            next_cursor = encode_cursor(
+                getattr(last, sort.key) if sort is not None else None,
+                getattr(last, primary_key.key)
+            )
+        return ListResult(items=items, total=total, next_cursor=next_cursor)
+
+    async def paginate_rows(
+        self,
+        model: type[SQLModel],
+        columns: Sequence[ColumnElement],
+        criterion: ListCriterion,
+        options: ListOptions,
+        *where: ColumnElement[bool],
+        session: AsyncSession | None = None
+    ) -> ListResult[RowMapping]:
+        """
+        Lists rows of any model like `paginate`, but selects only the given columns and returns plain row mappings.
+
+        No ORM instances are built and the query runs in a `read_session`, which makes it the cheap path for
+        list endpoints. The mappings can be validated into entities at once, e.g. with a `TypeAdapter`.
+
+        Args:
+            model (type[SQLModel]): The model to list, must have a single column primary key.
+            columns (Sequence[ColumnElement]): Columns or labeled expressions to select, keyed by their names in the mappings.
+            criterion (ListCriterion): The list criterion from the request.
+            options (ListOptions): The list options whitelisting sortable and filterable fields.
+            *where (ColumnElement[bool]): Additional conditions, e.g. the owning event.
+            session (AsyncSession | None, optional): An existing asynchronous database session.
+                If None, a read session is created and managed internally.
+
+        Returns:
+            ListResult[RowMapping]: The page, the total count and the cursor of the next page (None on the last page).
+
+        Raises:
+            InvalidListCriterionException: If the criterion is not allowed by the options or is malformed.
+        """
+        statement, count, sort, _ = list_statement(model, criterion, options, where, columns)
+        async with self.read_session(session) as session:
+            rows = (await session.execute(statement)).mappings().all()
+            if rows:
+                total = rows[0]["total"]
+            else:
+                total = (await session.execute(count)).scalar_one()
+
+        items = rows[:criterion.limit]
+        next_cursor = None
+        if len(rows) > criterion.limit:
+            last = items[-1]
+            next_cursor = encode_cursor(last["cursor_sort"] if sort is not None else None, last["cursor_primary_key"])
+        return ListResult(items=items, total=total, next_cursor=next_cursor)
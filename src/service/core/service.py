@@ -0,0 +1,78 @@
+import asyncio
+import functools
+import inspect
+import logging
+import time
+from collections.abc import Awaitable, Callable, Hashable
+
+from opentelemetry import metrics
+
+logger = logging.getLogger("rzbportal.service")
+meter = metrics.get_meter("rzbportal.service.meter")
+
+single_flight_shared = meter.create_counter(
+    "service.single_flight.shared", description="Service calls answered by an identical call already in flight or just finished"
+)
+
+
+def singleflight[**P, R](*, window: float = 0.0) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """
+    Coalesces concurrent identical calls of a service method into a single execution.
+
+    Calls with the same instance and arguments share one in-flight task and all of them receive its result
+    (or exception). With a `window`, a successful result keeps being shared for that many seconds after the
+    task finished, which flattens bursts of requests arriving right after each other. Failures are never shared
+    beyond the callers already waiting.
+
+    The result object is shared between callers, they must not mutate it. Calls passing their own `session`
+    always run on their own, they may depend on uncommitted writes of that session. Arguments must be hashable.
+
+    Args:
+        window (float): Seconds a finished result is still handed out to new callers, 0 to only share in-flight calls.
+
+    Example:
+        @singleflight(window=1.0)
+        async def overview(self, event_id: UUID, *, session: AsyncSession | None = None) -> list[ProgramOverviewEntity]:
+            ...
+    """
+    def decorator(fn: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        signature = inspect.signature(fn)
+        attributes = {"method": fn.__qualname__}
+        # key -> (task, moment after which a finished task is no longer shared)
+        flights: dict[Hashable, tuple[asyncio.Future[R], float]] = {}
+
+        def land(key: Hashable, task: asyncio.Future[R]) -> None:
+            if task.cancelled() or task.exception() is not None or window <= 0:
+                if flights.get(key, (None,))[0] is task:
+                    del flights[key]
+                return
+            flights[key] = (task, time.monotonic() + window)
+
+        def sweep(now: float) -> None:
+            for key in [key for key, (task, expires_at) in flights.items() if task.done() and expires_at <= now]:
+                del flights[key]
+
+        @functools.wraps(fn)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            if bound.arguments.get("session") is not None:
+                return await fn(*args, **kwargs)
+
+            key = tuple((name, value) for name, value in bound.arguments.items() if name != "session")
+            now = time.monotonic()
+            flight = flights.get(key)
+            if flight is not None and (not flight[0].done() or flight[1] > now):
+                single_flight_shared.add(1, attributes)
+                task = flight[0]
+                return task.result() if task.done() else await asyncio.shield(task)
+
+            sweep(now)
+            task = asyncio.ensure_future(fn(*args, **kwargs))
+            flights[key] = (task, float("inf"))
+            task.add_done_callback(functools.partial(land, key))
+            # Shielded, so a caller giving up does not cancel the query for everybody else.
+            return await asyncio.shield(task)
+
+        return wrapper
+    return decorator
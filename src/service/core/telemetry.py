@@ -0,0 +1,203 @@
+import functools
+import inspect
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, Literal
+
+from opentelemetry import metrics, trace
+from opentelemetry.metrics import Histogram
+from opentelemetry.trace import INVALID_SPAN, SpanKind, Status, StatusCode
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExceptionContext, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger("rzbportal.telemetry")
+tracer = trace.get_tracer("rzbportal.telemetry.tracer")
+meter = metrics.get_meter("rzbportal.telemetry.meter")
+
+type Exporter = Literal["otlp", "console", "none"]
+
+statement_duration = meter.create_histogram(
+    "db.client.operation.duration", unit="ms", description="Duration of SQL statements, from sending to the last row fetched by the driver"
+)
+_method_durations: dict[str, Histogram] = {}
+
+
+def _unsampled() -> bool:
+    # Within a trace which is not sampled children are dropped anyway (parent based sampling), creating them is skipped.
+    parent = trace.get_current_span()
+    return parent.get_span_context().is_valid and not parent.is_recording()
+
+# Statements are cut in span attributes, bulk inserts can get huge.
+MAX_STATEMENT_LENGTH = 2048
+
+
+def configure_telemetry(
+    exporter: Exporter,
+    *,
+    service_name: str = "rzbportal",
+    sample_ratio: float = 1.0,
+    metric_interval_ms: int = 60_000
+) -> Callable[[], None]:
+    """
+    Installs the OpenTelemetry SDK as the global tracer and meter provider.
+
+    Tracers and meters of the application are created at import through the API and pick the providers up
+    once installed. With the `none` exporter nothing is installed, spans and metrics stay no-ops. The SDK and
+    the exporters are imported here only, they are slow to import. The OTLP exporter is configured by the
+    standard `OTEL_EXPORTER_OTLP_*` environment variables (endpoint, headers, ...).
+
+    Traces are sampled by trace id, a request joins the sampling decision of an incoming `traceparent`.
+    Metrics are not sampled, the latency histograms always see every call.
+
+    Args:
+        exporter (Exporter): `otlp` to export over OTLP/gRPC, `console` to print to stdout, `none` to disable.
+        service_name (str): The `service.name` resource attribute.
+        sample_ratio (float): Share of traces recorded, between 0 and 1.
+        metric_interval_ms (int): Milliseconds between metric exports.
+
+    Returns:
+        Callable[[], None]: Flushes and shuts the providers down, call it on shutdown.
+    """
+    if exporter == "none":
+        return lambda: None
+
+    from opentelemetry.sdk.metrics import AlwaysOffExemplarFilter, MeterProvider
+    from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+    if exporter == "otlp":
+        from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
+        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+        span_exporter, metric_exporter = OTLPSpanExporter(), OTLPMetricExporter()
+    elif exporter == "console":
+        from opentelemetry.sdk.metrics.export import ConsoleMetricExporter
+        from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+        span_exporter, metric_exporter = ConsoleSpanExporter(), ConsoleMetricExporter()
+    else:
+        raise ValueError(f"Unknown telemetry exporter {exporter!r}")
+
+    resource = Resource.create({"service.name": service_name})
+    tracer_provider = TracerProvider(resource=resource, sampler=ParentBased(TraceIdRatioBased(sample_ratio)))
+    tracer_provider.add_span_processor(BatchSpanProcessor(span_exporter))
+    # Exemplars would double the cost of recording into histograms, the latency metrics are recorded on every call.
+    meter_provider = MeterProvider(
+        resource=resource,
+        exemplar_filter=AlwaysOffExemplarFilter(),
+        metric_readers=[PeriodicExportingMetricReader(metric_exporter, export_interval_millis=metric_interval_ms)]
+    )
+    trace.set_tracer_provider(tracer_provider)
+    metrics.set_meter_provider(meter_provider)
+    logger.info(f"Exporting telemetry to {exporter}, sampling {sample_ratio:.0%} of traces")
+
+    def shutdown() -> None:
+        tracer_provider.shutdown()
+        meter_provider.shutdown()
+
+    return shutdown
+
+
+def traced[T: type](layer: str) -> Callable[[T], T]:
+    """
+    Class decorator wrapping every public coroutine method in a span and recording its latency.
+
+    The span is named after the method (`EventService.overview`), the latency goes to the `<layer>.method.duration`
+    histogram tagged with the same name. Async generators, private methods and inherited methods are left alone.
+    Repositories are traced through `BaseRepository`, services are decorated explicitly.
+
+    Args:
+        layer (str): The layer of the class, e.g. `service` or `repository`.
+
+    Example:
+        @traced("service")
+        class EventService:
+            ...
+    """
+    if layer not in _method_durations:
+        _method_durations[layer] = meter.create_histogram(
+            f"{layer}.method.duration", unit="ms", description=f"Duration of {layer} method calls"
+        )
+    histogram = _method_durations[layer]
+
+    def decorator(cls: T) -> T:
+        for name, member in list(vars(cls).items()):
+            if name.startswith("_") or not inspect.isfunction(member) or not inspect.iscoroutinefunction(member):
+                continue
+            if not getattr(member, "__traced__", False):
+                setattr(cls, name, _trace_method(member, f"{cls.__name__}.{name}", histogram))
+        return cls
+    return decorator
+
+
+def _trace_method[**P, R](fn: Callable[P, Awaitable[R]], name: str, histogram: Histogram) -> Callable[P, Awaitable[R]]:
+    attributes = {"code.function.name": name}
+
+    @functools.wraps(fn)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        start = time.perf_counter()
+        try:
+            if _unsampled():
+                return await fn(*args, **kwargs)
+            with tracer.start_as_current_span(name, attributes=attributes):
+                return await fn(*args, **kwargs)
+        finally:
+            histogram.record((time.perf_counter() - start) * 1000, attributes)
+
+    wrapper.__traced__ = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """
+    Records a span and the duration of every SQL statement run by the engine.
+
+    Spans carry the statement text and the number of rows returned or affected. They are children of the
+    span current in the calling task, SQLAlchemy runs the driver in a greenlet sharing the task's context.
+
+    Args:
+        engine (AsyncEngine): The engine to instrument.
+    """
+    attributes = {"db.system.name": "postgresql", "db.namespace": engine.url.database or ""}
+
+    def before_execute(conn: Connection, cursor: Any, statement: str, parameters: Any, context: ExecutionContext, executemany: bool) -> None:
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "SQL"
+        span = INVALID_SPAN if _unsampled() else tracer.start_span(operation, kind=SpanKind.CLIENT)
+        if span.is_recording():
+            span.set_attributes(attributes)
+            span.set_attribute("db.operation.name", operation)
+            span.set_attribute("db.query.text", statement[:MAX_STATEMENT_LENGTH])
+        context._telemetry = (span, operation, time.perf_counter())  # type: ignore[attr-defined]
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_execute)
+    event.listen(engine.sync_engine, "handle_error", _handle_error)
+
+
+def _after_execute(conn: Connection, cursor: Any, statement: str, parameters: Any, context: ExecutionContext, executemany: bool) -> None:
+    span, operation, start = context._telemetry  # type: ignore[attr-defined]
+    statement_duration.record((time.perf_counter() - start) * 1000, {"db.operation.name": operation})
+    if span.is_recording():
+        rows = cursor.rowcount
+        if rows < 0 and not context.execution_options.get("stream_results", False):
+            # The asyncpg adapter has fetched the whole result already, it only reports a row count for DML.
+            rows = len(getattr(cursor, "_rows", ()))
+        span.set_attribute("db.response.returned_rows", rows)
+    span.end()
+    context._telemetry = None  # type: ignore[attr-defined]
+
+
+def _handle_error(exception_context: ExceptionContext) -> None:
+    context = exception_context.execution_context
+    telemetry = getattr(context, "_telemetry", None)
+    if telemetry is None:
+        return
+    span, operation, start = telemetry
+    error = {"db.operation.name": operation, "error.type": type(exception_context.original_exception).__name__}
+    statement_duration.record((time.perf_counter() - start) * 1000, error)
+    span.record_exception(exception_context.original_exception)
+    span.set_status(Status(StatusCode.ERROR))
+    span.end()
@@ -1,4 +1,13 @@
-from .entity import CreateLocationEntity, EventEntity, LocationEntity, ProgramOverviewEntity
+from .entity import (
+    CreateLocationEntity,
+    EventEntity,
+    LocationEntity,
+    ProgramOverviewEntity,
+    ProgramOverviewItemEntity,
+    ProgramOverviewSessionEntity,
+    event_list_options,
+    location_list_options,
+)
 from .repository import EventRepository
 from .service import EventService
 
@@ -7,6 +16,10 @@ __all__ = [
     "EventService",
     "EventEntity",
     "ProgramOverviewEntity",
+    "ProgramOverviewItemEntity",
+    "ProgramOverviewSessionEntity",
     "CreateLocationEntity",
-    "LocationEntity"
+    "LocationEntity",
+    "event_list_options",
+    "location_list_options",
 ]
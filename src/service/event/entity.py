@@ -3,6 +3,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from service.core import EventStatus, FilterDefinition, ListOptionField, ListOptions
+
 
 class LifecycleEntity(BaseModel):
     created_by: UUID | None = None
@@ -37,6 +39,27 @@ class ProgramOverviewEntity(BaseModel):
     end_time: datetime | None = None
     attendee_count: int | None = None
 
+class ProgramOverviewSessionEntity(BaseModel):
+    id_program_session: UUID
+    start_time: datetime | None = None
+    end_time: datetime | None = None
+    status: str | None = None
+    note: str | None = None
+    attendee_limit: int | None = None
+    attendee_count: int | None = None
+
+class ProgramOverviewItemEntity(BaseModel):
+    """The overview grouped by program item, assembled as JSON by the database, see `EventRepository.overview_json`."""
+    id_program_item: UUID
+    name: str
+    type: str | None = None
+    attendee_limit: int | None = None
+    attendee_limit_buffer: int | None = None
+    required_time: timedelta | None = None
+    before_time_buffer: timedelta | None = None
+    after_time_buffer: timedelta | None = None
+    sessions: list[ProgramOverviewSessionEntity]
+
 class LocationEntity(LifecycleEntity):
     id_location: UUID
     id_event: UUID
@@ -50,3 +73,26 @@ class CreateLocationEntity(BaseModel):
     lat: float | None = Field(default=None, ge=-90, le=90)
     lon: float | None = Field(default=None, ge=-180, le=180)
     color: str = Field(pattern=r"^#[0-9A-Fa-f]{6}$")
+
+
+event_list_options = ListOptions(fields={
+    "name": ListOptionField(name="Název", filterable=FilterDefinition(type="fts"), is_sortable=True),
+    "start_date": ListOptionField(name="Začátek", filterable=FilterDefinition(type="date_range"), is_sortable=True),
+    "end_date": ListOptionField(name="Konec", filterable=FilterDefinition(type="date_range"), is_sortable=True),
+    "status": ListOptionField(
+        name="Stav",
+        filterable=FilterDefinition(
+            type="select",
+            is_multiselect=True,
+            select_options=[{"value": status.value, "label": status.value} for status in (EventStatus.DRAFT, EventStatus.PUBLISHED)]
+        ),
+        is_sortable=True
+    ),
+    "created_at": ListOptionField(name="Vytvořeno", is_sortable=True),
+})
+
+location_list_options = ListOptions(fields={
+    "name": ListOptionField(name="Název lokace", filterable=FilterDefinition(type="fts"), is_sortable=True),
+    "color": ListOptionField(name="Barva", filterable=FilterDefinition(type="select", is_multiselect=True)),
+    "created_at": ListOptionField(name="Vytvořeno", is_sortable=True),
+})
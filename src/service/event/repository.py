@@ -1,15 +1,16 @@
-from collections.abc import Sequence
+from collections.abc import AsyncGenerator, Sequence
 from datetime import datetime, timedelta
 from typing import NamedTuple
 from uuid import UUID
 
-from rich.console import Console
+from sqlalchemy.engine import RowMapping
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from sqlmodel import select, text
 
-from service.core import BaseRepository, EventModel, EventStatus, LocationModel
+from service.core import BaseRepository, EventModel, EventStatus, ListCriterion, ListResult, LocationModel, cached
+
+from .entity import event_list_options, location_list_options
 
-c = Console()
 
 class OverviewResult(NamedTuple):
     id_program_item: UUID
@@ -26,6 +27,105 @@ class OverviewResult(NamedTuple):
     end_time: datetime | None
     attendee_count: int
 
+OVERVIEW_QUERY = """
+    SELECT
+        pi.id_program_item,
+        pi.name,
+        pi.type,
+        COALESCE(ps.attendee_limit_override, pi.attendee_limit) AS attendee_limit,
+        pi.attendee_limit_buffer,
+        ps.note,
+        ps.status,
+        pi.required_time,
+        pi.before_time_buffer,
+        pi.after_time_buffer,
+        ps.start_time,
+        ps.end_time,
+        ps.attendee_count
+    FROM
+        t_program_session ps
+    LEFT JOIN
+        t_program_item pi USING (id_program_item)
+    WHERE
+        pi.id_event = :event_id
+    ORDER BY ps.start_time ASC
+"""
+
+# Builds the whole grouped overview (`ProgramOverviewItemEntity` list) as a single JSON text value. Intervals are
+# rendered by `intervalstyle`, which has to be ISO 8601 to match what pydantic writes for a timedelta.
+OVERVIEW_JSON_QUERY = """
+    WITH sessions AS (
+        SELECT
+            ps.id_program_item,
+            MIN(ps.start_time) AS first_start_time,
+            json_agg(json_build_object(
+                'id_program_session', ps.id_program_session,
+                'start_time', ps.start_time,
+                'end_time', ps.end_time,
+                'status', ps.status,
+                'note', ps.note,
+                'attendee_limit', COALESCE(ps.attendee_limit_override, pi.attendee_limit),
+                'attendee_count', ps.attendee_count
+            ) ORDER BY ps.start_time, ps.id_program_session) AS sessions
+        FROM
+            t_program_session ps
+        JOIN
+            t_program_item pi USING (id_program_item)
+        WHERE
+            pi.id_event = :event_id
+        GROUP BY ps.id_program_item
+    )
+    SELECT
+        COALESCE(json_agg(json_build_object(
+            'id_program_item', pi.id_program_item,
+            'name', pi.name,
+            'type', pi.type,
+            'attendee_limit', pi.attendee_limit,
+            'attendee_limit_buffer', pi.attendee_limit_buffer,
+            'required_time', pi.required_time,
+            'before_time_buffer', pi.before_time_buffer,
+            'after_time_buffer', pi.after_time_buffer,
+            'sessions', COALESCE(s.sessions, '[]'::json)
+        ) ORDER BY s.first_start_time NULLS LAST, pi.name, pi.id_program_item), '[]'::json)::text
+    FROM
+        t_program_item pi
+    LEFT JOIN
+        sessions s USING (id_program_item)
+    WHERE
+        pi.id_event = :event_id
+"""
+
+# The fields of `LocationEntity`, selected as plain columns by the list endpoint.
+LOCATION_COLUMNS = (
+    LocationModel.id_location,
+    LocationModel.id_event,
+    LocationModel.name,
+    LocationModel.lat,
+    LocationModel.lon,
+    LocationModel.color,
+    LocationModel.created_at,
+    LocationModel.updated_at,
+    LocationModel.created_by,
+    LocationModel.updated_by,
+)
+
+# One multi-row insert for any number of locations, the rows come as arrays (one bind parameter per column).
+CREATE_LOCATIONS_QUERY = """
+    INSERT INTO t_location (id_location, id_event, name, lat, lon, color)
+    SELECT
+        v.id_location, :event_id, v.name, v.lat, v.lon, v.color
+    FROM
+        unnest(
+            CAST(:id_location AS uuid[]),
+            CAST(:name AS varchar[]),
+            CAST(:lat AS double precision[]),
+            CAST(:lon AS double precision[]),
+            CAST(:color AS varchar[])
+        ) AS v(id_location, name, lat, lon, color)
+    RETURNING
+        id_location, id_event, name, lat, lon, color, created_at, updated_at, created_by, updated_by
+"""
+
 class EventRepository(BaseRepository):
     async def list_active_events(self, *, session: AsyncSession | None = None) -> Sequence[EventModel]:
         """
@@ -48,6 +148,26 @@ class EventRepository(BaseRepository):
             )
             return result.scalars().all()
 
+    async def list_events(self, criterion: ListCriterion, *, session: AsyncSession | None = None) -> ListResult[EventModel]:
+        """
+        Lists active events (DRAFT or PUBLISHED) sorted, filtered and paginated according to the criterion.
+
+        Args:
+            criterion (ListCriterion): The list criterion, see `event_list_options` for the allowed fields.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session is created.
+
+        Returns:
+            ListResult[EventModel]: The page of events with the total count and the next page cursor.
+        """
+        return await self.paginate(
+            EventModel,
+            criterion,
+            event_list_options,
+            EventModel.status.in_([EventStatus.DRAFT, EventStatus.PUBLISHED]),  # type: ignore[attr-defined]
+            session=session
+        )
+
+    @cached("event.overview", ttl=5, tag="event_id")
     async def overview(self, event_id: UUID, *, session: AsyncSession | None = None) -> Sequence[OverviewResult]:
         """
         Retrieves an overview of program sessions for a given event.
@@ -70,35 +190,104 @@ class EventRepository(BaseRepository):
                 - after_time_buffer: Buffer time after the session.
                 - start_time: The start time of the session.
                 - end_time: The end time of the session.
-                - attendee_count: The number of attendees registered for the session.
+                - attendee_count: The number of attendees registered for the session (maintained counter,
+                  see `reconcile_attendee_counts`).
+        """
+        async with self.ensure_session(session) as session:
+            result = await session.execute(text(OVERVIEW_QUERY), {"event_id": event_id})
+            return [OverviewResult(*row) for row in result.fetchall()]
+
+    @cached("event.overview_json", ttl=5, tag="event_id")
+    async def overview_json(self, event_id: UUID, *, session: AsyncSession | None = None) -> str:
+        """
+        Retrieves the overview of an event grouped by program item, assembled as JSON text by the database.
+
+        Every program item of the event is listed with its sessions nested in start time order, items are ordered
+        by their first session (items without sessions last). The text is the serialized `list[ProgramOverviewItemEntity]`
+        and can be sent as a response body as is, no row is materialized in Python.
+
+        Args:
+            event_id (UUID): The unique identifier of the event.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session is created.
+
+        Returns:
+            str: The JSON array, `[]` for an unknown event.
+        """
+        async with self.ensure_session(session) as session:
+            # Transaction scoped, pooled connections keep their default interval style.
+            await session.execute(text("SET LOCAL intervalstyle = 'iso_8601'"))
+            return (await session.execute(text(OVERVIEW_JSON_QUERY), {"event_id": event_id})).scalar_one()
+
+    async def stream_overview(
+        self,
+        event_id: UUID,
+        chunk_size: int = 1000,
+        *,
+        session: AsyncSession | None = None
+    ) -> AsyncGenerator[Sequence[OverviewResult], None]:
+        """
+        Streams the overview of program sessions for a given event in chunks.
+
+        Rows are fetched through a server-side cursor, so at most `chunk_size` rows are held in memory and the
+        first chunk is available before the whole result is produced. The session stays open until the
+        generator is exhausted or closed.
+
+        Args:
+            event_id (UUID): The unique identifier of the event.
+            chunk_size (int): Number of rows fetched from the cursor at once.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session is created.
+
+        Yields:
+            Sequence[OverviewResult]: Chunks of at most `chunk_size` rows, see `overview` for the fields.
+        """
+        async with self.ensure_session(session) as session:
+            result = await session.stream(
+                text(OVERVIEW_QUERY), {"event_id": event_id}, execution_options={"yield_per": chunk_size}
+            )
+            async for partition in result.partitions():
+                yield [OverviewResult(*row) for row in partition]
+
+    async def reconcile_attendee_counts(self, event_id: UUID | None = None, *, session: AsyncSession | None = None) -> Sequence[UUID]:
+        """
+        Repairs drift of the maintained `attendee_count` counter on program sessions.
+
+        The counter is kept in sync by a trigger on `t_attendee_program_session`, so drift should only appear
+        after manual data fixes or when the trigger was disabled. Only sessions whose counter differs from the
+        real number of registrations are updated.
+
+        Args:
+            event_id (UUID | None): Limit the reconciliation to a single event. All events are reconciled if None.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session is created.
+
+        Returns:
+            Sequence[UUID]: Identifiers of the program sessions whose counter was repaired.
         """
         async with self.ensure_session(session) as session:
             result = await session.execute(text(
                 """
-                    SELECT
-                        pi.id_program_item,
-                        pi.name,
-                        pi.type,
-                        COALESCE(ps.attendee_limit_override, pi.attendee_limit) AS attendee_limit,
-                        pi.attendee_limit_buffer,
-                        ps.note,
-                        ps.status,
-                        pi.required_time,
-                        pi.before_time_buffer,
-                        pi.after_time_buffer,
-                        ps.start_time,
-                        ps.end_time,
-                        (SELECT COUNT(*) FROM t_attendee_program_session aps WHERE aps.id_program_session = ps.id_program_session) AS attendee_count
-                    FROM
-                        t_program_session ps
-                    LEFT JOIN
-                        t_program_item pi USING (id_program_item)
+                    UPDATE t_program_session ps
+                    SET attendee_count = real.attendee_count
+                    FROM (
+                        SELECT
+                            s.id_program_session,
+                            COUNT(aps.id_attendee) AS attendee_count
+                        FROM
+                            t_program_session s
+                        JOIN
+                            t_program_item pi USING (id_program_item)
+                        LEFT JOIN
+                            t_attendee_program_session aps USING (id_program_session)
+                        WHERE
+                            CAST(:event_id AS uuid) IS NULL OR pi.id_event = :event_id
+                        GROUP BY s.id_program_session
+                    ) real
                     WHERE
-                        pi.id_event = :event_id
-                    ORDER BY ps.start_time ASC
+                        ps.id_program_session = real.id_program_session
+                        AND ps.attendee_count <> real.attendee_count
+                    RETURNING ps.id_program_session
                 """
             ), {"event_id": event_id})
-            return [OverviewResult(*row) for row in result.fetchall()]
+            return result.scalars().all()
 
     async def get_locations(self, event_id: UUID, *, session: AsyncSession | None = None) -> Sequence[LocationModel]:
         """
@@ -117,6 +306,56 @@ class EventRepository(BaseRepository):
             )
             return result.scalars().all()
 
+    @cached("event.locations", ttl=300, tag="event_id")
+    async def list_locations(self, event_id: UUID, criterion: ListCriterion, *, session: AsyncSession | None = None) -> ListResult[RowMapping]:
+        """
+        Lists locations of an event sorted, filtered and paginated according to the criterion.
+
+        Args:
+            event_id (UUID): The unique identifier of the event.
+            criterion (ListCriterion): The list criterion, see `location_list_options` for the allowed fields.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a read session is created.
+
+        Returns:
+            ListResult[RowMapping]: The page of locations as mappings of `LOCATION_COLUMNS`, with the total count and the next page cursor.
+        """
+        return await self.paginate_rows(
+            LocationModel,
+            LOCATION_COLUMNS,
+            criterion,
+            location_list_options,
+            LocationModel.id_event == event_id,  # type: ignore[arg-type]
+            session=session
+        )
+
+    async def create_locations(
+        self,
+        event_id: UUID,
+        locations: Sequence[LocationModel],
+        *,
+        session: AsyncSession | None = None
+    ) -> Sequence[RowMapping]:
+        """
+        Inserts locations of an event with a single multi-row `INSERT ... RETURNING`.
+
+        Args:
+            event_id (UUID): The unique identifier of the event, overrides `id_event` of the models.
+            locations (Sequence[LocationModel]): The locations, with their ids set.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session will be created.
+
+        Returns:
+            Sequence[RowMapping]: The inserted rows as mappings of the `LocationEntity` fields, in no particular order.
+        """
+        async with self.ensure_session(session) as session:
+            result = await session.execute(text(CREATE_LOCATIONS_QUERY), {
+                "event_id": event_id,
+                "id_location": [location.id_location for location in locations],
+                "name": [location.name for location in locations],
+                "lat": [location.lat for location in locations],
+                "lon": [location.lon for location in locations],
+                "color": [location.color for location in locations],
+            })
+            return result.mappings().all()
 
     async def get_location_by_id(self, location_id: UUID, *, session: AsyncSession | None = None) -> LocationModel | None:
         """
@@ -136,7 +375,7 @@ class EventRepository(BaseRepository):
             return row.scalar_one_or_none()
 
 
-    async def delete_location(self, location_id: UUID, *, session: AsyncSession | None = None) -> None:
+    async def delete_location(self, location_id: UUID, *, session: AsyncSession | None = None) -> UUID:
         """
         Asynchronously deletes a location from the database by its unique identifier.
 
@@ -148,7 +387,7 @@ class EventRepository(BaseRepository):
             sqlalchemy.exc.NoResultFound: If no location with the given ID exists.
 
         Returns:
-            None
+            UUID: The unique identifier of the event the location belonged to.
         """
         async with self.ensure_session(session) as session:
             result = await session.execute(
@@ -156,3 +395,4 @@ class EventRepository(BaseRepository):
             )
             location = result.scalar_one_or_none()
             await session.delete(location)
+            return location.id_event
@@ -1,46 +1,66 @@
-from collections.abc import Sequence
+from collections.abc import AsyncGenerator, Sequence
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio.session import AsyncSession
 
-from service.core import LocationModel
+from service.core import BatchResponse, ListCriterion, ListResponse, LocationModel, singleflight, traced
 
 from .entity import CreateLocationEntity, EventEntity, LocationEntity, ProgramOverviewEntity
 
 if TYPE_CHECKING:
     from .repository import EventRepository
 
+_location_entities = TypeAdapter(list[LocationEntity])
+_overview_entities = TypeAdapter(list[ProgramOverviewEntity])
+
+
+@traced("service")
 class EventService:
     def __init__(self, repository: "EventRepository"):
         self.repository = repository
 
-    async def list_events(self) -> Sequence[EventEntity]:
+    async def list_events(self, criterion: ListCriterion, *, session: AsyncSession | None = None) -> ListResponse[EventEntity]:
         """
-        Asynchronously retrieves a sequence of active Event objects from the repository.
+        Asynchronously retrieves a page of active events from the repository.
 
-        Returns:
-            Sequence[Event]: A sequence containing all active events.
-        """
-        async with self.repository.ensure_session() as session:
-            return [EventEntity(
-                id_event=event.id_event,
-                name=event.name,
-                description=event.description,
-                start_date=event.start_date,
-                end_date=event.end_date,
-                status=str(event.status.value),
-                created_by=event.created_by,
-                created_at=event.created_at,
-                updated_by=event.updated_by,
-                updated_at=event.updated_at
-            ) for event in await self.repository.list_active_events(session=session)]
+        Args:
+            criterion (ListCriterion): Sorting, filtering and pagination of the list.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session will be created.
 
+        Returns:
+            ListResponse[EventEntity]: The page of active events.
+        """
+        async with self.repository.ensure_session(session) as session:
+            page = await self.repository.list_events(criterion, session=session)
+            return ListResponse(
+                data=[EventEntity(
+                    id_event=event.id_event,
+                    name=event.name,
+                    description=event.description,
+                    start_date=event.start_date,
+                    end_date=event.end_date,
+                    status=str(event.status.value),
+                    created_by=event.created_by,
+                    created_at=event.created_at,
+                    updated_by=event.updated_by,
+                    updated_at=event.updated_at
+                ) for event in page.items],
+                limit=criterion.limit,
+                offset=criterion.offset,
+                total=page.total,
+                next_cursor=page.next_cursor
+            )
 
+    @singleflight(window=0.5)
     async def overview(self, event_id: UUID, *, session: AsyncSession | None = None) -> list[ProgramOverviewEntity]:
         """
         Retrieve an overview of program items for a given event.
 
+        Concurrent calls for the same event share one query (and its result for half a second after it finished),
+        see `singleflight`. The returned list is shared between those callers.
+
         Args:
             event_id (UUID): The unique identifier of the event.
             session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session will be created.
@@ -51,57 +71,75 @@ class EventService:
         Raises:
             Any exceptions raised by the repository or database layer.
         """
-        async with self.repository.ensure_session(session) as session:
-            result = []
-            for row in await self.repository.overview(event_id, session=session):
-                result.append(ProgramOverviewEntity(
-                    id_program_item=row.id_program_item,
-                    name=row.name,
-                    type=row.type,
-                    attendee_limit=row.attendee_limit,
-                    attendee_limit_buffer=row.attendee_limit_buffer,
-                    note=row.note,
-                    status=row.status,
-                    required_time=row.required_time,
-                    before_time_buffer=row.before_time_buffer,
-                    after_time_buffer=row.after_time_buffer,
-                    start_time=row.start_time,
-                    end_time=row.end_time,
-                    attendee_count=row.attendee_count
-                ))
-            return result
+        # No own session here, the repository read is cached unless the caller passes one.
+        return _overview_entities.validate_python(await self.repository.overview(event_id, session=session), from_attributes=True)
+
+    @singleflight(window=0.5)
+    async def overview_json(self, event_id: UUID, *, session: AsyncSession | None = None) -> str:
+        """
+        Retrieve the overview of an event grouped by program item as a ready JSON body.
 
+        The database builds the JSON, nothing is validated or serialized in Python, which keeps large events cheap.
 
-    async def list_locations(self, event_id: UUID, *, session: AsyncSession | None = None) -> list[LocationEntity]:
+        Args:
+            event_id (UUID): The unique identifier of the event.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session will be created.
+
+        Returns:
+            str: The serialized `list[ProgramOverviewItemEntity]`.
+        """
+        return await self.repository.overview_json(event_id, session=session)
+
+    async def export_overview(self, event_id: UUID, chunk_size: int = 1000) -> AsyncGenerator[list[ProgramOverviewEntity], None]:
         """
-        Asynchronously retrieves a list of locations associated with a given event.
+        Streams the overview of program items for a given event in chunks, for exports of large events.
 
         Args:
-            event_id (UUID): The unique identifier of the event for which locations are to be listed.
+            event_id (UUID): The unique identifier of the event.
+            chunk_size (int): Maximal number of entities per chunk.
+
+        Yields:
+            list[ProgramOverviewEntity]: Chunks of program overview entities in the order of `overview`.
+        """
+        async for rows in self.repository.stream_overview(event_id, chunk_size):
+            yield _overview_entities.validate_python(rows, from_attributes=True)
+
+    async def reconcile_attendee_counts(self, event_id: UUID | None = None, *, session: AsyncSession | None = None) -> Sequence[UUID]:
+        """
+        Repairs drift of the maintained per-session attendee counters.
+
+        Args:
+            event_id (UUID | None): Limit the reconciliation to a single event. All events are reconciled if None.
             session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session will be created.
 
         Returns:
-            list[LocationEntity]: A list of LocationEntity objects representing the locations linked to the specified event.
+            Sequence[UUID]: Identifiers of the program sessions whose counter was repaired.
         """
         async with self.repository.ensure_session(session) as session:
-            result = []
-            for row in await self.repository.get_locations(event_id, session=session):
-                result.append(LocationEntity(
-                    id_location=row.id_location,
-                    id_event=row.id_event,
-                    name=row.name,
-                    lat=row.lat,
-                    lon=row.lon,
-                    color=row.color,
-                    created_at=row.created_at,
-                    updated_at=row.updated_at,
-                    created_by=row.created_by,
-                    updated_by=row.updated_by
-                ))
-            return result
+            return await self.repository.reconcile_attendee_counts(event_id, session=session)
 
+    async def list_locations(self, event_id: UUID, criterion: ListCriterion, *, session: AsyncSession | None = None) -> ListResponse[LocationEntity]:
+        """
+        Asynchronously retrieves a page of locations associated with a given event.
 
-    async def create_location(self, event_id: UUID, new_location: CreateLocationEntity, *, session: AsyncSession | None = None) -> UUID:
+        Args:
+            event_id (UUID): The unique identifier of the event for which locations are to be listed.
+            criterion (ListCriterion): Sorting, filtering and pagination of the list.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session will be created.
+
+        Returns:
+            ListResponse[LocationEntity]: The page of LocationEntity objects representing the locations linked to the specified event.
+        """
+        page = await self.repository.list_locations(event_id, criterion, session=session)
+        return ListResponse(
+            data=_location_entities.validate_python(page.items),
+            limit=criterion.limit,
+            offset=criterion.offset,
+            total=page.total,
+            next_cursor=page.next_cursor
+        )
+
+    async def create_location(self, event_id: UUID, new_location: CreateLocationEntity, *, session: AsyncSession | None = None) -> LocationEntity:
         """
         Asynchronously creates a new location for a given event.
 
@@ -111,20 +149,46 @@ class EventService:
             session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session will be created.
 
         Returns:
-            UUID: The unique identifier of the newly created location.
+            LocationEntity: The created location, as returned by the insert.
         """
-        new_location_id = uuid4()
-        async with self.repository.ensure_session(session) as session:
-            new_location_model = LocationModel(
+        return (await self.create_locations(event_id, [new_location], session=session)).created[0]
+
+    async def create_locations(
+        self,
+        event_id: UUID,
+        new_locations: Sequence[CreateLocationEntity],
+        *,
+        session: AsyncSession | None = None
+    ) -> BatchResponse[LocationEntity]:
+        """
+        Creates many locations of an event at once, in one transaction and one insert.
+
+        Args:
+            event_id (UUID): The unique identifier of the event to which the locations will be added.
+            new_locations (Sequence[CreateLocationEntity]): The locations to create.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session will be created.
+
+        Returns:
+            BatchResponse[LocationEntity]: The created locations in the order of `new_locations`, none of them fails on its own.
+        """
+        models = [
+            LocationModel(
                 id_event=event_id,
-                id_location=new_location_id,
-                name=new_location.name,
-                lat=new_location.lat,
-                lon=new_location.lon,
-                color=new_location.color
+                id_location=uuid4(),
+                name=location.name,
+                lat=location.lat,
+                lon=location.lon,
+                color=location.color
             )
-            await self.repository.create(new_location_model, session=session)
-        return new_location_id
+            for location in new_locations
+        ]
+        owns_transaction = session is None
+        async with self.repository.ensure_session(session) as session:
+            rows = await self.repository.create_locations(event_id, models, session=session)
+        if owns_transaction:
+            await self.repository.invalidate(event_id)
+        position = {model.id_location: index for index, model in enumerate(models)}
+        return BatchResponse(created=_location_entities.validate_python(sorted(rows, key=lambda row: position[row["id_location"]])))
 
     async def get_location_by_id(self, location_id: UUID, *, session: AsyncSession | None = None) -> LocationEntity | None:
         """
@@ -167,5 +231,8 @@ class EventService:
         Raises:
             Any exceptions raised by the repository's delete_location method.
         """
+        owns_transaction = session is None
         async with self.repository.ensure_session(session) as session:
-            await self.repository.delete_location(location_id, session=session)
+            event_id = await self.repository.delete_location(location_id, session=session)
+        if owns_transaction:
+            await self.repository.invalidate(event_id)
@@ -1,5 +1,16 @@
-from .entity import CreateProgramItemEntity, ProgramItemEntity
+from .entity import CreateProgramItemEntity, ProgramItemEntity, ProgramItemSearchEntity, program_item_list_options
+from .exception import InvalidProgramTypeException, ProgramItemException, ProgramItemLocationNotFoundException
 from .repository import ProgramItemRepository
 from .service import ProgramItemService
 
-__all__ = ["ProgramItemRepository", "ProgramItemService", "ProgramItemEntity", "CreateProgramItemEntity"]
+__all__ = [
+    "ProgramItemRepository",
+    "ProgramItemService",
+    "ProgramItemEntity",
+    "ProgramItemSearchEntity",
+    "CreateProgramItemEntity",
+    "program_item_list_options",
+    "ProgramItemException",
+    "ProgramItemLocationNotFoundException",
+    "InvalidProgramTypeException",
+]
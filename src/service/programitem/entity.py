@@ -3,6 +3,8 @@ from uuid import UUID
 
 from pydantic import BaseModel
 
+from service.core import FilterDefinition, ListOptionField, ListOptions, ProgramType
+
 
 class ProgramItemEntity(BaseModel):
     id_program_item: UUID
@@ -22,6 +24,11 @@ class ProgramItemEntity(BaseModel):
     updated_at: datetime | None
 
 
+class ProgramItemSearchEntity(BaseModel):
+    item: ProgramItemEntity
+    rank: float
+
+
 class CreateProgramItemEntity(BaseModel):
     id_location: UUID
     name: str
@@ -32,3 +39,21 @@ class CreateProgramItemEntity(BaseModel):
     required_time: timedelta
     before_time_buffer: timedelta
     after_time_buffer: timedelta
+
+
+program_item_list_options = ListOptions(fields={
+    "name": ListOptionField(name="Název", filterable=FilterDefinition(type="fts"), is_sortable=True),
+    "type": ListOptionField(
+        name="Typ",
+        filterable=FilterDefinition(
+            type="select",
+            is_multiselect=True,
+            select_options=[{"value": program_type.value, "label": program_type.value} for program_type in ProgramType]
+        ),
+        is_sortable=True
+    ),
+    "id_location": ListOptionField(name="Lokace", filterable=FilterDefinition(type="select", is_multiselect=True)),
+    "attendee_limit": ListOptionField(name="Kapacita", is_sortable=True),
+    "required_time": ListOptionField(name="Délka", is_sortable=True),
+    "created_at": ListOptionField(name="Vytvořeno", is_sortable=True),
+})
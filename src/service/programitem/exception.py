@@ -0,0 +1,15 @@
+from uuid import UUID
+
+
+class ProgramItemException(Exception):
+    """Base class for all errors raised while creating program items."""
+
+
+class ProgramItemLocationNotFoundException(ProgramItemException):
+    def __init__(self, id_location: UUID) -> None:
+        super().__init__(f"Location {id_location} does not exist in this event")
+
+
+class InvalidProgramTypeException(ProgramItemException):
+    def __init__(self, type: str) -> None:
+        super().__init__(f"Unknown program item type {type!r}")
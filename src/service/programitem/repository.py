@@ -1,13 +1,93 @@
 from collections.abc import Sequence
+from typing import NamedTuple
 from uuid import UUID
 
-from rich.console import Console
+from sqlalchemy import ColumnElement, Integer, String, cast
+from sqlalchemy.engine import RowMapping
 from sqlalchemy.ext.asyncio.session import AsyncSession
-from sqlmodel import select
+from sqlmodel import func, select, text
 
-from service.core import BaseRepository, ProgramItemModel
+from service.core import BaseRepository, ListCriterion, ListResult, ProgramItemModel
+from service.core.listing import prefix_tsquery, search_vector
 
-c = Console()
+from .entity import program_item_list_options
+
+
+def _minutes(column: ColumnElement) -> ColumnElement[int]:
+    return cast(func.floor(func.extract("epoch", column) / 60), Integer)
+
+
+# The fields of `ProgramItemEntity` computed in SQL, so rows validate into entities directly. Enum names
+# are stored in the database and the entity carries the value, which is the lower cased name.
+PROGRAM_ITEM_COLUMNS = (
+    ProgramItemModel.id_program_item,
+    ProgramItemModel.id_event,
+    ProgramItemModel.id_location,
+    ProgramItemModel.name,
+    ProgramItemModel.description,
+    func.lower(cast(ProgramItemModel.type, String)).label("type"),
+    ProgramItemModel.attendee_limit,
+    ProgramItemModel.attendee_limit_buffer,
+    _minutes(ProgramItemModel.required_time).label("required_time"),  # type: ignore[arg-type]
+    _minutes(ProgramItemModel.before_time_buffer).label("before_time_buffer"),  # type: ignore[arg-type]
+    _minutes(ProgramItemModel.after_time_buffer).label("after_time_buffer"),  # type: ignore[arg-type]
+    ProgramItemModel.created_by,
+    ProgramItemModel.created_at,
+    ProgramItemModel.updated_by,
+    ProgramItemModel.updated_at,
+)
+
+
+# Inserts any number of program items in one statement, skipping items whose location is not in the event.
+# Returns the columns of `PROGRAM_ITEM_COLUMNS`.
+CREATE_PROGRAM_ITEMS_QUERY = """
+    INSERT INTO t_program_item (
+        id_program_item, id_event, id_location, name, description, type,
+        attendee_limit, attendee_limit_buffer, required_time, before_time_buffer, after_time_buffer
+    )
+    SELECT
+        v.id_program_item, :event_id, v.id_location, v.name, v.description, v.type,
+        v.attendee_limit, v.attendee_limit_buffer, v.required_time, v.before_time_buffer, v.after_time_buffer
+    FROM
+        unnest(
+            CAST(:id_program_item AS uuid[]),
+            CAST(:id_location AS uuid[]),
+            CAST(:name AS varchar[]),
+            CAST(:description AS varchar[]),
+            CAST(:type AS programtype[]),
+            CAST(:attendee_limit AS integer[]),
+            CAST(:attendee_limit_buffer AS integer[]),
+            CAST(:required_time AS interval[]),
+            CAST(:before_time_buffer AS interval[]),
+            CAST(:after_time_buffer AS interval[])
+        ) AS v(
+            id_program_item, id_location, name, description, type,
+            attendee_limit, attendee_limit_buffer, required_time, before_time_buffer, after_time_buffer
+        )
+    WHERE
+        EXISTS (SELECT 1 FROM t_location l WHERE l.id_location = v.id_location AND l.id_event = :event_id)
+    RETURNING
+        id_program_item,
+        id_event,
+        id_location,
+        name,
+        description,
+        lower(CAST(type AS text)) AS type,
+        attendee_limit,
+        attendee_limit_buffer,
+        CAST(floor(extract(epoch FROM required_time) / 60) AS integer) AS required_time,
+        CAST(floor(extract(epoch FROM before_time_buffer) / 60) AS integer) AS before_time_buffer,
+        CAST(floor(extract(epoch FROM after_time_buffer) / 60) AS integer) AS after_time_buffer,
+        created_by,
+        created_at,
+        updated_by,
+        updated_at
+"""
+
+
+class ProgramItemSearchResult(NamedTuple):
+    item: ProgramItemModel
+    rank: float
 
 
 class ProgramItemRepository(BaseRepository):
@@ -29,3 +109,100 @@ class ProgramItemRepository(BaseRepository):
                 )
             )
             return result.scalars().all()
+
+    async def create_program_items(
+        self,
+        event_id: UUID,
+        program_items: Sequence[ProgramItemModel],
+        *,
+        session: AsyncSession | None = None
+    ) -> Sequence[RowMapping]:
+        """
+        Inserts program items of an event with a single multi-row `INSERT ... RETURNING`.
+
+        Items whose location does not belong to the event are skipped, they are missing from the result.
+
+        Args:
+            event_id (UUID): The unique identifier of the event, overrides `id_event` of the models.
+            program_items (Sequence[ProgramItemModel]): The program items, with their ids set.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session will be created.
+
+        Returns:
+            Sequence[RowMapping]: The inserted program items as mappings of `PROGRAM_ITEM_COLUMNS`, in no particular order.
+        """
+        async with self.ensure_session(session) as session:
+            result = await session.execute(text(CREATE_PROGRAM_ITEMS_QUERY), {
+                "event_id": event_id,
+                "id_program_item": [item.id_program_item for item in program_items],
+                "id_location": [item.id_location for item in program_items],
+                "name": [item.name for item in program_items],
+                "description": [item.description for item in program_items],
+                "type": [item.type.name for item in program_items],
+                "attendee_limit": [item.attendee_limit for item in program_items],
+                "attendee_limit_buffer": [item.attendee_limit_buffer for item in program_items],
+                "required_time": [item.required_time for item in program_items],
+                "before_time_buffer": [item.before_time_buffer for item in program_items],
+                "after_time_buffer": [item.after_time_buffer for item in program_items],
+            })
+            return result.mappings().all()
+
+    async def page_program_items(self, *, event_id: UUID, criterion: ListCriterion, session: AsyncSession | None = None) -> ListResult[RowMapping]:
+        """
+        Lists program items of an event sorted, filtered and paginated according to the criterion.
+
+        Args:
+            event_id (UUID): The unique identifier of the event for which to list program items.
+            criterion (ListCriterion): The list criterion, see `program_item_list_options` for the allowed fields.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a read session will be created.
+
+        Returns:
+            ListResult[RowMapping]: The page of program items as mappings of `PROGRAM_ITEM_COLUMNS`, with the total count and the next page cursor.
+        """
+        return await self.paginate_rows(
+            ProgramItemModel,
+            PROGRAM_ITEM_COLUMNS,
+            criterion,
+            program_item_list_options,
+            ProgramItemModel.id_event == event_id,  # type: ignore[arg-type]
+            session=session
+        )
+
+
+    async def search_program_items(
+        self,
+        *,
+        event_id: UUID,
+        search: str,
+        limit: int = 20,
+        session: AsyncSession | None = None
+    ) -> Sequence[ProgramItemSearchResult]:
+        """
+        Full-text searches program items of an event by name and description.
+
+        Uses the generated `search_vector` column and its GIN index. Every word of the search string is matched
+        as a prefix, so partially typed words match as well. Results are ranked with `ts_rank_cd`, matches in
+        the name weigh more than matches in the description.
+
+        Args:
+            event_id (UUID): The unique identifier of the event.
+            search (str): The search string as typed by the user.
+            limit (int): Maximal number of results.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session will be created.
+
+        Returns:
+            Sequence[ProgramItemSearchResult]: Matching program items with their rank, best match first.
+        """
+        query = prefix_tsquery(search)
+        if query is None:
+            return []
+        tsquery = func.to_tsquery("simple", query)
+        vector = search_vector(ProgramItemModel)
+        rank = func.ts_rank_cd(vector, tsquery).label("rank")
+        async with self.ensure_session(session) as session:
+            result = await session.execute(
+                select(ProgramItemModel, rank)
+                .where(ProgramItemModel.id_event == event_id, vector.op("@@")(tsquery))
+                .order_by(rank.desc(), ProgramItemModel.name)
+                .limit(limit)
+            )
+            return [ProgramItemSearchResult(item, rank) for item, rank in result.all()]
@@ -1,39 +1,75 @@
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
-from uuid import UUID
+from uuid import UUID, uuid4
 
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio.session import AsyncSession
 
-from service.core import ProgramItemModel, ProgramType
+from service.core import BatchFailureEntity, BatchResponse, ListCriterion, ListResponse, ProgramItemModel, ProgramType, traced
 
-from .entity import CreateProgramItemEntity, ProgramItemEntity
+from .entity import CreateProgramItemEntity, ProgramItemEntity, ProgramItemSearchEntity
+from .exception import InvalidProgramTypeException, ProgramItemLocationNotFoundException
 
 if TYPE_CHECKING:
     from .repository import ProgramItemRepository
 
+_program_item_entities = TypeAdapter(list[ProgramItemEntity])
+
+
+def _program_item_entity(item: ProgramItemModel) -> ProgramItemEntity:
+    return ProgramItemEntity(
+        id_program_item=item.id_program_item,
+        id_event=item.id_event,
+        id_location=item.id_location,
+        name=item.name,
+        description=item.description,
+        type=item.type.value,
+        attendee_limit=item.attendee_limit,
+        attendee_limit_buffer=item.attendee_limit_buffer,
+        required_time=int(item.required_time.total_seconds() // 60),
+        before_time_buffer=int(item.before_time_buffer.total_seconds() // 60),
+        after_time_buffer=int(item.after_time_buffer.total_seconds() // 60),
+        created_by=item.created_by,
+        created_at=item.created_at,
+        updated_by=item.updated_by,
+        updated_at=item.updated_at,
+    )
+
+
+@traced("service")
 class ProgramItemService:
     def __init__(self, repository: "ProgramItemRepository"):
         self.repository = repository
 
-    async def list_program_items(self, event_id: UUID, session: AsyncSession | None = None) -> list[ProgramItemEntity]:
+    async def list_program_items(self, event_id: UUID, criterion: ListCriterion, session: AsyncSession | None = None) -> ListResponse[ProgramItemEntity]:
+        page = await self.repository.page_program_items(event_id=event_id, criterion=criterion, session=session)
+        return ListResponse(
+            data=_program_item_entities.validate_python(page.items),
+            limit=criterion.limit,
+            offset=criterion.offset,
+            total=page.total,
+            next_cursor=page.next_cursor
+        )
+
+
+    async def search_program_items(self, event_id: UUID, search: str, limit: int = 20, session: AsyncSession | None = None) -> list[ProgramItemSearchEntity]:
+        """
+        Full-text searches program items of an event by name and description, see `ProgramItemRepository.search_program_items`.
+
+        Args:
+            event_id (UUID): The unique identifier of the event.
+            search (str): The search string as typed by the user, every word is matched as a prefix.
+            limit (int): Maximal number of results.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session will be created.
+
+        Returns:
+            list[ProgramItemSearchEntity]: The matching program items with their rank, best matches first.
+        """
         async with self.repository.ensure_session(session) as session:
-            program_items = await self.repository.list_program_items(event_id=event_id, session=session)
-            return [ProgramItemEntity(
-                id_program_item=item.id_program_item,
-                id_event=item.id_event,
-                id_location=item.id_location,
-                name=item.name,
-                description=item.description,
-                type=item.type.value,
-                attendee_limit=item.attendee_limit,
-                attendee_limit_buffer=item.attendee_limit_buffer,
-                required_time=int(item.required_time.total_seconds() // 60),
-                before_time_buffer=int(item.before_time_buffer.total_seconds() // 60),
-                after_time_buffer=int(item.after_time_buffer.total_seconds() // 60),
-                created_by=item.created_by,
-                created_at=item.created_at,
-                updated_by=item.updated_by,
-                updated_at=item.updated_at,
-            ) for item in program_items]
+            return [
+                ProgramItemSearchEntity(item=_program_item_entity(result.item), rank=result.rank)
+                for result in await self.repository.search_program_items(event_id=event_id, search=search, limit=limit, session=session)
+            ]
 
 
     async def create_program_item(self, event_id: UUID, program_item: CreateProgramItemEntity, session: AsyncSession | None = None):
@@ -52,3 +88,64 @@ class ProgramItemService:
             )
 
             await self.repository.create(new_program_item_model, session=session)
+
+    async def create_program_items(
+        self,
+        event_id: UUID,
+        program_items: Sequence[CreateProgramItemEntity],
+        *,
+        session: AsyncSession | None = None
+    ) -> BatchResponse[ProgramItemEntity]:
+        """
+        Creates many program items of an event at once, in one transaction and one insert.
+
+        Items with an unknown type or a location outside of the event fail on their own, the others are created.
+
+        Args:
+            event_id (UUID): The unique identifier of the event.
+            program_items (Sequence[CreateProgramItemEntity]): The program items to create.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session will be created.
+
+        Returns:
+            BatchResponse[ProgramItemEntity]: The created program items in the order of the request and the failed ones.
+        """
+        models: dict[int, ProgramItemModel] = {}
+        failed: list[BatchFailureEntity] = []
+        for index, program_item in enumerate(program_items):
+            try:
+                program_type = ProgramType(program_item.type)
+            except ValueError:
+                failed.append(BatchFailureEntity.from_exception(index, "PROGRAM_ITEM_INVALID_TYPE", InvalidProgramTypeException(program_item.type)))
+                continue
+            models[index] = ProgramItemModel(
+                id_program_item=uuid4(),
+                id_event=event_id,
+                id_location=program_item.id_location,
+                name=program_item.name,
+                description=program_item.description,
+                type=program_type,
+                attendee_limit=program_item.attendee_limit,
+                attendee_limit_buffer=program_item.attendee_limit_buffer,
+                required_time=program_item.required_time,
+                before_time_buffer=program_item.before_time_buffer,
+                after_time_buffer=program_item.after_time_buffer,
+            )
+
+        rows = {}
+        if models:
+            owns_transaction = session is None
+            async with self.repository.ensure_session(session) as session:
+                rows = {
+                    row["id_program_item"]: row
+                    for row in await self.repository.create_program_items(event_id, list(models.values()), session=session)
+                }
+            if owns_transaction:
+                await self.repository.invalidate(event_id)
+
+        created = []
+        for index, model in models.items():
+            if model.id_program_item in rows:
+                created.append(rows[model.id_program_item])
+            else:
+                failed.append(BatchFailureEntity.from_exception(index, "PROGRAM_ITEM_LOCATION_NOT_FOUND", ProgramItemLocationNotFoundException(model.id_location)))
+        return BatchResponse(created=_program_item_entities.validate_python(created), failed=sorted(failed, key=lambda failure: failure.index))
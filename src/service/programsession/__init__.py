@@ -0,0 +1,18 @@
+from .entity import CreateProgramSessionEntity, FreeSlotEntity, GeneratedSessionsEntity, ProgramSessionEntity, RecurrenceEntity
+from .exception import LocationDoubleBookedException, LocationNotFoundException, ProgramItemNotFoundException, ProgramSessionException
+from .repository import ProgramSessionRepository
+from .service import ProgramSessionService
+
+__all__ = [
+    "ProgramSessionRepository",
+    "ProgramSessionService",
+    "ProgramSessionEntity",
+    "CreateProgramSessionEntity",
+    "FreeSlotEntity",
+    "RecurrenceEntity",
+    "GeneratedSessionsEntity",
+    "ProgramSessionException",
+    "ProgramItemNotFoundException",
+    "LocationNotFoundException",
+    "LocationDoubleBookedException",
+]
@@ -0,0 +1,70 @@
+from datetime import datetime, time, timedelta
+from uuid import UUID
+
+from pydantic import BaseModel, Field, model_validator
+
+from service.core import SessionStatus
+
+
+class ProgramSessionEntity(BaseModel):
+    id_program_session: UUID
+    id_program_item: UUID
+    id_location_override: UUID | None
+    id_location: UUID | None = Field(description="The effective location, the override or the location of the program item")
+    start_time: datetime
+    end_time: datetime | None
+    note: str | None
+    status: str
+    attendee_limit_override: int | None
+    attendee_count: int
+    created_at: datetime
+
+
+class CreateProgramSessionEntity(BaseModel):
+    id_program_item: UUID
+    id_location_override: UUID | None = None
+    start_time: datetime
+    end_time: datetime | None = Field(default=None, description="Defaults to start time plus the required time of the program item")
+    note: str | None = Field(default=None, max_length=1024)
+    status: SessionStatus = SessionStatus.DRAFT
+    attendee_limit_override: int | None = None
+
+    @model_validator(mode="after")
+    def check_times(self) -> "CreateProgramSessionEntity":
+        if self.end_time is not None and self.end_time < self.start_time:
+            raise ValueError("end_time must not be before start_time")
+        return self
+
+
+class RecurrenceEntity(BaseModel):
+    """
+    Rule repeating sessions of a program item on every day of the event.
+
+    Each day, sessions start at `day_start` and then every `every`, as long as they end (after the required
+    time of the program item) by `day_end`.
+    """
+    id_program_item: UUID
+    id_location_override: UUID | None = None
+    day_start: time = Field(description="Start of the first session of each day")
+    day_end: time | None = Field(default=None, description="Sessions end by this time of each day, by midnight if not set")
+    every: timedelta = Field(ge=timedelta(minutes=1), description="Time between the starts of two consecutive sessions")
+    note: str | None = Field(default=None, max_length=1024)
+    status: SessionStatus = SessionStatus.DRAFT
+    attendee_limit_override: int | None = None
+
+    @model_validator(mode="after")
+    def check_times(self) -> "RecurrenceEntity":
+        if self.day_end is not None and self.day_end <= self.day_start:
+            raise ValueError("day_end must be after day_start")
+        return self
+
+
+class GeneratedSessionsEntity(BaseModel):
+    created: list[ProgramSessionEntity] = Field(description="Created sessions ordered by start time")
+    skipped: int = Field(description="Number of sessions of the rule not created as their location was already booked")
+
+
+class FreeSlotEntity(BaseModel):
+    start_time: datetime
+    end_time: datetime
+    duration: timedelta
@@ -0,0 +1,24 @@
+from uuid import UUID
+
+
+class ProgramSessionException(Exception):
+    """Base class for all errors raised while scheduling program sessions."""
+
+
+class ProgramItemNotFoundException(ProgramSessionException):
+    def __init__(self, id_program_item: UUID) -> None:
+        super().__init__(f"Program item {id_program_item} does not exist in this event")
+
+
+class LocationNotFoundException(ProgramSessionException):
+    def __init__(self, id_location: UUID) -> None:
+        super().__init__(f"Location {id_location} does not exist in this event")
+
+
+class LocationDoubleBookedException(ProgramSessionException):
+    def __init__(self, conflicting_sessions: list[UUID]) -> None:
+        self.conflicting_sessions = conflicting_sessions
+        super().__init__(
+            "The location is already booked at this time (including the before and after time buffers) by program sessions "
+            + ", ".join(str(id_program_session) for id_program_session in conflicting_sessions)
+        )
@@ -0,0 +1,477 @@
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from typing import NamedTuple
+from uuid import UUID
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio.session import AsyncSession
+from sqlmodel import text
+
+from service.core import BaseRepository, ProgramSessionModel, is_exclusion_violation
+
+from .exception import LocationDoubleBookedException
+
+class ProgramSessionResult(NamedTuple):
+    id_program_session: UUID
+    id_program_item: UUID
+    id_location_override: UUID | None
+    id_location: UUID | None
+    start_time: datetime
+    end_time: datetime | None
+    note: str | None
+    status: str
+    attendee_limit_override: int | None
+    attendee_count: int
+    created_at: datetime
+
+
+class GeneratedSessionsResult(NamedTuple):
+    generated: int
+    sessions: list[ProgramSessionResult]
+
+
+class FreeSlotResult(NamedTuple):
+    start_time: datetime
+    end_time: datetime
+
+
+# Inserts any number of sessions in one statement, skipping sessions of program items outside of the event.
+CREATE_PROGRAM_SESSIONS_QUERY = """
+    INSERT INTO t_program_session (
+        id_program_session, id_program_item, id_location_override, start_time, end_time,
+        note, status, attendee_limit_override, attendee_count
+    )
+    SELECT
+        v.id_program_session, pi.id_program_item, v.id_location_override, v.start_time, v.end_time,
+        v.note, v.status, v.attendee_limit_override, 0
+    FROM
+        unnest(
+            CAST(:id_program_session AS uuid[]),
+            CAST(:id_program_item AS uuid[]),
+            CAST(:id_location_override AS uuid[]),
+            CAST(:start_time AS timestamp[]),
+            CAST(:end_time AS timestamp[]),
+            CAST(:note AS varchar[]),
+            CAST(:status AS sessionstatus[]),
+            CAST(:attendee_limit_override AS integer[])
+        ) AS v(
+            id_program_session, id_program_item, id_location_override, start_time, end_time,
+            note, status, attendee_limit_override
+        )
+    JOIN
+        t_program_item pi
+        ON pi.id_program_item = v.id_program_item
+        AND pi.id_event = :event_id
+    RETURNING
+        id_program_session,
+        id_program_item,
+        id_location_override,
+        id_location_effective,
+        start_time,
+        end_time,
+        note,
+        status,
+        attendee_limit_override,
+        attendee_count,
+        created_at
+"""
+
+
+# Expands a recurrence over the days of the event and inserts all of its sessions in one statement. Sessions
+# colliding with booked ones (or with earlier sessions of the same rule) are skipped by the exclusion constraint.
+GENERATE_PROGRAM_SESSIONS_QUERY = """
+    WITH item AS (
+        SELECT
+            pi.id_program_item,
+            pi.required_time,
+            e.start_date,
+            e.end_date
+        FROM
+            t_program_item pi
+        JOIN
+            t_event e
+            ON e.id_event = pi.id_event
+        WHERE
+            pi.id_program_item = :id_program_item
+            AND pi.id_event = :event_id
+    ),
+    slot AS (
+        SELECT
+            item.id_program_item,
+            s.start_time
+        FROM
+            item
+        CROSS JOIN LATERAL
+            generate_series(CAST(item.start_date AS timestamp), CAST(item.end_date AS timestamp), INTERVAL '1 day') AS d(day)
+        CROSS JOIN LATERAL
+            generate_series(
+                d.day + CAST(:day_start AS interval),
+                d.day + CAST(:day_end AS interval) - item.required_time,
+                CAST(:every AS interval)
+            ) AS s(start_time)
+    ),
+    inserted AS (
+        INSERT INTO t_program_session (
+            id_program_session, id_program_item, id_location_override, start_time, end_time,
+            note, status, attendee_limit_override, attendee_count
+        )
+        SELECT
+            gen_random_uuid(), slot.id_program_item, :id_location_override, slot.start_time, NULL,
+            :note, :status, :attendee_limit_override, 0
+        FROM
+            slot
+        ORDER BY
+            slot.start_time
+        ON CONFLICT DO NOTHING
+        RETURNING
+            id_program_session,
+            id_program_item,
+            id_location_override,
+            id_location_effective,
+            start_time,
+            end_time,
+            note,
+            status,
+            attendee_limit_override,
+            attendee_count,
+            created_at
+    )
+    SELECT
+        (SELECT count(*) FROM item) AS found,
+        (SELECT count(*) FROM slot) AS generated,
+        inserted.*
+    FROM
+        (SELECT 1) AS one
+    LEFT JOIN
+        inserted
+        ON true
+    ORDER BY
+        inserted.start_time
+"""
+
+
+class ProgramSessionRepository(BaseRepository):
+    async def create_program_session(
+        self,
+        event_id: UUID,
+        id_program_item: UUID,
+        start_time: datetime,
+        end_time: datetime | None = None,
+        id_location_override: UUID | None = None,
+        note: str | None = None,
+        status: str = "DRAFT",
+        attendee_limit_override: int | None = None,
+        *,
+        session: AsyncSession | None = None
+    ) -> ProgramSessionResult | None:
+        """
+        Creates a program session of a program item of the event.
+
+        The insert runs in a savepoint. When the location double-booking exclusion constraint rejects it,
+        the sessions occupying the location are looked up (one probe of the same GiST index) and reported.
+
+        Args:
+            event_id (UUID): The unique identifier of the event the program item belongs to.
+            id_program_item (UUID): The unique identifier of the program item.
+            start_time (datetime): Start of the session.
+            end_time (datetime | None): End of the session, None to use the required time of the program item.
+            id_location_override (UUID | None): Location overriding the location of the program item.
+            note (str | None): Optional note.
+            status (str): Name of the `SessionStatus`.
+            attendee_limit_override (int | None): Capacity overriding the attendee limit of the program item.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session is created.
+
+        Returns:
+            ProgramSessionResult | None: The created session, or None if the program item does not exist in the event.
+
+        Raises:
+            LocationDoubleBookedException: If the location is already booked at an overlapping time.
+        """
+        params = {
+            "event_id": event_id,
+            "id_program_item": id_program_item,
+            "id_location_override": id_location_override,
+            "start_time": start_time,
+            "end_time": end_time,
+            "note": note,
+            "status": status,
+            "attendee_limit_override": attendee_limit_override,
+        }
+        async with self.ensure_session(session) as session:
+            try:
+                async with session.begin_nested():
+                    result = await session.execute(text(
+                        """
+                            INSERT INTO t_program_session (
+                                id_program_session, id_program_item, id_location_override, start_time, end_time,
+                                note, status, attendee_limit_override, attendee_count
+                            )
+                            SELECT
+                                gen_random_uuid(), pi.id_program_item, :id_location_override, :start_time, :end_time,
+                                :note, :status, :attendee_limit_override, 0
+                            FROM
+                                t_program_item pi
+                            WHERE
+                                pi.id_program_item = :id_program_item
+                                AND pi.id_event = :event_id
+                            RETURNING
+                                id_program_session,
+                                id_program_item,
+                                id_location_override,
+                                id_location_effective,
+                                start_time,
+                                end_time,
+                                note,
+                                status,
+                                attendee_limit_override,
+                                attendee_count,
+                                created_at
+                        """
+                    ), params)
+                    row = result.first()
+            except IntegrityError as e:
+                if not is_exclusion_violation(e):
+                    raise
+                conflicting = await self.location_conflicts(
+                    id_program_item, start_time, end_time, id_location_override, session=session
+                )
+                raise LocationDoubleBookedException(list(conflicting)) from e
+            return ProgramSessionResult(*row) if row else None
+
+    async def create_program_sessions(
+        self,
+        event_id: UUID,
+        program_sessions: Sequence[ProgramSessionModel],
+        *,
+        session: AsyncSession | None = None
+    ) -> Sequence[ProgramSessionResult]:
+        """
+        Inserts program sessions with a single multi-row `INSERT ... RETURNING`, in a savepoint.
+
+        Sessions of program items which do not exist in the event are skipped, they are missing from the result.
+        The insert is all or nothing with respect to the location double-booking constraint, when any session
+        overlaps (another session or one of the batch) none is inserted and the conflicts are not looked up.
+
+        Args:
+            event_id (UUID): The unique identifier of the event the program items belong to.
+            program_sessions (Sequence[ProgramSessionModel]): The sessions, with their ids set.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session is created.
+
+        Returns:
+            Sequence[ProgramSessionResult]: The created sessions, in no particular order.
+
+        Raises:
+            LocationDoubleBookedException: If any of the sessions would double-book a location, without the conflicts.
+        """
+        params = {
+            "event_id": event_id,
+            "id_program_session": [program_session.id_program_session for program_session in program_sessions],
+            "id_program_item": [program_session.id_program_item for program_session in program_sessions],
+            "id_location_override": [program_session.id_location_override for program_session in program_sessions],
+            "start_time": [program_session.start_time for program_session in program_sessions],
+            "end_time": [program_session.end_time for program_session in program_sessions],
+            "note": [program_session.note for program_session in program_sessions],
+            "status": [program_session.status.name for program_session in program_sessions],
+            "attendee_limit_override": [program_session.attendee_limit_override for program_session in program_sessions],
+        }
+        async with self.ensure_session(session) as session:
+            try:
+                async with session.begin_nested():
+                    result = await session.execute(text(CREATE_PROGRAM_SESSIONS_QUERY), params)
+                    return [ProgramSessionResult(*row) for row in result.all()]
+            except IntegrityError as e:
+                if not is_exclusion_violation(e):
+                    raise
+                raise LocationDoubleBookedException([]) from e
+
+    async def generate_program_sessions(
+        self,
+        event_id: UUID,
+        id_program_item: UUID,
+        day_start: timedelta,
+        day_end: timedelta,
+        every: timedelta,
+        id_location_override: UUID | None = None,
+        note: str | None = None,
+        status: str = "DRAFT",
+        attendee_limit_override: int | None = None,
+        *,
+        session: AsyncSession | None = None
+    ) -> GeneratedSessionsResult | None:
+        """
+        Generates the sessions of a recurrence with a single `INSERT ... SELECT generate_series(...)`.
+
+        Sessions are generated on every day of the event from `day_start`, every `every`, as long as they end
+        (start plus the required time of the program item) by `day_end`. Sessions which would double-book the
+        location, including the before and after time buffers, are skipped with `ON CONFLICT DO NOTHING`.
+
+        Args:
+            event_id (UUID): The unique identifier of the event the program item belongs to.
+            id_program_item (UUID): The unique identifier of the program item.
+            day_start (timedelta): Start of the first session of a day, as the time since midnight.
+            day_end (timedelta): Time since midnight by which the sessions of a day end, up to one day.
+            every (timedelta): Time between the starts of two consecutive sessions.
+            id_location_override (UUID | None): Location overriding the location of the program item.
+            note (str | None): Optional note.
+            status (str): Name of the `SessionStatus`.
+            attendee_limit_override (int | None): Capacity overriding the attendee limit of the program item.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session is created.
+
+        Returns:
+            GeneratedSessionsResult | None: The number of sessions of the rule and the created ones ordered by start time,
+                or None if the program item does not exist in the event.
+        """
+        params = {
+            "event_id": event_id,
+            "id_program_item": id_program_item,
+            "day_start": day_start,
+            "day_end": day_end,
+            "every": every,
+            "id_location_override": id_location_override,
+            "note": note,
+            "status": status,
+            "attendee_limit_override": attendee_limit_override,
+        }
+        async with self.ensure_session(session) as session:
+            rows = (await session.execute(text(GENERATE_PROGRAM_SESSIONS_QUERY), params)).all()
+        found, generated = rows[0][:2]
+        if not found:
+            return None
+        return GeneratedSessionsResult(generated, [ProgramSessionResult(*row[2:]) for row in rows if row[2] is not None])
+
+    async def location_conflicts(
+        self,
+        id_program_item: UUID,
+        start_time: datetime,
+        end_time: datetime | None = None,
+        id_location_override: UUID | None = None,
+        *,
+        session: AsyncSession | None = None
+    ) -> Sequence[UUID]:
+        """
+        Lists the sessions occupying the location a new session of the program item would need.
+
+        Args:
+            id_program_item (UUID): The unique identifier of the program item.
+            start_time (datetime): Start of the new session.
+            end_time (datetime | None): End of the new session, None to use the required time of the program item.
+            id_location_override (UUID | None): Location overriding the location of the program item.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session is created.
+
+        Returns:
+            Sequence[UUID]: The conflicting sessions ordered by start time.
+        """
+        async with self.ensure_session(session) as session:
+            result = await session.execute(text(
+                """
+                    SELECT
+                        ps.id_program_session
+                    FROM
+                        t_program_item pi
+                    JOIN
+                        t_program_session ps
+                        ON ps.id_location_effective = COALESCE(CAST(:id_location_override AS uuid), pi.id_location)
+                        AND ps.blocked_range && tsrange(
+                            CAST(:start_time AS timestamp) - pi.before_time_buffer,
+                            COALESCE(CAST(:end_time AS timestamp), CAST(:start_time AS timestamp) + pi.required_time) + pi.after_time_buffer
+                        )
+                        AND ps.status <> 'CANCELLED'
+                    WHERE
+                        pi.id_program_item = :id_program_item
+                    ORDER BY ps.start_time
+                """
+            ), {
+                "id_program_item": id_program_item,
+                "id_location_override": id_location_override,
+                "start_time": start_time,
+                "end_time": end_time,
+            })
+            return result.scalars().all()
+
+    async def location_exists(self, event_id: UUID, id_location: UUID, *, session: AsyncSession | None = None) -> bool:
+        """
+        Checks whether a location belongs to an event.
+
+        Args:
+            event_id (UUID): The unique identifier of the event.
+            id_location (UUID): The unique identifier of the location.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session is created.
+
+        Returns:
+            bool: True if the location exists in the event.
+        """
+        async with self.ensure_session(session) as session:
+            result = await session.execute(text(
+                "SELECT EXISTS (SELECT 1 FROM t_location WHERE id_location = :id_location AND id_event = :event_id)"
+            ), {"event_id": event_id, "id_location": id_location})
+            return result.scalar_one()
+
+    async def free_slots(
+        self,
+        event_id: UUID,
+        id_location: UUID,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        min_duration: timedelta = timedelta(0),
+        *,
+        session: AsyncSession | None = None
+    ) -> Sequence[FreeSlotResult]:
+        """
+        Lists the time slots in which a location is not booked by any session.
+
+        The booked ranges (buffers included) overlapping the requested window are found through the GiST
+        index of the exclusion constraint, merged with `range_agg` and subtracted from the window as
+        multiranges, so the gaps come straight from the database.
+
+        Args:
+            event_id (UUID): The unique identifier of the event the location belongs to.
+            id_location (UUID): The unique identifier of the location.
+            start_time (datetime | None): Start of the window, defaults to the first day of the event.
+            end_time (datetime | None): End of the window, defaults to the end of the last day of the event.
+            min_duration (timedelta): Shorter slots are left out.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session is created.
+
+        Returns:
+            Sequence[FreeSlotResult]: The free slots ordered by start time.
+        """
+        async with self.ensure_session(session) as session:
+            result = await session.execute(text(
+                """
+                    SELECT
+                        lower(slot) AS start_time,
+                        upper(slot) AS end_time
+                    FROM (
+                        SELECT
+                            unnest(tsmultirange(bounds.slot_range) - COALESCE(range_agg(ps.blocked_range), '{}'::tsmultirange)) AS slot
+                        FROM (
+                            SELECT
+                                tsrange(
+                                    COALESCE(CAST(:start_time AS timestamp), CAST(e.start_date AS timestamp)),
+                                    COALESCE(CAST(:end_time AS timestamp), CAST(e.end_date + 1 AS timestamp))
+                                ) AS slot_range
+                            FROM
+                                t_location l
+                            JOIN
+                                t_event e USING (id_event)
+                            WHERE
+                                l.id_location = :id_location
+                                AND l.id_event = :event_id
+                        ) bounds
+                        LEFT JOIN
+                            t_program_session ps
+                            ON ps.id_location_effective = :id_location
+                            AND ps.blocked_range && bounds.slot_range
+                            AND ps.status <> 'CANCELLED'
+                        GROUP BY bounds.slot_range
+                    ) slots
+                    WHERE upper(slot) - lower(slot) >= :min_duration
+                    ORDER BY start_time
+                """
+            ), {
+                "event_id": event_id,
+                "id_location": id_location,
+                "start_time": start_time,
+                "end_time": end_time,
+                "min_duration": min_duration,
+            })
+            return [FreeSlotResult(*row) for row in result.all()]
@@ -0,0 +1,237 @@
+from collections.abc import Sequence
+from datetime import datetime, time, timedelta
+from typing import TYPE_CHECKING
+from uuid import UUID, uuid4
+
+from sqlalchemy.ext.asyncio.session import AsyncSession
+
+from service.core import BatchFailureEntity, BatchResponse, ProgramSessionModel, SessionStatus, traced
+
+from .entity import CreateProgramSessionEntity, FreeSlotEntity, GeneratedSessionsEntity, ProgramSessionEntity, RecurrenceEntity
+from .exception import LocationDoubleBookedException, LocationNotFoundException, ProgramItemNotFoundException
+
+if TYPE_CHECKING:
+    from .repository import ProgramSessionRepository, ProgramSessionResult
+
+
+def _since_midnight(value: time) -> timedelta:
+    return timedelta(hours=value.hour, minutes=value.minute, seconds=value.second, microseconds=value.microsecond)
+
+
+def _program_session_entity(row: "ProgramSessionResult") -> ProgramSessionEntity:
+    return ProgramSessionEntity(
+        id_program_session=row.id_program_session,
+        id_program_item=row.id_program_item,
+        id_location_override=row.id_location_override,
+        id_location=row.id_location,
+        start_time=row.start_time,
+        end_time=row.end_time,
+        note=row.note,
+        status=SessionStatus[row.status].value,
+        attendee_limit_override=row.attendee_limit_override,
+        attendee_count=row.attendee_count,
+        created_at=row.created_at
+    )
+
+
+@traced("service")
+class ProgramSessionService:
+    def __init__(self, repository: "ProgramSessionRepository"):
+        self.repository = repository
+
+    async def create_program_session(
+        self,
+        event_id: UUID,
+        program_session: CreateProgramSessionEntity,
+        *,
+        session: AsyncSession | None = None
+    ) -> ProgramSessionEntity:
+        """
+        Schedules a new session of a program item.
+
+        The database refuses sessions that would overlap another session in the same location, the
+        before and after time buffers of both program items included.
+
+        Args:
+            event_id (UUID): The unique identifier of the event.
+            program_session (CreateProgramSessionEntity): The session to create.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session will be created.
+
+        Returns:
+            ProgramSessionEntity: The created session.
+
+        Raises:
+            ProgramItemNotFoundException: If the program item does not exist in the event.
+            LocationDoubleBookedException: If the location is already booked at an overlapping time.
+        """
+        row = await self.repository.create_program_session(
+            event_id,
+            program_session.id_program_item,
+            program_session.start_time,
+            program_session.end_time,
+            program_session.id_location_override,
+            program_session.note,
+            program_session.status.name,
+            program_session.attendee_limit_override,
+            session=session
+        )
+        if row is None:
+            raise ProgramItemNotFoundException(program_session.id_program_item)
+        if session is None:
+            await self.repository.invalidate(event_id)
+        return _program_session_entity(row)
+
+    async def create_program_sessions(
+        self,
+        event_id: UUID,
+        program_sessions: Sequence[CreateProgramSessionEntity],
+        *,
+        session: AsyncSession | None = None
+    ) -> BatchResponse[ProgramSessionEntity]:
+        """
+        Schedules many sessions at once, in one transaction.
+
+        All sessions go in with one insert. Only when that insert double-books a location are the sessions
+        inserted one by one, so that each conflicting session is reported with the sessions it collides with
+        (earlier sessions of the same batch included) and the others are still created.
+
+        Args:
+            event_id (UUID): The unique identifier of the event.
+            program_sessions (Sequence[CreateProgramSessionEntity]): The sessions to create.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session will be created.
+
+        Returns:
+            BatchResponse[ProgramSessionEntity]: The created sessions in the order of the request and the failed ones.
+        """
+        models = [
+            ProgramSessionModel(
+                id_program_session=uuid4(),
+                id_program_item=program_session.id_program_item,
+                id_location_override=program_session.id_location_override,
+                start_time=program_session.start_time,
+                end_time=program_session.end_time,
+                note=program_session.note,
+                status=program_session.status,
+                attendee_limit_override=program_session.attendee_limit_override,
+            )
+            for program_session in program_sessions
+        ]
+        created: dict[int, ProgramSessionEntity] = {}
+        failed: list[BatchFailureEntity] = []
+        owns_transaction = session is None
+        async with self.repository.ensure_session(session) as session:
+            try:
+                rows = await self.repository.create_program_sessions(event_id, models, session=session)
+                positions = {model.id_program_session: index for index, model in enumerate(models)}
+                created = {positions[row.id_program_session]: _program_session_entity(row) for row in rows}
+            except LocationDoubleBookedException:
+                for index, model in enumerate(models):
+                    try:
+                        row = await self.repository.create_program_session(
+                            event_id,
+                            model.id_program_item,  # type: ignore[arg-type]
+                            model.start_time,
+                            model.end_time,
+                            model.id_location_override,
+                            model.note,
+                            model.status.name,
+                            model.attendee_limit_override,
+                            session=session
+                        )
+                    except LocationDoubleBookedException as e:
+                        failed.append(BatchFailureEntity.from_exception(index, "PROGRAM_SESSION_LOCATION_DOUBLE_BOOKED", e))
+                        continue
+                    if row is not None:
+                        created[index] = _program_session_entity(row)
+        if owns_transaction:
+            await self.repository.invalidate(event_id)
+
+        double_booked = {failure.index for failure in failed}
+        for index, model in enumerate(models):
+            if index not in created and index not in double_booked:
+                failed.append(BatchFailureEntity.from_exception(
+                    index, "PROGRAM_SESSION_ITEM_NOT_FOUND", ProgramItemNotFoundException(model.id_program_item)  # type: ignore[arg-type]
+                ))
+        return BatchResponse(created=[created[index] for index in sorted(created)], failed=sorted(failed, key=lambda failure: failure.index))
+
+    async def generate_program_sessions(
+        self,
+        event_id: UUID,
+        recurrence: RecurrenceEntity,
+        *,
+        session: AsyncSession | None = None
+    ) -> GeneratedSessionsEntity:
+        """
+        Creates the sessions of a recurrence on every day of the event, with one insert.
+
+        Sessions which would double-book their location (the before and after time buffers included) are
+        skipped, that includes sessions of the rule itself when `every` is shorter than the required time
+        and the buffers of the program item.
+
+        Args:
+            event_id (UUID): The unique identifier of the event.
+            recurrence (RecurrenceEntity): The rule of the sessions to create.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session will be created.
+
+        Returns:
+            GeneratedSessionsEntity: The created sessions and the number of skipped ones.
+
+        Raises:
+            ProgramItemNotFoundException: If the program item does not exist in the event.
+        """
+        result = await self.repository.generate_program_sessions(
+            event_id,
+            recurrence.id_program_item,
+            _since_midnight(recurrence.day_start),
+            _since_midnight(recurrence.day_end) if recurrence.day_end is not None else timedelta(days=1),
+            recurrence.every,
+            recurrence.id_location_override,
+            recurrence.note,
+            recurrence.status.name,
+            recurrence.attendee_limit_override,
+            session=session
+        )
+        if result is None:
+            raise ProgramItemNotFoundException(recurrence.id_program_item)
+        if session is None:
+            await self.repository.invalidate(event_id)
+        return GeneratedSessionsEntity(
+            created=[_program_session_entity(row) for row in result.sessions],
+            skipped=result.generated - len(result.sessions)
+        )
+
+    async def free_slots(
+        self,
+        event_id: UUID,
+        id_location: UUID,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        min_duration: timedelta = timedelta(0),
+        *,
+        session: AsyncSession | None = None
+    ) -> list[FreeSlotEntity]:
+        """
+        Lists the time slots in which a location is free, by default over the whole event.
+
+        Args:
+            event_id (UUID): The unique identifier of the event.
+            id_location (UUID): The unique identifier of the location.
+            start_time (datetime | None): Start of the window, defaults to the first day of the event.
+            end_time (datetime | None): End of the window, defaults to the end of the last day of the event.
+            min_duration (timedelta): Shorter slots are left out.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session will be created.
+
+        Returns:
+            list[FreeSlotEntity]: The free slots with their duration, ordered by start time.
+
+        Raises:
+            LocationNotFoundException: If the location does not exist in the event.
+        """
+        async with self.repository.ensure_session(session) as session:
+            if not await self.repository.location_exists(event_id, id_location, session=session):
+                raise LocationNotFoundException(id_location)
+            slots = await self.repository.free_slots(event_id, id_location, start_time, end_time, min_duration, session=session)
+            return [
+                FreeSlotEntity(start_time=slot.start_time, end_time=slot.end_time, duration=slot.end_time - slot.start_time)
+                for slot in slots
+            ]
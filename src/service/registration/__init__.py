@@ -0,0 +1,29 @@
+from .entity import CancellationEntity, CreateRegistrationEntity, RegistrationEntity
+from .exception import (
+    AlreadyRegisteredException,
+    AlreadyWaitlistedException,
+    AttendeeNotFoundException,
+    ProgramSessionClosedException,
+    ProgramSessionFullException,
+    ProgramSessionNotFoundException,
+    RegistrationException,
+    RegistrationNotFoundException,
+)
+from .repository import RegistrationRepository
+from .service import RegistrationService
+
+__all__ = [
+    "RegistrationRepository",
+    "RegistrationService",
+    "RegistrationEntity",
+    "CreateRegistrationEntity",
+    "CancellationEntity",
+    "RegistrationException",
+    "ProgramSessionNotFoundException",
+    "AttendeeNotFoundException",
+    "AlreadyRegisteredException",
+    "AlreadyWaitlistedException",
+    "RegistrationNotFoundException",
+    "ProgramSessionClosedException",
+    "ProgramSessionFullException",
+]
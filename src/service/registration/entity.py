@@ -0,0 +1,24 @@
+from datetime import datetime
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class RegistrationEntity(BaseModel):
+    id_attendee: UUID
+    id_program_session: UUID
+    status: Literal["registered", "waitlisted"] = "registered"
+    created_at: datetime | None = None
+    note: str | None = None
+
+
+class CreateRegistrationEntity(BaseModel):
+    id_attendee: UUID
+    note: str | None = Field(default=None, max_length=1024)
+    waitlist: bool = Field(default=True, description="Join the waitlist when the session is full instead of failing")
+
+
+class CancellationEntity(BaseModel):
+    cancelled: RegistrationEntity = Field(description="The cancelled registration or waitlist entry")
+    promoted: RegistrationEntity | None = Field(default=None, description="Attendee promoted from the waitlist to the freed place")
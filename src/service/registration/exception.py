@@ -0,0 +1,40 @@
+from uuid import UUID
+
+
+class RegistrationException(Exception):
+    """Base class for all errors raised while registering attendees into program sessions."""
+
+
+class ProgramSessionNotFoundException(RegistrationException):
+    def __init__(self, id_program_session: UUID) -> None:
+        super().__init__(f"Program session {id_program_session} does not exist in this event")
+
+
+class AttendeeNotFoundException(RegistrationException):
+    def __init__(self, id_attendee: UUID) -> None:
+        super().__init__(f"Attendee {id_attendee} does not exist in this event")
+
+
+class AlreadyRegisteredException(RegistrationException):
+    def __init__(self, id_attendee: UUID, id_program_session: UUID) -> None:
+        super().__init__(f"Attendee {id_attendee} is already registered to program session {id_program_session}")
+
+
+class AlreadyWaitlistedException(RegistrationException):
+    def __init__(self, id_attendee: UUID, id_program_session: UUID) -> None:
+        super().__init__(f"Attendee {id_attendee} is already on the waitlist of program session {id_program_session}")
+
+
+class RegistrationNotFoundException(RegistrationException):
+    def __init__(self, id_attendee: UUID, id_program_session: UUID) -> None:
+        super().__init__(f"Attendee {id_attendee} is neither registered nor waitlisted to program session {id_program_session}")
+
+
+class ProgramSessionClosedException(RegistrationException):
+    def __init__(self, id_program_session: UUID, status: str) -> None:
+        super().__init__(f"Program session {id_program_session} is {status.lower()} and does not accept registrations")
+
+
+class ProgramSessionFullException(RegistrationException):
+    def __init__(self, id_program_session: UUID) -> None:
+        super().__init__(f"Program session {id_program_session} is full")
@@ -0,0 +1,330 @@
+from datetime import datetime
+from typing import NamedTuple
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio.session import AsyncSession
+from sqlmodel import text
+
+from service.core import BaseRepository
+
+
+class RegistrationResult(NamedTuple):
+    id_attendee: UUID
+    id_program_session: UUID
+    created_at: datetime | None
+    note: str | None
+
+
+class WaitlistResult(NamedTuple):
+    id_attendee: UUID
+    id_program_session: UUID
+    position: int
+    created_at: datetime | None
+    note: str | None
+
+
+class RegistrationState(NamedTuple):
+    id_program_session: UUID
+    status: str
+    is_attendee: bool
+    is_registered: bool
+    is_waitlisted: bool
+
+
+class RegistrationRepository(BaseRepository):
+    async def register(
+        self,
+        event_id: UUID,
+        id_program_session: UUID,
+        id_attendee: UUID,
+        note: str | None = None,
+        *,
+        session: AsyncSession | None = None
+    ) -> RegistrationResult | None:
+        """
+        Registers an attendee into a program session if the session still has free capacity.
+
+        The capacity check and the insert run as a single statement. The program session row is locked
+        (`FOR UPDATE`) while the condition is evaluated, so concurrent registrations into the same session
+        are serialized and each of them sees the `attendee_count` committed by the previous one. The effective
+        capacity is `COALESCE(attendee_limit_override, attendee_limit) + attendee_limit_buffer`, a session
+        without any limit accepts everybody.
+
+        Args:
+            event_id (UUID): The unique identifier of the event the session belongs to.
+            id_program_session (UUID): The unique identifier of the program session.
+            id_attendee (UUID): The unique identifier of the attendee, must belong to the same event.
+            note (str | None): Optional note stored with the registration.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session is created.
+
+        Returns:
+            RegistrationResult | None: The created registration, or None when nothing was inserted
+                (the session is full, closed, unknown or the attendee is already registered).
+                Use `registration_state` to find out why.
+        """
+        async with self.ensure_session(session) as session:
+            result = await session.execute(text(
+                """
+                    WITH target AS (
+                        SELECT
+                            ps.id_program_session
+                        FROM
+                            t_program_session ps
+                        JOIN
+                            t_program_item pi USING (id_program_item)
+                        JOIN
+                            t_attendee a ON a.id_attendee = :id_attendee AND a.id_event = pi.id_event
+                        WHERE
+                            ps.id_program_session = :id_program_session
+                            AND pi.id_event = :event_id
+                            AND ps.status NOT IN ('CANCELLED', 'ENDED')
+                            AND (
+                                COALESCE(ps.attendee_limit_override, pi.attendee_limit) IS NULL
+                                OR ps.attendee_count < COALESCE(ps.attendee_limit_override, pi.attendee_limit) + COALESCE(pi.attendee_limit_buffer, 0)
+                            )
+                        FOR UPDATE OF ps
+                    )
+                    INSERT INTO t_attendee_program_session (id_attendee, id_program_session, created_at, note)
+                    SELECT :id_attendee, target.id_program_session, NOW(), :note FROM target
+                    ON CONFLICT DO NOTHING
+                    RETURNING id_attendee, id_program_session, created_at, note
+                """
+            ), {"event_id": event_id, "id_program_session": id_program_session, "id_attendee": id_attendee, "note": note})
+            row = result.fetchone()
+            return RegistrationResult(*row) if row else None
+
+    async def registration_state(
+        self,
+        event_id: UUID,
+        id_program_session: UUID,
+        id_attendee: UUID,
+        *,
+        session: AsyncSession | None = None
+    ) -> RegistrationState | None:
+        """
+        Describes the relation between an attendee and a program session.
+
+        Used on the (rare) failure path of `register` to explain why the registration was refused.
+
+        Args:
+            event_id (UUID): The unique identifier of the event the session belongs to.
+            id_program_session (UUID): The unique identifier of the program session.
+            id_attendee (UUID): The unique identifier of the attendee.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session is created.
+
+        Returns:
+            RegistrationState | None: The state, or None if the session does not exist in the event.
+        """
+        async with self.ensure_session(session) as session:
+            result = await session.execute(text(
+                """
+                    SELECT
+                        ps.id_program_session,
+                        ps.status,
+                        EXISTS (
+                            SELECT 1 FROM t_attendee a WHERE a.id_attendee = :id_attendee AND a.id_event = pi.id_event
+                        ) AS is_attendee,
+                        EXISTS (
+                            SELECT 1 FROM t_attendee_program_session aps
+                            WHERE aps.id_program_session = ps.id_program_session AND aps.id_attendee = :id_attendee
+                        ) AS is_registered,
+                        EXISTS (
+                            SELECT 1 FROM t_program_session_waitlist w
+                            WHERE w.id_program_session = ps.id_program_session AND w.id_attendee = :id_attendee
+                        ) AS is_waitlisted
+                    FROM
+                        t_program_session ps
+                    JOIN
+                        t_program_item pi USING (id_program_item)
+                    WHERE
+                        ps.id_program_session = :id_program_session
+                        AND pi.id_event = :event_id
+                """
+            ), {"event_id": event_id, "id_program_session": id_program_session, "id_attendee": id_attendee})
+            row = result.fetchone()
+            return RegistrationState(*row) if row else None
+
+    async def enqueue(
+        self,
+        event_id: UUID,
+        id_program_session: UUID,
+        id_attendee: UUID,
+        note: str | None = None,
+        *,
+        session: AsyncSession | None = None
+    ) -> WaitlistResult | None:
+        """
+        Appends an attendee to the waitlist of a full program session.
+
+        The program session row is locked the same way as in `register`, so an attendee is only queued while
+        the session is really full. A cancellation racing with the enqueue waits for the lock and promotes the
+        queued attendee afterwards.
+
+        Args:
+            event_id (UUID): The unique identifier of the event the session belongs to.
+            id_program_session (UUID): The unique identifier of the program session.
+            id_attendee (UUID): The unique identifier of the attendee, must belong to the same event.
+            note (str | None): Optional note stored with the waitlist entry and carried over on promotion.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session is created.
+
+        Returns:
+            WaitlistResult | None: The waitlist entry, or None when nothing was queued (the session has free
+                capacity again, is closed, unknown or the attendee is already queued).
+        """
+        async with self.ensure_session(session) as session:
+            result = await session.execute(text(
+                """
+                    WITH target AS (
+                        SELECT
+                            ps.id_program_session
+                        FROM
+                            t_program_session ps
+                        JOIN
+                            t_program_item pi USING (id_program_item)
+                        JOIN
+                            t_attendee a ON a.id_attendee = :id_attendee AND a.id_event = pi.id_event
+                        WHERE
+                            ps.id_program_session = :id_program_session
+                            AND pi.id_event = :event_id
+                            AND ps.status NOT IN ('CANCELLED', 'ENDED')
+                            AND ps.attendee_count >= COALESCE(ps.attendee_limit_override, pi.attendee_limit) + COALESCE(pi.attendee_limit_buffer, 0)
+                        FOR UPDATE OF ps
+                    )
+                    INSERT INTO t_program_session_waitlist (id_attendee, id_program_session, created_at, note)
+                    SELECT :id_attendee, target.id_program_session, NOW(), :note FROM target
+                    ON CONFLICT DO NOTHING
+                    RETURNING id_attendee, id_program_session, position, created_at, note
+                """
+            ), {"event_id": event_id, "id_program_session": id_program_session, "id_attendee": id_attendee, "note": note})
+            row = result.fetchone()
+            return WaitlistResult(*row) if row else None
+
+    async def unregister(
+        self,
+        event_id: UUID,
+        id_program_session: UUID,
+        id_attendee: UUID,
+        *,
+        session: AsyncSession | None = None
+    ) -> RegistrationResult | None:
+        """
+        Removes the registration of an attendee from a program session.
+
+        Deleting the registration fires the attendee counter trigger, which locks the program session row
+        until the transaction ends. Call `promote` in the same transaction to hand the freed place over.
+
+        Args:
+            event_id (UUID): The unique identifier of the event the session belongs to.
+            id_program_session (UUID): The unique identifier of the program session.
+            id_attendee (UUID): The unique identifier of the attendee.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session is created.
+
+        Returns:
+            RegistrationResult | None: The removed registration, or None if the attendee was not registered.
+        """
+        async with self.ensure_session(session) as session:
+            result = await session.execute(text(
+                """
+                    DELETE FROM t_attendee_program_session aps
+                    USING t_program_session ps, t_program_item pi
+                    WHERE
+                        aps.id_program_session = :id_program_session
+                        AND aps.id_attendee = :id_attendee
+                        AND ps.id_program_session = aps.id_program_session
+                        AND pi.id_program_item = ps.id_program_item
+                        AND pi.id_event = :event_id
+                    RETURNING aps.id_attendee, aps.id_program_session, aps.created_at, aps.note
+                """
+            ), {"event_id": event_id, "id_program_session": id_program_session, "id_attendee": id_attendee})
+            row = result.fetchone()
+            return RegistrationResult(*row) if row else None
+
+    async def dequeue(
+        self,
+        event_id: UUID,
+        id_program_session: UUID,
+        id_attendee: UUID,
+        *,
+        session: AsyncSession | None = None
+    ) -> WaitlistResult | None:
+        """
+        Removes an attendee from the waitlist of a program session.
+
+        Args:
+            event_id (UUID): The unique identifier of the event the session belongs to.
+            id_program_session (UUID): The unique identifier of the program session.
+            id_attendee (UUID): The unique identifier of the attendee.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session is created.
+
+        Returns:
+            WaitlistResult | None: The removed waitlist entry, or None if the attendee was not queued.
+        """
+        async with self.ensure_session(session) as session:
+            result = await session.execute(text(
+                """
+                    DELETE FROM t_program_session_waitlist w
+                    USING t_program_session ps, t_program_item pi
+                    WHERE
+                        w.id_program_session = :id_program_session
+                        AND w.id_attendee = :id_attendee
+                        AND ps.id_program_session = w.id_program_session
+                        AND pi.id_program_item = ps.id_program_item
+                        AND pi.id_event = :event_id
+                    RETURNING w.id_attendee, w.id_program_session, w.position, w.created_at, w.note
+                """
+            ), {"event_id": event_id, "id_program_session": id_program_session, "id_attendee": id_attendee})
+            row = result.fetchone()
+            return WaitlistResult(*row) if row else None
+
+    async def promote(self, id_program_session: UUID, *, session: AsyncSession | None = None) -> RegistrationResult | None:
+        """
+        Moves the head of the waitlist into the program session if the session has free capacity.
+
+        The head is found with a single probe of the (id_program_session, position) index, so the cost does
+        not depend on the length of the waitlist. Must run in the transaction which freed the place (see
+        `unregister`), the program session row lock held by it serializes concurrent promotions.
+
+        Args:
+            id_program_session (UUID): The unique identifier of the program session.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session is created.
+
+        Returns:
+            RegistrationResult | None: The registration of the promoted attendee, or None if the waitlist is
+                empty or the session is still full (e.g. its limit was lowered).
+        """
+        async with self.ensure_session(session) as session:
+            result = await session.execute(text(
+                """
+                    WITH head AS (
+                        DELETE FROM t_program_session_waitlist w
+                        USING (
+                            SELECT
+                                q.id_attendee
+                            FROM
+                                t_program_session_waitlist q
+                            JOIN
+                                t_program_session ps USING (id_program_session)
+                            JOIN
+                                t_program_item pi USING (id_program_item)
+                            WHERE
+                                q.id_program_session = :id_program_session
+                                AND ps.status NOT IN ('CANCELLED', 'ENDED')
+                                AND (
+                                    COALESCE(ps.attendee_limit_override, pi.attendee_limit) IS NULL
+                                    OR ps.attendee_count < COALESCE(ps.attendee_limit_override, pi.attendee_limit) + COALESCE(pi.attendee_limit_buffer, 0)
+                                )
+                            ORDER BY q.position ASC
+                            LIMIT 1
+                        ) candidate
+                        WHERE
+                            w.id_program_session = :id_program_session
+                            AND w.id_attendee = candidate.id_attendee
+                        RETURNING w.id_attendee, w.id_program_session, w.note
+                    )
+                    INSERT INTO t_attendee_program_session (id_attendee, id_program_session, created_at, note)
+                    SELECT head.id_attendee, head.id_program_session, NOW(), head.note FROM head
+                    RETURNING id_attendee, id_program_session, created_at, note
+                """
+            ), {"id_program_session": id_program_session})
+            row = result.fetchone()
+            return RegistrationResult(*row) if row else None
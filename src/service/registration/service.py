@@ -0,0 +1,155 @@
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio.session import AsyncSession
+
+from service.core import traced
+
+from .entity import CancellationEntity, CreateRegistrationEntity, RegistrationEntity
+from .exception import (
+    AlreadyRegisteredException,
+    AlreadyWaitlistedException,
+    AttendeeNotFoundException,
+    ProgramSessionClosedException,
+    ProgramSessionFullException,
+    ProgramSessionNotFoundException,
+    RegistrationNotFoundException,
+)
+
+if TYPE_CHECKING:
+    from .repository import RegistrationRepository, RegistrationResult, WaitlistResult
+
+
+def _registration_entity(row: "RegistrationResult") -> RegistrationEntity:
+    return RegistrationEntity(
+        id_attendee=row.id_attendee,
+        id_program_session=row.id_program_session,
+        status="registered",
+        created_at=row.created_at,
+        note=row.note
+    )
+
+
+def _waitlist_entity(row: "WaitlistResult") -> RegistrationEntity:
+    return RegistrationEntity(
+        id_attendee=row.id_attendee,
+        id_program_session=row.id_program_session,
+        status="waitlisted",
+        created_at=row.created_at,
+        note=row.note
+    )
+
+
+@traced("service")
+class RegistrationService:
+    def __init__(self, repository: "RegistrationRepository"):
+        self.repository = repository
+
+    async def register(
+        self,
+        event_id: UUID,
+        id_program_session: UUID,
+        registration: CreateRegistrationEntity,
+        *,
+        session: AsyncSession | None = None
+    ) -> RegistrationEntity:
+        """
+        Registers an attendee into a program session without ever exceeding its capacity.
+
+        When the session is full and `registration.waitlist` is set, the attendee joins the end of the
+        session's waitlist instead and is promoted automatically once somebody cancels.
+
+        Args:
+            event_id (UUID): The unique identifier of the event the session belongs to.
+            id_program_session (UUID): The unique identifier of the program session.
+            registration (CreateRegistrationEntity): The attendee to register.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session will be created.
+
+        Returns:
+            RegistrationEntity: The created registration or waitlist entry (see `status`).
+
+        Raises:
+            ProgramSessionNotFoundException: If the session does not exist in the event.
+            AttendeeNotFoundException: If the attendee does not exist in the event.
+            AlreadyRegisteredException: If the attendee is already registered to the session.
+            AlreadyWaitlistedException: If the attendee is already on the waitlist of the session.
+            ProgramSessionClosedException: If the session is cancelled or ended.
+            ProgramSessionFullException: If the session has no free capacity left and waitlisting was not requested.
+        """
+        async with self.repository.ensure_session(session) as session:
+            row = await self.repository.register(
+                event_id, id_program_session, registration.id_attendee, registration.note, session=session
+            )
+            if row:
+                return _registration_entity(row)
+
+            state = await self.repository.registration_state(
+                event_id, id_program_session, registration.id_attendee, session=session
+            )
+            if state is None:
+                raise ProgramSessionNotFoundException(id_program_session)
+            if not state.is_attendee:
+                raise AttendeeNotFoundException(registration.id_attendee)
+            if state.is_registered:
+                raise AlreadyRegisteredException(registration.id_attendee, id_program_session)
+            if state.is_waitlisted:
+                raise AlreadyWaitlistedException(registration.id_attendee, id_program_session)
+            if state.status in ("CANCELLED", "ENDED"):
+                raise ProgramSessionClosedException(id_program_session, state.status)
+            if not registration.waitlist:
+                raise ProgramSessionFullException(id_program_session)
+
+            queued = await self.repository.enqueue(
+                event_id, id_program_session, registration.id_attendee, registration.note, session=session
+            )
+            if queued:
+                return _waitlist_entity(queued)
+
+            # A place was freed between the two statements. The enqueue matched no row, so it locked nothing,
+            # the retry is safe on its own: `register` locks the session row (FOR UPDATE) and re-checks the
+            # capacity under the lock. When the place is taken again in the meantime, the session is full.
+            row = await self.repository.register(
+                event_id, id_program_session, registration.id_attendee, registration.note, session=session
+            )
+            if row:
+                return _registration_entity(row)
+            raise ProgramSessionFullException(id_program_session)
+
+    async def cancel(
+        self,
+        event_id: UUID,
+        id_program_session: UUID,
+        id_attendee: UUID,
+        *,
+        session: AsyncSession | None = None
+    ) -> CancellationEntity:
+        """
+        Cancels a registration or a waitlist entry of an attendee.
+
+        Cancelling a registration promotes the head of the session's waitlist in the same transaction.
+
+        Args:
+            event_id (UUID): The unique identifier of the event the session belongs to.
+            id_program_session (UUID): The unique identifier of the program session.
+            id_attendee (UUID): The unique identifier of the attendee.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session will be created.
+
+        Returns:
+            CancellationEntity: The cancelled entry and the promoted attendee, if any.
+
+        Raises:
+            RegistrationNotFoundException: If the attendee is neither registered nor waitlisted.
+        """
+        async with self.repository.ensure_session(session) as session:
+            registration = await self.repository.unregister(event_id, id_program_session, id_attendee, session=session)
+            if registration:
+                promoted = await self.repository.promote(id_program_session, session=session)
+                return CancellationEntity(
+                    cancelled=_registration_entity(registration),
+                    promoted=_registration_entity(promoted) if promoted else None
+                )
+
+            queued = await self.repository.dequeue(event_id, id_program_session, id_attendee, session=session)
+            if queued:
+                return CancellationEntity(cancelled=_waitlist_entity(queued))
+            raise RegistrationNotFoundException(id_attendee, id_program_session)
@@ -0,0 +1,18 @@
+from .entity import RegistrationConflictEntity, ScheduleConflictEntity, ScheduledSessionEntity
+from .exception import ScheduledSessionNotFoundException, ScheduleException
+from .interval import Interval, IntervalIndex, overlapping_pairs
+from .repository import ScheduleRepository
+from .service import ScheduleService
+
+__all__ = [
+    "ScheduleRepository",
+    "ScheduleService",
+    "ScheduledSessionEntity",
+    "RegistrationConflictEntity",
+    "ScheduleConflictEntity",
+    "ScheduleException",
+    "ScheduledSessionNotFoundException",
+    "Interval",
+    "IntervalIndex",
+    "overlapping_pairs",
+]
@@ -0,0 +1,26 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class ScheduledSessionEntity(BaseModel):
+    id_program_session: UUID
+    id_program_item: UUID
+    name: str
+    start_time: datetime
+    end_time: datetime
+    blocked_from: datetime = Field(description="Start time minus the before time buffer of the program item")
+    blocked_until: datetime = Field(description="End time plus the after time buffer of the program item")
+
+
+class RegistrationConflictEntity(BaseModel):
+    id_attendee: UUID
+    session: ScheduledSessionEntity = Field(description="The session the attendee wants to register to")
+    conflicts: list[ScheduledSessionEntity] = Field(description="Registered sessions overlapping it, empty when there is no conflict")
+
+
+class ScheduleConflictEntity(BaseModel):
+    id_attendee: UUID
+    first: ScheduledSessionEntity
+    second: ScheduledSessionEntity
@@ -0,0 +1,10 @@
+from uuid import UUID
+
+
+class ScheduleException(Exception):
+    """Base class for all errors raised while checking attendee schedules."""
+
+
+class ScheduledSessionNotFoundException(ScheduleException):
+    def __init__(self, id_program_session: UUID) -> None:
+        super().__init__(f"Program session {id_program_session} does not exist in this event")
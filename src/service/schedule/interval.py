@@ -0,0 +1,82 @@
+import heapq
+from bisect import bisect_left
+from collections.abc import Hashable, Iterable, Iterator
+from datetime import datetime
+from itertools import accumulate
+from typing import NamedTuple
+
+
+class Interval[KeyType: Hashable](NamedTuple):
+    """A half-open time interval `[start, end)` identified by `key`."""
+    start: datetime
+    end: datetime
+    key: KeyType
+
+    def overlaps(self, other: "Interval") -> bool:
+        return self.start < other.end and other.start < self.end
+
+
+class IntervalIndex[KeyType: Hashable]:
+    """
+    Static index of intervals answering "does anything overlap [start, end)" in O(log n).
+
+    Intervals are kept sorted by start together with a running maximum of their ends. Only intervals
+    starting before `end` can overlap, they form a prefix found by binary search, and something overlaps
+    exactly when the maximum end of that prefix is after `start`.
+
+    Listing the overlapping intervals walks the prefix backwards until the running maximum end is not
+    after `start`. That is O(log n + k) for intervals of similar length, but one long interval early on
+    keeps the maximum high and makes the walk O(n), so check `has_overlap` first when overlaps are rare.
+
+    Building the index sorts the intervals, O(n) when they come sorted by start already, O(n log n) otherwise.
+    """
+
+    def __init__(self, intervals: Iterable[Interval[KeyType]] = ()) -> None:
+        self._intervals: list[Interval[KeyType]] = sorted(intervals)
+        self._starts = [interval.start for interval in self._intervals]
+        self._max_ends = list(accumulate((interval.end for interval in self._intervals), max))
+
+    def __len__(self) -> int:
+        return len(self._intervals)
+
+    def __iter__(self) -> Iterator[Interval[KeyType]]:
+        return iter(self._intervals)
+
+    def has_overlap(self, start: datetime, end: datetime) -> bool:
+        """Returns whether any interval overlaps `[start, end)` in O(log n)."""
+        candidates = bisect_left(self._starts, end)
+        return candidates > 0 and self._max_ends[candidates - 1] > start
+
+    def overlapping(self, start: datetime, end: datetime) -> list[Interval[KeyType]]:
+        """Returns all intervals overlapping `[start, end)` ordered by start, O(n) in the worst case (see the class)."""
+        found = []
+        i = bisect_left(self._starts, end) - 1
+        while i >= 0 and self._max_ends[i] > start:
+            if self._intervals[i].end > start:
+                found.append(self._intervals[i])
+            i -= 1
+        found.reverse()
+        return found
+
+
+def overlapping_pairs[KeyType: Hashable](intervals: Iterable[Interval[KeyType]]) -> Iterator[tuple[Interval[KeyType], Interval[KeyType]]]:
+    """
+    Yields every pair of overlapping intervals with a sweep line in O(n log n + k).
+
+    Intervals are visited by start while a heap keeps the active ones ordered by end. Before an interval
+    is visited, all active intervals which ended at or before its start are dropped; everything left
+    overlaps it. The earlier starting interval is the first element of each pair, pairs are not sorted otherwise.
+
+    Args:
+        intervals (Iterable[Interval]): Intervals in any order.
+
+    Yields:
+        tuple[Interval, Interval]: The overlapping pairs.
+    """
+    active: list[tuple[datetime, int, Interval[KeyType]]] = []
+    for sequence, interval in enumerate(sorted(intervals)):
+        while active and active[0][0] <= interval.start:
+            heapq.heappop(active)
+        for _, _, other in active:
+            yield other, interval
+        heapq.heappush(active, (interval.end, sequence, interval))
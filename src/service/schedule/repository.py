@@ -0,0 +1,120 @@
+from collections.abc import Sequence
+from datetime import datetime
+from typing import NamedTuple
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio.session import AsyncSession
+from sqlmodel import text
+
+from service.core import BaseRepository
+
+
+# Time an attendee spends on a session: the session itself plus the item's before/after buffers.
+# Sessions without an explicit end take `required_time` of their program item.
+class ScheduledSessionResult(NamedTuple):
+    id_program_session: UUID
+    id_program_item: UUID
+    name: str
+    start_time: datetime
+    end_time: datetime
+    blocked_from: datetime
+    blocked_until: datetime
+
+
+class AttendeeSessionResult(NamedTuple):
+    id_attendee: UUID
+    id_program_session: UUID
+    id_program_item: UUID
+    name: str
+    start_time: datetime
+    end_time: datetime
+    blocked_from: datetime
+    blocked_until: datetime
+
+
+class ScheduleRepository(BaseRepository):
+    async def get_scheduled_session(
+        self,
+        event_id: UUID,
+        id_program_session: UUID,
+        *,
+        session: AsyncSession | None = None
+    ) -> ScheduledSessionResult | None:
+        """
+        Returns a program session of an event with the time span it blocks in an attendee's schedule.
+
+        Args:
+            event_id (UUID): The unique identifier of the event.
+            id_program_session (UUID): The unique identifier of the program session.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session is created.
+
+        Returns:
+            ScheduledSessionResult | None: The session, or None if it does not exist in the event.
+        """
+        async with self.ensure_session(session) as session:
+            result = await session.execute(text(
+                """
+                    SELECT
+                        ps.id_program_session,
+                        pi.id_program_item,
+                        pi.name,
+                        ps.start_time,
+                        COALESCE(ps.end_time, ps.start_time + pi.required_time) AS end_time,
+                        ps.start_time - pi.before_time_buffer AS blocked_from,
+                        COALESCE(ps.end_time, ps.start_time + pi.required_time) + pi.after_time_buffer AS blocked_until
+                    FROM
+                        t_program_session ps
+                    JOIN
+                        t_program_item pi USING (id_program_item)
+                    WHERE
+                        ps.id_program_session = :id_program_session
+                        AND pi.id_event = :event_id
+                """
+            ), {"event_id": event_id, "id_program_session": id_program_session})
+            row = result.first()
+            return ScheduledSessionResult(*row) if row else None
+
+    async def list_attendee_sessions(
+        self,
+        event_id: UUID,
+        id_attendee: UUID | None = None,
+        *,
+        session: AsyncSession | None = None
+    ) -> Sequence[AttendeeSessionResult]:
+        """
+        Lists the registrations of an event with the time span each one blocks, cancelled sessions are left out.
+
+        Args:
+            event_id (UUID): The unique identifier of the event.
+            id_attendee (UUID | None): Only list the registrations of this attendee.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session is created.
+
+        Returns:
+            Sequence[AttendeeSessionResult]: The registrations ordered by attendee and blocked start.
+        """
+        async with self.ensure_session(session) as session:
+            result = await session.execute(text(
+                """
+                    SELECT
+                        aps.id_attendee,
+                        ps.id_program_session,
+                        pi.id_program_item,
+                        pi.name,
+                        ps.start_time,
+                        COALESCE(ps.end_time, ps.start_time + pi.required_time) AS end_time,
+                        ps.start_time - pi.before_time_buffer AS blocked_from,
+                        COALESCE(ps.end_time, ps.start_time + pi.required_time) + pi.after_time_buffer AS blocked_until
+                    FROM
+                        t_attendee_program_session aps
+                    JOIN
+                        t_program_session ps USING (id_program_session)
+                    JOIN
+                        t_program_item pi USING (id_program_item)
+                    WHERE
+                        pi.id_event = :event_id
+                        AND ps.status <> 'CANCELLED'
+                        AND (CAST(:id_attendee AS uuid) IS NULL OR aps.id_attendee = :id_attendee)
+                    ORDER BY aps.id_attendee, blocked_from
+                """
+            ), {"event_id": event_id, "id_attendee": id_attendee})
+            return [AttendeeSessionResult(*row) for row in result.all()]
@@ -0,0 +1,115 @@
+from collections.abc import Iterable
+from itertools import groupby
+from operator import attrgetter
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio.session import AsyncSession
+
+from service.core import traced
+
+from .entity import RegistrationConflictEntity, ScheduleConflictEntity, ScheduledSessionEntity
+from .exception import ScheduledSessionNotFoundException
+from .interval import Interval, IntervalIndex, overlapping_pairs
+
+if TYPE_CHECKING:
+    from .repository import AttendeeSessionResult, ScheduledSessionResult, ScheduleRepository
+
+
+def _scheduled_session_entity(row: "ScheduledSessionResult | AttendeeSessionResult") -> ScheduledSessionEntity:
+    return ScheduledSessionEntity(
+        id_program_session=row.id_program_session,
+        id_program_item=row.id_program_item,
+        name=row.name,
+        start_time=row.start_time,
+        end_time=row.end_time,
+        blocked_from=row.blocked_from,
+        blocked_until=row.blocked_until
+    )
+
+
+def _intervals(rows: Iterable["AttendeeSessionResult"]) -> list[Interval[UUID]]:
+    return [Interval(row.blocked_from, row.blocked_until, row.id_program_session) for row in rows]
+
+
+@traced("service")
+class ScheduleService:
+    def __init__(self, repository: "ScheduleRepository"):
+        self.repository = repository
+
+    async def check_registration(
+        self,
+        event_id: UUID,
+        id_program_session: UUID,
+        id_attendee: UUID,
+        *,
+        session: AsyncSession | None = None
+    ) -> RegistrationConflictEntity:
+        """
+        Finds the registered sessions of an attendee that would overlap a new registration.
+
+        Sessions overlap when their blocked time spans (the session widened by the before and after time
+        buffers of its program item) intersect. The attendee's sessions come sorted by their blocked start,
+        so the `IntervalIndex` is built from them in O(n) and tells in O(log n) whether anything overlaps;
+        the conflicting sessions are only collected when something does.
+
+        Args:
+            event_id (UUID): The unique identifier of the event.
+            id_program_session (UUID): The program session the attendee wants to register to.
+            id_attendee (UUID): The unique identifier of the attendee.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session will be created.
+
+        Returns:
+            RegistrationConflictEntity: The checked session and the conflicting ones.
+
+        Raises:
+            ScheduledSessionNotFoundException: If the program session does not exist in the event.
+        """
+        async with self.repository.ensure_session(session) as session:
+            target = await self.repository.get_scheduled_session(event_id, id_program_session, session=session)
+            if target is None:
+                raise ScheduledSessionNotFoundException(id_program_session)
+            registered = {
+                row.id_program_session: row
+                for row in await self.repository.list_attendee_sessions(event_id, id_attendee, session=session)
+                if row.id_program_session != id_program_session
+            }
+
+        index = IntervalIndex(_intervals(registered.values()))
+        conflicts = []
+        if index.has_overlap(target.blocked_from, target.blocked_until):
+            conflicts = [
+                _scheduled_session_entity(registered[interval.key])
+                for interval in index.overlapping(target.blocked_from, target.blocked_until)
+            ]
+        return RegistrationConflictEntity(id_attendee=id_attendee, session=_scheduled_session_entity(target), conflicts=conflicts)
+
+    async def list_conflicts(self, event_id: UUID, *, session: AsyncSession | None = None) -> list[ScheduleConflictEntity]:
+        """
+        Reports every pair of overlapping registrations of every attendee of an event.
+
+        Registrations come ordered by attendee, each attendee's sessions are swept with `overlapping_pairs`,
+        so the whole event is checked in O(n log n + k) instead of comparing all pairs.
+
+        Args:
+            event_id (UUID): The unique identifier of the event.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session will be created.
+
+        Returns:
+            list[ScheduleConflictEntity]: The conflicting pairs ordered by attendee and start of the first session.
+        """
+        rows = await self.repository.list_attendee_sessions(event_id, session=session)
+
+        conflicts = []
+        for id_attendee, attendee_rows in groupby(rows, key=attrgetter("id_attendee")):
+            sessions = {row.id_program_session: row for row in attendee_rows}
+            pairs = sorted(overlapping_pairs(_intervals(sessions.values())))
+            conflicts.extend(
+                ScheduleConflictEntity(
+                    id_attendee=id_attendee,
+                    first=_scheduled_session_entity(sessions[first.key]),
+                    second=_scheduled_session_entity(sessions[second.key])
+                )
+                for first, second in pairs
+            )
+        return conflicts
@@ -0,0 +1,31 @@
+from .entity import SolverApplyEntity, SolverJobEntity, SolverRequestEntity, SolverResultEntity, SolverSessionEntity
+from .exception import (
+    SolverEventNotFoundException,
+    SolverException,
+    SolverJobNotFoundException,
+    SolverJobStateException,
+    SolverLayoutOutdatedException,
+)
+from .repository import SolverRepository
+from .service import SolverService
+from .solver import PlacedSession, Solution, SolverItem, SolverWindow, solve
+
+__all__ = [
+    "SolverRepository",
+    "SolverService",
+    "SolverRequestEntity",
+    "SolverJobEntity",
+    "SolverResultEntity",
+    "SolverSessionEntity",
+    "SolverApplyEntity",
+    "SolverException",
+    "SolverEventNotFoundException",
+    "SolverJobNotFoundException",
+    "SolverJobStateException",
+    "SolverLayoutOutdatedException",
+    "SolverItem",
+    "SolverWindow",
+    "PlacedSession",
+    "Solution",
+    "solve",
+]
@@ -0,0 +1,50 @@
+from datetime import datetime, time, timedelta
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel, Field, model_validator
+
+SolverJobStatus = Literal["pending", "running", "done", "failed", "applied"]
+
+
+class SolverRequestEntity(BaseModel):
+    day_start: time = Field(default=time(9, 0), description="Opening time of the locations on every day of the event")
+    day_end: time = Field(default=time(21, 0), description="Closing time of the locations on every day of the event")
+    time_limit: float = Field(default=2.0, gt=0, le=60, description="Seconds the local search may spend improving the greedy layout")
+    seed: int | None = Field(default=None, description="Seed of the local search, for reproducible layouts")
+
+    @model_validator(mode="after")
+    def check_opening_hours(self) -> "SolverRequestEntity":
+        if self.day_end <= self.day_start:
+            raise ValueError("day_end must be after day_start")
+        return self
+
+
+class SolverSessionEntity(BaseModel):
+    id_program_item: UUID
+    id_location: UUID
+    start_time: datetime
+    end_time: datetime
+
+
+class SolverResultEntity(BaseModel):
+    sessions: list[SolverSessionEntity]
+    unplaced: list[UUID] = Field(description="Program items which did not fit into any free location window")
+    idle_time: timedelta = Field(description="Unused time left in the location windows that received sessions")
+    iterations: int = Field(description="Number of local search iterations")
+    elapsed: float = Field(description="Duration of the solver run in seconds")
+
+
+class SolverJobEntity(BaseModel):
+    id_job: UUID
+    id_event: UUID
+    status: SolverJobStatus
+    progress: float = Field(default=0.0, description="Completed fraction of the job, 0 to 1")
+    created_at: datetime
+    finished_at: datetime | None = None
+    result: SolverResultEntity | None = None
+    error: str | None = None
+
+
+class SolverApplyEntity(BaseModel):
+    created: int = Field(description="Number of created draft sessions")
@@ -0,0 +1,25 @@
+from uuid import UUID
+
+
+class SolverException(Exception):
+    """Base class for all errors raised by the schedule solver."""
+
+
+class SolverEventNotFoundException(SolverException):
+    def __init__(self, event_id: UUID) -> None:
+        super().__init__(f"Event {event_id} does not exist")
+
+
+class SolverJobNotFoundException(SolverException):
+    def __init__(self, id_job: UUID) -> None:
+        super().__init__(f"Solver job {id_job} does not exist in this event, it may have expired")
+
+
+class SolverJobStateException(SolverException):
+    def __init__(self, id_job: UUID, status: str) -> None:
+        super().__init__(f"Solver job {id_job} is {status}, only finished jobs can be applied")
+
+
+class SolverLayoutOutdatedException(SolverException):
+    def __init__(self, id_job: UUID) -> None:
+        super().__init__(f"The layout of solver job {id_job} collides with sessions scheduled since, run the solver again")
@@ -0,0 +1,188 @@
+from collections.abc import Sequence
+from datetime import date, datetime
+from typing import NamedTuple
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio.session import AsyncSession
+from sqlmodel import text
+
+from service.core import BaseRepository
+
+from .solver import PlacedSession, SolverItem, SolverWindow
+
+
+class SolverEventResult(NamedTuple):
+    id_event: UUID
+    start_date: date
+    end_date: date
+
+
+class SolverRepository(BaseRepository):
+    async def get_event(self, event_id: UUID, *, session: AsyncSession | None = None) -> SolverEventResult | None:
+        """
+        Retrieves the dates of an event.
+
+        Args:
+            event_id (UUID): The unique identifier of the event.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session is created.
+
+        Returns:
+            SolverEventResult | None: The event and its first and last day, or None if it does not exist.
+        """
+        async with self.ensure_session(session) as session:
+            result = await session.execute(
+                text("SELECT id_event, start_date, end_date FROM t_event WHERE id_event = :event_id"),
+                {"event_id": event_id}
+            )
+            row = result.first()
+            return SolverEventResult(*row) if row else None
+
+    async def list_unscheduled_items(self, event_id: UUID, *, session: AsyncSession | None = None) -> Sequence[SolverItem]:
+        """
+        Lists the program items of an event which have no session yet, cancelled sessions do not count.
+
+        Args:
+            event_id (UUID): The unique identifier of the event.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session is created.
+
+        Returns:
+            Sequence[SolverItem]: The items to be placed by the solver.
+        """
+        async with self.ensure_session(session) as session:
+            result = await session.execute(text(
+                """
+                    SELECT
+                        pi.id_program_item,
+                        pi.required_time,
+                        pi.before_time_buffer,
+                        pi.after_time_buffer,
+                        pi.id_location,
+                        pi.attendee_limit
+                    FROM
+                        t_program_item pi
+                    WHERE
+                        pi.id_event = :event_id
+                        AND NOT EXISTS (
+                            SELECT 1 FROM t_program_session ps
+                            WHERE ps.id_program_item = pi.id_program_item AND ps.status <> 'CANCELLED'
+                        )
+                    ORDER BY pi.id_program_item
+                """
+            ), {"event_id": event_id})
+            return [SolverItem(*row) for row in result.all()]
+
+    async def list_free_windows(
+        self,
+        event_id: UUID,
+        days: Sequence[tuple[datetime, datetime]],
+        *,
+        session: AsyncSession | None = None
+    ) -> Sequence[SolverWindow]:
+        """
+        Lists the free time of every location of an event within the given opening hours.
+
+        Each opening window of each location is reduced by the blocked ranges of the sessions already
+        scheduled there (found through the location exclusion constraint's GiST index), the remaining
+        pieces are returned as separate windows.
+
+        Args:
+            event_id (UUID): The unique identifier of the event.
+            days (Sequence[tuple[datetime, datetime]]): The opening hours, start and end of each day.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session is created.
+
+        Returns:
+            Sequence[SolverWindow]: Free windows ordered by location and start.
+        """
+        async with self.ensure_session(session) as session:
+            result = await session.execute(text(
+                """
+                    SELECT
+                        windows.id_location,
+                        lower(windows.slot) AS start_time,
+                        upper(windows.slot) AS end_time
+                    FROM (
+                        SELECT
+                            l.id_location,
+                            unnest(
+                                tsmultirange(tsrange(d.day_start, d.day_end))
+                                - COALESCE(range_agg(ps.blocked_range), '{}'::tsmultirange)
+                            ) AS slot
+                        FROM
+                            t_location l
+                        CROSS JOIN
+                            unnest(CAST(:day_starts AS timestamp[]), CAST(:day_ends AS timestamp[])) AS d(day_start, day_end)
+                        LEFT JOIN
+                            t_program_session ps
+                            ON ps.id_location_effective = l.id_location
+                            AND ps.blocked_range && tsrange(d.day_start, d.day_end)
+                            AND ps.status <> 'CANCELLED'
+                        WHERE
+                            l.id_event = :event_id
+                        GROUP BY l.id_location, d.day_start, d.day_end
+                    ) windows
+                    ORDER BY windows.id_location, start_time
+                """
+            ), {
+                "event_id": event_id,
+                "day_starts": [start for start, _ in days],
+                "day_ends": [end for _, end in days],
+            })
+            return [SolverWindow(*row) for row in result.all()]
+
+    async def create_sessions(
+        self,
+        event_id: UUID,
+        sessions: Sequence[PlacedSession],
+        *,
+        session: AsyncSession | None = None
+    ) -> int:
+        """
+        Inserts solved sessions as drafts in a single statement.
+
+        The location is stored as an override only when it differs from the location of the program item.
+
+        Args:
+            event_id (UUID): The unique identifier of the event.
+            sessions (Sequence[PlacedSession]): The sessions to create.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session is created.
+
+        Returns:
+            int: Number of created sessions.
+
+        Raises:
+            IntegrityError: If a location got booked in the meantime (exclusion violation).
+        """
+        async with self.ensure_session(session) as session:
+            result = await session.execute(text(
+                """
+                    INSERT INTO t_program_session (
+                        id_program_session, id_program_item, id_location_override, start_time, end_time, status, attendee_count
+                    )
+                    SELECT
+                        gen_random_uuid(),
+                        s.id_program_item,
+                        CASE WHEN pi.id_location IS DISTINCT FROM s.id_location THEN s.id_location END,
+                        s.start_time,
+                        s.end_time,
+                        'DRAFT',
+                        0
+                    FROM
+                        unnest(
+                            CAST(:id_program_items AS uuid[]),
+                            CAST(:id_locations AS uuid[]),
+                            CAST(:start_times AS timestamp[]),
+                            CAST(:end_times AS timestamp[])
+                        ) AS s(id_program_item, id_location, start_time, end_time)
+                    JOIN
+                        t_program_item pi USING (id_program_item)
+                    WHERE
+                        pi.id_event = :event_id
+                """
+            ), {
+                "event_id": event_id,
+                "id_program_items": [placed.id_program_item for placed in sessions],
+                "id_locations": [placed.id_location for placed in sessions],
+                "start_times": [placed.start_time for placed in sessions],
+                "end_times": [placed.end_time for placed in sessions],
+            })
+            return result.rowcount
@@ -0,0 +1,145 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+from uuid import UUID, uuid4
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio.session import AsyncSession
+
+from service.core import is_exclusion_violation, traced
+
+from .entity import SolverApplyEntity, SolverJobEntity, SolverRequestEntity, SolverResultEntity, SolverSessionEntity
+from .exception import SolverEventNotFoundException, SolverJobNotFoundException, SolverJobStateException, SolverLayoutOutdatedException
+from .solver import PlacedSession, solve
+
+if TYPE_CHECKING:
+    from .repository import SolverEventResult, SolverRepository
+
+logger = logging.getLogger("service.solver")
+
+
+@traced("service")
+class SolverService:
+    """
+    Runs the schedule solver as background jobs.
+
+    Jobs live in the memory of the process which started them, only the last `max_jobs` are kept.
+    """
+    max_jobs = 32
+
+    def __init__(self, repository: "SolverRepository"):
+        self.repository = repository
+        self._jobs: dict[UUID, SolverJobEntity] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def start_job(self, event_id: UUID, request: SolverRequestEntity) -> SolverJobEntity:
+        """
+        Starts laying out the unscheduled program items of an event in the background.
+
+        Args:
+            event_id (UUID): The unique identifier of the event.
+            request (SolverRequestEntity): Opening hours of the locations and solver limits.
+
+        Returns:
+            SolverJobEntity: The pending job, poll `get_job` for its progress and result.
+
+        Raises:
+            SolverEventNotFoundException: If the event does not exist.
+        """
+        event = await self.repository.get_event(event_id)
+        if event is None:
+            raise SolverEventNotFoundException(event_id)
+
+        job = SolverJobEntity(id_job=uuid4(), id_event=event_id, status="pending", created_at=datetime.now())
+        self._jobs[job.id_job] = job
+        while len(self._jobs) > self.max_jobs:
+            del self._jobs[next(iter(self._jobs))]
+
+        task = asyncio.create_task(self._run(job, event, request))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job
+
+    async def _run(self, job: SolverJobEntity, event: "SolverEventResult", request: SolverRequestEntity) -> None:
+        def report(progress: float) -> None:
+            job.progress = round(progress, 3)
+
+        job.status = "running"
+        started = time.perf_counter()
+        try:
+            days = [
+                (datetime.combine(event.start_date + timedelta(days=day), request.day_start),
+                 datetime.combine(event.start_date + timedelta(days=day), request.day_end))
+                for day in range((event.end_date - event.start_date).days + 1)
+            ]
+            async with self.repository.ensure_session() as session:
+                items = await self.repository.list_unscheduled_items(event.id_event, session=session)
+                windows = await self.repository.list_free_windows(event.id_event, days, session=session)
+            # The solver is CPU bound, keep the event loop responsive.
+            solution = await asyncio.to_thread(
+                solve, items, windows, time_limit=request.time_limit, seed=request.seed, progress=report
+            )
+            job.result = SolverResultEntity(
+                sessions=[SolverSessionEntity(**placed._asdict()) for placed in solution.sessions],
+                unplaced=solution.unplaced,
+                idle_time=solution.idle_time,
+                iterations=solution.iterations,
+                elapsed=time.perf_counter() - started
+            )
+            job.status = "done"
+            logger.info(
+                f"Solver job {job.id_job} placed {len(solution.sessions)} of {len(items)} program items "
+                f"into {len(windows)} windows in {job.result.elapsed:.2f} s"
+            )
+        except Exception as e:
+            logger.exception(f"Solver job {job.id_job} failed")
+            job.status = "failed"
+            job.error = str(e)
+        finally:
+            job.finished_at = datetime.now()
+
+    def get_job(self, event_id: UUID, id_job: UUID) -> SolverJobEntity:
+        """
+        Returns a solver job of an event.
+
+        Raises:
+            SolverJobNotFoundException: If the job does not exist in this process or belongs to another event.
+        """
+        job = self._jobs.get(id_job)
+        if job is None or job.id_event != event_id:
+            raise SolverJobNotFoundException(id_job)
+        return job
+
+    async def apply_job(self, event_id: UUID, id_job: UUID, *, session: AsyncSession | None = None) -> SolverApplyEntity:
+        """
+        Creates the sessions laid out by a finished solver job as drafts.
+
+        Args:
+            event_id (UUID): The unique identifier of the event.
+            id_job (UUID): The unique identifier of the solver job.
+            session (AsyncSession, optional): An optional SQLAlchemy asynchronous session. If not provided, a new session will be created.
+
+        Returns:
+            SolverApplyEntity: Number of created sessions.
+
+        Raises:
+            SolverJobNotFoundException: If the job does not exist.
+            SolverJobStateException: If the job has not finished successfully or was applied already.
+            SolverLayoutOutdatedException: If a location got booked since the job ran.
+        """
+        job = self.get_job(event_id, id_job)
+        if job.status != "done" or job.result is None:
+            raise SolverJobStateException(id_job, job.status)
+        sessions = [PlacedSession(**placed.model_dump()) for placed in job.result.sessions]
+        try:
+            created = await self.repository.create_sessions(event_id, sessions, session=session)
+        except IntegrityError as e:
+            if not is_exclusion_violation(e):
+                raise
+            raise SolverLayoutOutdatedException(id_job) from e
+        if session is None:
+            await self.repository.invalidate(event_id)
+        job.status = "applied"
+        return SolverApplyEntity(created=created)
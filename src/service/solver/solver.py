@@ -0,0 +1,264 @@
+import random
+import time
+from collections.abc import Callable, Sequence
+from datetime import datetime, timedelta
+from typing import NamedTuple
+from uuid import UUID
+
+type ProgressCallback = Callable[[float], None]
+
+
+class SolverItem(NamedTuple):
+    id_program_item: UUID
+    required_time: timedelta
+    before_time_buffer: timedelta
+    after_time_buffer: timedelta
+    id_location: UUID | None = None
+    attendee_limit: int | None = None
+
+    @property
+    def blocked_time(self) -> timedelta:
+        """The time the item blocks its location, buffers included."""
+        return self.before_time_buffer + self.required_time + self.after_time_buffer
+
+
+class SolverWindow(NamedTuple):
+    """A free stretch of time in one location, e.g. one day minus the sessions already scheduled there."""
+    id_location: UUID
+    start: datetime
+    end: datetime
+
+
+class PlacedSession(NamedTuple):
+    id_program_item: UUID
+    id_location: UUID
+    start_time: datetime
+    end_time: datetime
+
+
+class Solution(NamedTuple):
+    sessions: list[PlacedSession]
+    unplaced: list[UUID]
+    idle_time: timedelta
+    iterations: int
+
+
+class _State:
+    """
+    Assignment of items to windows, all times in whole seconds.
+
+    Items placed into a window are laid out back to back from its start, so a window only needs its load;
+    the idle time of a used window is the unused tail.
+    """
+
+    def __init__(self, items: Sequence[SolverItem], windows: Sequence[SolverWindow]) -> None:
+        self.durations = [int(item.blocked_time.total_seconds()) for item in items]
+        self.capacity = [int((window.end - window.start).total_seconds()) for window in windows]
+        self.allowed = [
+            [
+                w for w, window in enumerate(windows)
+                if self.capacity[w] >= self.durations[i] and (item.id_location is None or item.id_location == window.id_location)
+            ]
+            for i, item in enumerate(items)
+        ]
+        self.allowed_sets = [set(allowed) for allowed in self.allowed]
+        self.load = [0] * len(windows)
+        self.members: list[list[int]] = [[] for _ in windows]
+        self.assignment = [-1] * len(items)
+        self.unplaced = list(range(len(items)))
+        self._unplaced_position = {i: i for i in self.unplaced}
+
+    def fits(self, i: int, w: int, freed: int = 0) -> bool:
+        return w in self.allowed_sets[i] and self.load[w] - freed + self.durations[i] <= self.capacity[w]
+
+    def place(self, i: int, w: int) -> None:
+        position = self._unplaced_position.pop(i)
+        last = self.unplaced.pop()
+        if last != i:
+            self.unplaced[position] = last
+            self._unplaced_position[last] = position
+        self.assignment[i] = w
+        self.load[w] += self.durations[i]
+        self.members[w].append(i)
+
+    def unplace(self, i: int) -> None:
+        w = self.assignment[i]
+        self.assignment[i] = -1
+        self.load[w] -= self.durations[i]
+        self.members[w].remove(i)
+        self._unplaced_position[i] = len(self.unplaced)
+        self.unplaced.append(i)
+
+    def move(self, i: int, w: int) -> None:
+        self.unplace(i)
+        self.place(i, w)
+
+    def best_fit(self, i: int) -> int | None:
+        """Returns the allowed window with the least room left after placing the item, or None."""
+        best, best_rest = None, None
+        for w in self.allowed[i]:
+            rest = self.capacity[w] - self.load[w] - self.durations[i]
+            if rest >= 0 and (best_rest is None or rest < best_rest):
+                best, best_rest = w, rest
+        return best
+
+
+def _greedy(state: _State, items: Sequence[SolverItem]) -> None:
+    # Best fit decreasing: long items first (larger capacity first on ties), each into the fullest window it fits.
+    order = sorted(range(len(items)), key=lambda i: (-state.durations[i], -(items[i].attendee_limit or 0), i))
+    for i in order:
+        w = state.best_fit(i)
+        if w is not None:
+            state.place(i, w)
+
+
+def _evict(state: _State, u: int, windows: Sequence[int]) -> bool:
+    """Places an unplaced item by moving an item of one of the windows into another window."""
+    for w in windows:
+        for j in state.members[w]:
+            if not state.fits(u, w, freed=state.durations[j]):
+                continue
+            for other in state.allowed[j]:
+                if other != w and state.fits(j, other):
+                    state.move(j, other)
+                    state.place(u, w)
+                    return True
+    return False
+
+
+def _exchange(state: _State, u: int, windows: Sequence[int]) -> bool:
+    """Places an unplaced item instead of a shorter one, which is then placed elsewhere if possible."""
+    for w in windows:
+        for j in state.members[w]:
+            if state.durations[j] < state.durations[u] and state.fits(u, w, freed=state.durations[j]):
+                state.unplace(j)
+                state.place(u, w)
+                other = state.best_fit(j)
+                if other is not None:
+                    state.place(j, other)
+                return True
+    return False
+
+
+def _improve_unplaced(state: _State, rng: random.Random) -> bool:
+    """
+    Tries to place a randomly chosen unplaced item.
+
+    The item goes into its best fitting window directly, otherwise another item is moved out of its way
+    (`_evict`) or exchanged for it (`_exchange`).
+    """
+    u = rng.choice(state.unplaced)
+    w = state.best_fit(u)
+    if w is not None:
+        state.place(u, w)
+        return True
+    windows = rng.sample(state.allowed[u], len(state.allowed[u]))
+    return _evict(state, u, windows) or _exchange(state, u, windows)
+
+
+def _improve_compactness(state: _State, rng: random.Random, n: int) -> bool:
+    """
+    Relocates or swaps placed items when it increases the sum of squared window loads.
+
+    Concentrating the load fills windows completely and empties others, which both shrinks the idle
+    tails and opens room for long items which did not fit anywhere.
+    """
+    i = rng.randrange(n)
+    a = state.assignment[i]
+    if a < 0 or len(state.allowed[i]) < 2:
+        return False
+    b = rng.choice(state.allowed[i])
+    if a == b:
+        return False
+    di = state.durations[i]
+    if state.fits(i, b) and state.load[b] + di > state.load[a]:
+        state.move(i, b)
+        return True
+    if not state.members[b]:
+        return False
+    j = rng.choice(state.members[b])
+    dj = state.durations[j]
+    if dj == di or not state.fits(i, b, freed=dj) or not state.fits(j, a, freed=di):
+        return False
+    la, lb = state.load[a], state.load[b]
+    new_la, new_lb = la - di + dj, lb - dj + di
+    if new_la * new_la + new_lb * new_lb <= la * la + lb * lb:
+        return False
+    state.unplace(i)
+    state.unplace(j)
+    state.place(i, b)
+    state.place(j, a)
+    return True
+
+
+def solve(
+    items: Sequence[SolverItem],
+    windows: Sequence[SolverWindow],
+    *,
+    time_limit: float = 2.0,
+    seed: int | None = None,
+    progress: ProgressCallback | None = None
+) -> Solution:
+    """
+    Lays out one session per program item into free location windows without any overlap.
+
+    A best-fit-decreasing greedy pass builds the initial assignment, then a local search runs until the
+    time limit (or until it stops finding improvements). It first tries to place the remaining items,
+    moving placed items elsewhere to make room or exchanging them for shorter ones, then relocates and
+    swaps items between windows to concentrate the load. Items of a window are laid out back to back from its start with their before
+    and after time buffers, so the only idle time is at the end of a window.
+
+    Args:
+        items (Sequence[SolverItem]): The program items to place. Items with `id_location` only go to that location.
+        windows (Sequence[SolverWindow]): Free time of the locations, must not overlap within a location.
+        time_limit (float): Seconds available for the local search.
+        seed (int | None): Seed of the random moves, for reproducible results.
+        progress (ProgressCallback | None): Called with the completed fraction (0 to 1) from time to time.
+
+    Returns:
+        Solution: The sessions, the items which did not fit anywhere and the idle time of the used windows.
+    """
+    report = progress or (lambda _: None)
+    rng = random.Random(seed)
+    state = _State(items, windows)
+    _greedy(state, items)
+    report(0.1)
+
+    n = len(items)
+    started = time.perf_counter()
+    patience = max(2000, 50 * n)
+    iterations = stale = 0
+    while n and stale < patience:
+        elapsed = time.perf_counter() - started
+        if elapsed >= time_limit:
+            break
+        iterations += 1
+        if state.unplaced and rng.random() < 0.5:
+            improved = _improve_unplaced(state, rng)
+        else:
+            improved = _improve_compactness(state, rng, n)
+        stale = 0 if improved else stale + 1
+        if iterations % 512 == 0:
+            report(0.1 + 0.9 * min(1.0, max(elapsed / time_limit, stale / patience)))
+
+    sessions = []
+    idle = 0
+    for w, window in enumerate(windows):
+        if not state.members[w]:
+            continue
+        idle += state.capacity[w] - state.load[w]
+        cursor = window.start
+        for i in sorted(state.members[w], key=lambda i: (-state.durations[i], i)):
+            item = items[i]
+            start_time = cursor + item.before_time_buffer
+            end_time = start_time + item.required_time
+            sessions.append(PlacedSession(item.id_program_item, window.id_location, start_time, end_time))
+            cursor = end_time + item.after_time_buffer
+    sessions.sort(key=lambda session: (session.start_time, str(session.id_location)))
+    report(1.0)
+    return Solution(
+        sessions=sessions,
+        unplaced=[items[i].id_program_item for i in sorted(state.unplaced)],
+        idle_time=timedelta(seconds=idle),
+        iterations=iterations
+    )
@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -9,8 +10,25 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str
     POSTGRES_DB: str
     POSTGRES_HOST: str = Field("localhost")
+    POSTGRES_POOL_SIZE: int = Field(5)
+    POSTGRES_POOL_MAX_OVERFLOW: int = Field(10)
+    POSTGRES_POOL_TIMEOUT: float = Field(30.0)
+    POSTGRES_POOL_PRE_PING: bool = Field(False)
+    POSTGRES_POOL_RECYCLE: int = Field(-1)
+    POSTGRES_STATEMENT_CACHE_SIZE: int = Field(100)
+    # JSON list of read replica hosts, e.g. '["replica-1", "replica-2"]', same credentials and database as the primary.
+    POSTGRES_REPLICA_HOSTS: list[str] = Field(default_factory=list)
+    POSTGRES_REPLICA_HEALTH_CHECK_INTERVAL: float = Field(5.0)
     JWT_SECRET_KEY: str
     BASE_URL: str
+    REDIS_OM_URL: str | None = Field(None)
+    CACHE_MAX_ENTRIES: int = Field(4096)
+    # otlp exports over OTLP/gRPC, configured by the standard OTEL_EXPORTER_OTLP_* variables.
+    TELEMETRY_EXPORTER: Literal["otlp", "console", "none"] = Field("none")
+    TELEMETRY_SERVICE_NAME: str = Field("rzbportal")
+    # Share of traces recorded, latency histograms always see every request.
+    TELEMETRY_SAMPLE_RATIO: float = Field(0.1, ge=0, le=1)
+    TELEMETRY_METRIC_INTERVAL_MS: int = Field(60_000)
 
 @lru_cache
 def get_settings() -> Settings:
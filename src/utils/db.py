@@ -1,13 +1,15 @@
 from datetime import date as date_type, timedelta
 from uuid import UUID
 
-from container import async_session
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from container import container
 from datetime import datetime
 from service.core import EventModel, ProgramItemModel, UserModel, ProgramSessionModel, AttendeeModel, AttendeeProgramSessionModel, LocationModel
 
 
 async def provision_users():
-    async with async_session() as session:
+    async with container.resolve(async_sessionmaker)() as session:
         user = UserModel(
             id_user=UUID("f2015c51-7808-41c5-8b77-47b0ceecca13"),
             email="user@example.com",
@@ -17,7 +19,7 @@ async def provision_users():
         await session.commit()
 
 async def provision_events():
-    async with async_session() as session:
+    async with container.resolve(async_sessionmaker)() as session:
         session.add(
             EventModel(
                 id_event=UUID("98992867-827f-4c7b-b603-a435b1234706"),
@@ -0,0 +1,71 @@
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import NamedTuple
+
+
+class ImportTime(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def parse_importtime(output: str) -> list[ImportTime]:
+    """
+    Parses the report written to stderr by `python -X importtime`.
+
+    Args:
+        output (str): The stderr output, lines like `import time:   self [us] | cumulative | imported package`.
+
+    Returns:
+        list[ImportTime]: One entry per imported module, in the order of the report.
+    """
+    entries = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, module = line.removeprefix("import time:").split("|")
+        if not self_us.strip().isdigit():
+            continue  # the header
+        entries.append(ImportTime(module.strip(), int(self_us), int(cumulative_us)))
+    return entries
+
+
+def measure_imports(module: str) -> list[ImportTime]:
+    """
+    Imports a module in a fresh interpreter and returns its import time report.
+
+    Args:
+        module (str): The module to import, e.g. `app`.
+
+    Returns:
+        list[ImportTime]: Import times of every module loaded on the way.
+
+    Raises:
+        subprocess.CalledProcessError: If the import fails.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=Path(__file__).resolve().parent.parent,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return parse_importtime(result.stderr)
+
+
+def breakdown(entries: list[ImportTime]) -> list[tuple[str, int]]:
+    """
+    Sums the self time of modules by their top level package, the sums add up to the total import time.
+
+    Args:
+        entries (list[ImportTime]): The parsed import time report.
+
+    Returns:
+        list[tuple[str, int]]: Top level packages with their import time in microseconds, slowest first.
+    """
+    packages: defaultdict[str, int] = defaultdict(int)
+    for entry in entries:
+        packages[entry.module.split(".")[0]] += entry.self_us
+    return sorted(packages.items(), key=lambda package: package[1], reverse=True)
@@ -0,0 +1,93 @@
+import io
+from datetime import date as date_type
+from uuid import UUID
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+from sqlmodel import select
+
+from service.attendee import AttendeeImportException, AttendeeRepository, AttendeeService
+from service.core import AttendeeModel, EventModel
+
+EVENT_ID = UUID("98992867-827f-4c7b-b603-a435b1234706")
+
+
+@pytest.fixture
+async def attendee_service(engine: AsyncEngine) -> AttendeeService:
+    sessionmaker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with sessionmaker() as session:
+        session.add(
+            EventModel(
+                id_event=EVENT_ID,
+                name="Example Event",
+                start_date=date_type(2025, 7, 31),
+                end_date=date_type(2025, 8, 2)
+            )
+        )
+        await session.commit()
+        session.add(
+            AttendeeModel(
+                id_attendee=UUID("feb4dc59-cc5f-47c7-a101-a6eaa7011935"),
+                id_event=EVENT_ID,
+                email="attendee@example.com",
+                full_name="Attendee One"
+            )
+        )
+        await session.commit()
+    return AttendeeService(AttendeeRepository(sessionmaker))
+
+
+@pytest.mark.asyncio
+async def test_import_csv_upserts_by_email(attendee_service: AttendeeService):
+    file = io.BytesIO(
+        "email,full_name\n"
+        "attendee@example.com,Attendee Renamed\n"
+        "new@example.com,New Attendee\n"
+        ",Nobody\n"
+        "\"quoted@example.com\",\"Quoted, Attendee\"\n"
+        "new@example.com,New Attendee Again\n".encode()
+    )
+    result = await attendee_service.import_csv(EVENT_ID, file)
+
+    assert result.rows == 5
+    assert result.inserted == 2
+    assert result.updated == 1
+    assert result.skipped == 2
+
+    async with attendee_service.repository.ensure_session() as session:
+        attendees = {
+            attendee.email: attendee.full_name
+            for attendee in (await session.execute(select(AttendeeModel))).scalars().all()
+        }
+    assert attendees == {
+        "attendee@example.com": "Attendee Renamed",
+        "new@example.com": "New Attendee Again",
+        "quoted@example.com": "Quoted, Attendee",
+    }
+
+
+@pytest.mark.asyncio
+async def test_import_csv_requires_email_column(attendee_service: AttendeeService):
+    with pytest.raises(AttendeeImportException):
+        await attendee_service.import_csv(EVENT_ID, io.BytesIO(b"name\nfoo\n"))
+
+
+@pytest.mark.asyncio
+async def test_import_csv_reads_chunks_split_within_records(attendee_service: AttendeeService):
+    data = "\ufeffemail,full_name\r\n\"multi@example.com\",\"Multi\r\nLine\"\r\n\r\nümlaut@example.com,Jürgen\r\n".encode()
+
+    async def chunks():
+        # Three bytes split the BOM, the quoted line break and the umlauts.
+        for start in range(0, len(data), 3):
+            yield data[start:start + 3]
+
+    result = await attendee_service.import_csv(EVENT_ID, chunks())
+
+    assert result.rows == 2
+    assert result.inserted == 2
+    async with attendee_service.repository.ensure_session() as session:
+        full_names = {
+            attendee.email: attendee.full_name
+            for attendee in (await session.execute(select(AttendeeModel).where(AttendeeModel.email != "attendee@example.com"))).scalars().all()
+        }
+    assert full_names == {"multi@example.com": "Multi\r\nLine", "ümlaut@example.com": "Jürgen"}
@@ -0,0 +1,108 @@
+from datetime import date as date_type, datetime, timedelta
+from uuid import UUID
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+from sqlmodel import text
+
+from service.calendar import CalendarNotFoundException, CalendarRepository, CalendarService
+from service.calendar.ical import fold_line
+from service.core import AttendeeModel, AttendeeProgramSessionModel, EventModel, LocationModel, ProgramItemModel, ProgramSessionModel, SessionStatus
+
+EVENT_ID = UUID("98992867-827f-4c7b-b603-a435b1234706")
+LOCATION_ID = UUID("6bb4dee0-c0c9-407d-b3e3-b752942103d2")
+ITEM_ID = UUID("81f20f69-6f3f-4e55-af11-d173ff41ee4b")
+SESSION_ID = UUID("5fcbfce7-c178-4123-b31c-c8e835c81fe9")
+DRAFT_SESSION_ID = UUID("7f0c21f7-1040-430e-ac29-74aefd625642")
+ATTENDEE_ID = UUID("feb4dc59-cc5f-47c7-a101-a6eaa7011935")
+
+
+@pytest.fixture
+async def sessionmaker(engine: AsyncEngine) -> async_sessionmaker:
+    sessionmaker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with sessionmaker() as session:
+        session.add(EventModel(id_event=EVENT_ID, name="Example Event", start_date=date_type(2025, 7, 31), end_date=date_type(2025, 8, 2)))
+        await session.commit()
+        session.add(LocationModel(id_location=LOCATION_ID, id_event=EVENT_ID, name="Agora", color="#FF4500"))
+        session.add(AttendeeModel(id_attendee=ATTENDEE_ID, id_event=EVENT_ID, email="attendee@example.com"))
+        await session.commit()
+        session.add(
+            ProgramItemModel(
+                id_program_item=ITEM_ID,
+                id_event=EVENT_ID,
+                id_location=LOCATION_ID,
+                name="Knitting, steel; wires",
+                description="A program item about knitting steel wires.",
+                required_time=timedelta(hours=2)
+            )
+        )
+        await session.commit()
+        session.add(ProgramSessionModel(id_program_session=SESSION_ID, id_program_item=ITEM_ID, start_time=datetime(2025, 7, 31, 10, 0), status=SessionStatus.PUBLISHED))
+        session.add(ProgramSessionModel(id_program_session=DRAFT_SESSION_ID, id_program_item=ITEM_ID, start_time=datetime(2025, 7, 31, 14, 0)))
+        await session.commit()
+    return sessionmaker
+
+
+@pytest.mark.asyncio
+async def test_event_feed_is_revalidated_by_etag(sessionmaker: async_sessionmaker):
+    calendar_service = CalendarService(CalendarRepository(sessionmaker))
+
+    feed = await calendar_service.event_feed(EVENT_ID)
+    assert feed.body is not None
+    body = feed.body.decode()
+    assert f"UID:{SESSION_ID}" in body
+    assert str(DRAFT_SESSION_ID) not in body
+    assert "SUMMARY:Knitting\\, steel\\; wires" in body
+    assert "DTSTART:20250731T100000\r\nDTEND:20250731T120000" in body
+    assert "LOCATION:Agora" in body
+
+    assert (await calendar_service.event_feed(EVENT_ID, feed.etag)).body is None
+    assert await calendar_service.event_feed(EVENT_ID) is feed
+
+    # Registrations only change attendee_count, which must not invalidate the event feed.
+    async with sessionmaker() as session:
+        session.add(AttendeeProgramSessionModel(id_attendee=ATTENDEE_ID, id_program_session=SESSION_ID))
+        await session.commit()
+    assert (await calendar_service.event_feed(EVENT_ID, feed.etag)).body is None
+
+    async with sessionmaker() as session:
+        await session.execute(text("UPDATE t_program_session SET status = 'CANCELLED' WHERE id_program_session = :id"), {"id": SESSION_ID})
+        await session.commit()
+    changed = await calendar_service.event_feed(EVENT_ID, feed.etag)
+    assert changed.etag != feed.etag
+    assert changed.body is not None and b"STATUS:CANCELLED" in changed.body
+
+    # The event name is the calendar name, renaming the event changes every feed.
+    async with sessionmaker() as session:
+        await session.execute(text("UPDATE t_event SET name = 'Renamed Event' WHERE id_event = :id"), {"id": EVENT_ID})
+        await session.commit()
+    renamed = await calendar_service.event_feed(EVENT_ID, changed.etag)
+    assert renamed.etag != changed.etag
+    assert renamed.body is not None and b"X-WR-CALNAME:Renamed Event" in renamed.body
+
+
+@pytest.mark.asyncio
+async def test_attendee_and_location_feeds(sessionmaker: async_sessionmaker):
+    calendar_service = CalendarService(CalendarRepository(sessionmaker))
+
+    empty = await calendar_service.attendee_feed(EVENT_ID, ATTENDEE_ID)
+    assert empty.body is not None and b"BEGIN:VEVENT" not in empty.body
+
+    async with sessionmaker() as session:
+        session.add(AttendeeProgramSessionModel(id_attendee=ATTENDEE_ID, id_program_session=SESSION_ID))
+        await session.commit()
+    registered = await calendar_service.attendee_feed(EVENT_ID, ATTENDEE_ID, empty.etag)
+    assert registered.body is not None and f"UID:{SESSION_ID}".encode() in registered.body
+
+    location = await calendar_service.location_feed(EVENT_ID, LOCATION_ID)
+    assert location.body is not None and f"UID:{SESSION_ID}".encode() in location.body
+
+    with pytest.raises(CalendarNotFoundException):
+        await calendar_service.location_feed(EVENT_ID, ITEM_ID)
+
+
+def test_fold_line_keeps_utf8_characters_whole():
+    folded = fold_line("SUMMARY:" + "Š" * 80)
+    lines = folded.split("\r\n")
+    assert all(len(line.encode()) <= 75 for line in lines)
+    assert "".join(line.removeprefix(" ") for line in lines) == "SUMMARY:" + "Š" * 80
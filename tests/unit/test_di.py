@@ -0,0 +1,62 @@
+import pytest
+
+from di import Container, FutureService, Lifetime
+
+
+class Cache:
+    pass
+
+
+class Repository:
+    def __init__(self) -> None:
+        self.cache = FutureService(Cache)
+
+
+class Service:
+    def __init__(self, repository: "Repository", retries: int = 3) -> None:
+        self.repository = repository
+        self.retries = retries
+
+
+@pytest.mark.asyncio
+async def test_factories_are_lazy_and_wired_by_type_hints():
+    created = []
+    container = Container()
+    container.add(Cache, Cache())
+    container.register(Repository, lambda: created.append("repository") or Repository())
+    container.register(Service)
+    container.spinup()
+    assert created == []
+
+    service = await container.get(Service)()
+    assert isinstance(service.repository, Repository)
+    assert service.repository.cache is container.resolve(Cache)
+    assert service.retries == 3
+    assert container.resolve(Service) is service
+    assert created == ["repository"]
+
+
+def test_lifetimes():
+    container = Container()
+    container.add(Cache, Cache())
+    container.register(Repository, lifetime=Lifetime.REQUEST)
+    container.register(Service, lifetime=Lifetime.TRANSIENT)
+
+    first, second = container.resolve(Service), container.resolve(Service)
+    assert first is not second
+    assert first.repository is not second.repository
+
+    scope: dict = {}
+    assert container.resolve(Service, scope).repository is container.resolve(Service, scope).repository
+    # Transient services get a new dependency callable, so FastAPI does not share them within a request.
+    assert container.get(Service) is not container.get(Service)
+    assert container.get(Repository) is container.get(Repository)
+
+
+def test_missing_dependencies_are_reported_at_spinup():
+    container = Container()
+    container.register(Service)
+    with pytest.raises(ValueError):
+        container.spinup()
+    with pytest.raises(ValueError):
+        container.get(Repository)
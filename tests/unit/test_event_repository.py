@@ -1,12 +1,15 @@
 import pytest
 
-from service.event import EventRepository
+from pydantic import TypeAdapter
+from service.event import CreateLocationEntity, EventRepository, EventService, ProgramOverviewItemEntity
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, async_sessionmaker, AsyncSession
 from service.core import EventModel, EventStatus, ProgramItemModel, ProgramSessionModel, AttendeeModel, AttendeeProgramSessionModel
 from datetime import date as date_type, datetime, timedelta
 from rich.console import Console
 from uuid import UUID
 from service.event.repository import OverviewResult
+from sqlmodel import text
+from service.core import InvalidListCriterionException, ListCriterion, MemoryCache
 
 c = Console()
 
@@ -188,4 +191,159 @@ async def test_event_overview(event_repository: EventRepository, session: AsyncS
     assert overviews[0].after_time_buffer == timedelta(minutes=10)
     assert overviews[0].start_time == datetime(2025, 7, 31, 10, 0, 0)
     assert overviews[0].end_time == datetime(2025, 7, 31, 12, 0, 0)
-    assert overviews[0].attendee_count == 1
\ No newline at end of file
+    assert overviews[0].attendee_count == 1
+
+@pytest.mark.asyncio
+async def test_attendee_count_follows_registrations(event_repository: EventRepository, session: AsyncSession):
+    id_program_session = UUID("42dffc7c-a94a-4c94-8445-a8d6f896b8d9")
+    session.add(
+        AttendeeProgramSessionModel(
+            id_attendee=UUID("feb4dc59-cc5f-47c7-a101-a6eaa7011935"),
+            id_program_session=id_program_session
+        )
+    )
+    await session.commit()
+    program_session = await session.get(ProgramSessionModel, id_program_session, populate_existing=True)
+    assert program_session.attendee_count == 1
+
+    await session.execute(
+        text("DELETE FROM t_attendee_program_session WHERE id_program_session = :id"),
+        {"id": id_program_session}
+    )
+    await session.commit()
+    program_session = await session.get(ProgramSessionModel, id_program_session, populate_existing=True)
+    assert program_session.attendee_count == 0
+
+
+@pytest.mark.asyncio
+async def test_reconcile_attendee_counts(event_repository: EventRepository, session: AsyncSession):
+    await session.execute(text("UPDATE t_program_session SET attendee_count = 42"))
+    await session.commit()
+
+    repaired = await event_repository.reconcile_attendee_counts(
+        UUID("98992867-827f-4c7b-b603-a435b1234706"), session=session
+    )
+    await session.commit()
+    assert len(repaired) == 5
+
+    overviews = await event_repository.overview(session=session, event_id=UUID("98992867-827f-4c7b-b603-a435b1234706"))
+    assert sorted(overview.attendee_count for overview in overviews) == [0, 0, 0, 1, 1]
+
+    repaired = await event_repository.reconcile_attendee_counts(session=session)
+    assert len(repaired) == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_overview_in_chunks(event_repository: EventRepository, session: AsyncSession):
+    event_id = UUID("98992867-827f-4c7b-b603-a435b1234706")
+    chunks = [chunk async for chunk in event_repository.stream_overview(event_id, chunk_size=2, session=session)]
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert [row for chunk in chunks for row in chunk] == list(await event_repository.overview(event_id, session=session))
+
+
+@pytest.mark.asyncio
+async def test_overview_json_groups_sessions_by_program_item(event_repository: EventRepository, session: AsyncSession):
+    event_id = UUID("98992867-827f-4c7b-b603-a435b1234706")
+    items = TypeAdapter(list[ProgramOverviewItemEntity]).validate_json(await event_repository.overview_json(event_id, session=session))
+
+    assert [item.name for item in items] == ["Knitting steel wires", "Snow fighting in the summer"]
+    assert items[0].required_time == timedelta(hours=2)
+    assert items[0].before_time_buffer == timedelta(minutes=10)
+    assert [s.start_time for s in items[0].sessions] == sorted(s.start_time for s in items[0].sessions)
+    assert items[0].sessions[0].attendee_limit == 3
+    assert items[1].sessions[0].attendee_limit == 2
+    # The same sessions as the flat overview.
+    flat = await event_repository.overview(event_id, session=session)
+    assert sorted((s.start_time, s.note, s.attendee_count) for item in items for s in item.sessions) == sorted(
+        (row.start_time, row.note, row.attendee_count) for row in flat
+    )
+    assert await event_repository.overview_json(UUID("6cc53c48-44ed-4973-905e-a46c60218d92"), session=session) == "[]"
+
+
+@pytest.mark.asyncio
+async def test_list_events_paginates(event_repository: EventRepository, clean_session: AsyncSession):
+    clean_session.add_all([
+        EventModel(
+            name=f"Test Event {i}",
+            start_date=date_type(2025, 1, i),
+            end_date=date_type(2025, 1, i),
+            status=EventStatus.ARCHIVED if i % 5 == 0 else EventStatus.PUBLISHED
+        )
+        for i in range(1, 21)
+    ])
+    await clean_session.commit()
+
+    page = await event_repository.list_events(ListCriterion(sort_field="start_date", sort_direction="desc", limit=5, offset=5), session=clean_session)
+    assert page.total == 16
+    assert [event.start_date.day for event in page.items] == [13, 12, 11, 9, 8]
+
+    days = []
+    criterion = ListCriterion(sort_field="start_date", limit=6)
+    while True:
+        page = await event_repository.list_events(criterion, session=clean_session)
+        assert page.total == 16
+        days.extend(event.start_date.day for event in page.items)
+        if page.next_cursor is None:
+            break
+        criterion = criterion.model_copy(update={"cursor": page.next_cursor})
+    assert days == [i for i in range(1, 21) if i % 5 != 0]
+
+    page = await event_repository.list_events(
+        ListCriterion(filter='{"start_date": {"from": "2025-01-10", "to": "2025-01-12"}, "name": "event 1"}'),
+        session=clean_session
+    )
+    assert sorted(event.start_date.day for event in page.items) == [11, 12]
+    assert page.total == 2
+
+    # An empty first page counts the filtered rows too, not all events.
+    page = await event_repository.list_events(ListCriterion(filter='{"name": "no such event"}'), session=clean_session)
+    assert page.items == []
+    assert page.total == 0
+
+    with pytest.raises(InvalidListCriterionException):
+        await event_repository.list_events(ListCriterion(sort_field="description"), session=clean_session)
+
+
+@pytest.mark.asyncio
+async def test_overview_is_cached_until_invalidated(engine: AsyncEngine, session: AsyncSession):
+    event_id = UUID("98992867-827f-4c7b-b603-a435b1234706")
+    event_repository = EventRepository(async_sessionmaker(bind=engine))
+    event_repository.cache = MemoryCache()
+
+    overviews = await event_repository.overview(event_id)
+    assert await event_repository.overview(event_id) == overviews
+    assert all(isinstance(overview, OverviewResult) for overview in await event_repository.overview(event_id))
+
+    await session.execute(text("UPDATE t_program_session SET note = 'Changed'"))
+    await session.commit()
+    assert await event_repository.overview(event_id) == overviews
+    # Passing a session bypasses the cache.
+    assert {overview.note for overview in await event_repository.overview(event_id, session=session)} == {"Changed"}
+
+    await event_repository.invalidate(event_id)
+    assert {overview.note for overview in await event_repository.overview(event_id)} == {"Changed"}
+
+    # Cached rows come back as dicts, the service validates both into the same entities.
+    event_service = EventService(event_repository)
+    locations = await event_service.list_locations(event_id, ListCriterion())
+    assert await event_service.list_locations(event_id, ListCriterion()) == locations
+    assert await event_service.list_locations(event_id, ListCriterion(limit=1)) != locations
+
+
+@pytest.mark.asyncio
+async def test_service_invalidates_only_after_its_own_transaction(engine: AsyncEngine, session: AsyncSession):
+    event_id = UUID("98992867-827f-4c7b-b603-a435b1234706")
+    event_repository = EventRepository(async_sessionmaker(bind=engine))
+    event_repository.cache = MemoryCache()
+    event_service = EventService(event_repository)
+    locations = (await event_service.list_locations(event_id, ListCriterion())).data
+
+    # Within the caller's transaction nothing is dropped, a reader could cache the uncommitted state again.
+    await event_service.create_location(event_id, CreateLocationEntity(name="Spad", color="#4169E1"), session=session)
+    await session.commit()
+    assert (await event_service.list_locations(event_id, ListCriterion())).data == locations
+    await event_repository.invalidate(event_id)
+    assert len((await event_service.list_locations(event_id, ListCriterion())).data) == len(locations) + 1
+
+    await event_service.create_location(event_id, CreateLocationEntity(name="Agora", color="#FF4500"))
+    assert len((await event_service.list_locations(event_id, ListCriterion())).data) == len(locations) + 2
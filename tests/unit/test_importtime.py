@@ -0,0 +1,14 @@
+from utils.importtime import ImportTime, breakdown, parse_importtime
+
+REPORT = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      2000 |       2500 |     sqlalchemy.util
+import time:       500 |       3000 |   sqlalchemy
+import time:       300 |       3420 | app
+"""
+
+
+def test_parse_importtime_and_breakdown():
+    entries = parse_importtime(REPORT)
+    assert entries[1] == ImportTime("sqlalchemy.util", 2000, 2500)
+    assert breakdown(entries) == [("sqlalchemy", 2500), ("app", 300), ("_io", 120)]
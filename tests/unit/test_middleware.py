@@ -0,0 +1,60 @@
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from route import ExceptionConfiguration, ExceptionHandlingMiddleware, request_id
+
+
+class NotFoundException(Exception):
+    pass
+
+
+def build_client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(
+        ExceptionHandlingMiddleware, exception_map=[ExceptionConfiguration(exception=NotFoundException, status_code=404, app_code="NOT_FOUND")]
+    )
+
+    @app.get("/ok")
+    async def ok():
+        return {"request_id": request_id.get()}
+
+    @app.get("/missing")
+    async def missing():
+        raise NotFoundException("Nothing here")
+
+    @app.get("/broken")
+    async def broken():
+        raise RuntimeError("Broken")
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for chunk in (b"a", b"b", b"c"):
+                yield chunk
+        return StreamingResponse(chunks())
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def test_request_id_header_matches_context_variable():
+    response = build_client().get("/ok")
+    assert response.json()["request_id"] == response.headers["X-Request-ID"]
+
+
+def test_exceptions_are_mapped_to_json_responses():
+    client = build_client()
+
+    response = client.get("/missing")
+    assert response.status_code == 404
+    assert response.json() == {"code": "NOT_FOUND", "message": "Nothing here", "request_id": response.headers["X-Request-ID"]}
+
+    response = client.get("/broken")
+    assert response.status_code == 500
+    assert response.json()["message"] == "Broken"
+
+
+def test_streaming_responses_pass_through():
+    response = build_client().get("/stream")
+    assert response.text == "abc"
+    assert "X-Request-ID" in response.headers
@@ -0,0 +1,25 @@
+from pathlib import Path
+
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlmodel import SQLModel
+
+import service.core  # noqa: F401
+
+ROOT = Path(__file__).parents[2]
+
+
+def test_migrations_form_a_single_chain_creating_the_model_indexes():
+    config = Config(ROOT / "alembic.ini")
+    config.set_main_option("script_location", str(ROOT / "alembic"))
+    script = ScriptDirectory.from_config(config)
+    assert len(script.get_heads()) == 1
+
+    revision = script.get_revision("0002")
+    migrated = {(name, table, tuple(columns)) for name, table, columns in revision.module.INDEXES}
+    modelled = {
+        (index.name, table.name, tuple(column.name for column in index.columns))
+        for table in SQLModel.metadata.tables.values()
+        for index in table.indexes
+    }
+    assert migrated <= modelled
@@ -0,0 +1,29 @@
+import pytest
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from service.core import InstrumentedAsyncPool
+from service.core.pool import _observe_in_use, _observe_overflow
+
+
+def observed(callback, name: str) -> list[int]:
+    return [observation.value for observation in callback(None) if observation.attributes == {"db.pool.name": name}]
+
+
+@pytest.mark.asyncio
+async def test_pool_reports_in_use_and_overflow(engine: AsyncEngine):
+    pooled = create_async_engine(
+        engine.url, poolclass=InstrumentedAsyncPool, pool_logging_name="test", pool_size=1, max_overflow=1, pool_timeout=0.1
+    )
+    try:
+        assert observed(_observe_in_use, "test") == [0]
+        async with pooled.connect(), pooled.connect():
+            assert observed(_observe_in_use, "test") == [2]
+            assert observed(_observe_overflow, "test") == [1]
+            with pytest.raises(PoolTimeoutError):
+                async with pooled.connect():
+                    pass
+        assert observed(_observe_in_use, "test") == [0]
+    finally:
+        await pooled.dispose()
+    assert observed(_observe_in_use, "test") == [0]
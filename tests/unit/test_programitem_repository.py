@@ -0,0 +1,82 @@
+from datetime import date as date_type, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from service.core import EventModel, ListCriterion, ProgramItemModel
+from service.programitem import ProgramItemRepository, ProgramItemService
+
+EVENT_ID = UUID("98992867-827f-4c7b-b603-a435b1234706")
+OTHER_EVENT_ID = UUID("6cc53c48-44ed-4973-905e-a46c60218d92")
+
+
+@pytest.fixture
+async def programitem_repository(engine: AsyncEngine) -> ProgramItemRepository:
+    sessionmaker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with sessionmaker() as session:
+        for event_id in (EVENT_ID, OTHER_EVENT_ID):
+            session.add(
+                EventModel(
+                    id_event=event_id,
+                    name="Example Event",
+                    start_date=date_type(2025, 7, 31),
+                    end_date=date_type(2025, 8, 2)
+                )
+            )
+        await session.commit()
+        for event_id, name, description in (
+            (EVENT_ID, "Dragon painting", "Painting miniatures of dragons."),
+            (EVENT_ID, "Knitting steel wires", "Bring your own dragon."),
+            (EVENT_ID, "Board games", "Tabletop evening."),
+            (OTHER_EVENT_ID, "Dragon hunting", "Not in this event."),
+        ):
+            session.add(
+                ProgramItemModel(
+                    id_program_item=uuid4(),
+                    id_event=event_id,
+                    name=name,
+                    description=description,
+                    required_time=timedelta(hours=1),
+                )
+            )
+        await session.commit()
+    return ProgramItemRepository(sessionmaker)
+
+
+@pytest.mark.asyncio
+async def test_search_program_items_ranks_name_matches_first(programitem_repository: ProgramItemRepository):
+    results = await programitem_repository.search_program_items(event_id=EVENT_ID, search="drag")
+
+    assert [result.item.name for result in results] == ["Dragon painting", "Knitting steel wires"]
+    assert results[0].rank > results[1].rank
+
+
+@pytest.mark.asyncio
+async def test_search_program_items_matches_all_words(programitem_repository: ProgramItemRepository):
+    results = await programitem_repository.search_program_items(event_id=EVENT_ID, search="dragon paint")
+    assert [result.item.name for result in results] == ["Dragon painting"]
+
+    assert await programitem_repository.search_program_items(event_id=EVENT_ID, search="  ?! ") == []
+
+
+@pytest.mark.asyncio
+async def test_list_program_items_read_path_pages_with_cursor(programitem_repository: ProgramItemRepository):
+    programitem_service = ProgramItemService(programitem_repository)
+
+    first = await programitem_service.list_program_items(EVENT_ID, ListCriterion(sort_field="name", limit=2))
+    assert first.total == 3
+    assert [item.name for item in first.data] == ["Board games", "Dragon painting"]
+    assert first.data[0].type == "unspecified"
+    assert first.data[0].required_time == 60
+    assert first.data[0].before_time_buffer == 10
+    assert first.next_cursor is not None
+
+    second = await programitem_service.list_program_items(EVENT_ID, ListCriterion(sort_field="name", limit=2, cursor=first.next_cursor))
+    assert [item.name for item in second.data] == ["Knitting steel wires"]
+    assert second.next_cursor is None
+
+    empty = await programitem_service.list_program_items(EVENT_ID, ListCriterion(filter='{"name": "no such item"}'))
+    assert empty.data == []
+    assert empty.total == 0
+
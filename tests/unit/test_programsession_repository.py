@@ -0,0 +1,159 @@
+from datetime import date as date_type, datetime, time, timedelta
+from uuid import UUID
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from service.core import EventModel, LocationModel, ProgramItemModel, SessionStatus
+from service.programsession import (
+    CreateProgramSessionEntity,
+    LocationDoubleBookedException,
+    ProgramItemNotFoundException,
+    ProgramSessionRepository,
+    ProgramSessionService,
+    RecurrenceEntity,
+)
+
+EVENT_ID = UUID("98992867-827f-4c7b-b603-a435b1234706")
+LOCATION_ID = UUID("6bb4dee0-c0c9-407d-b3e3-b752942103d2")
+OTHER_LOCATION_ID = UUID("77006683-90a8-46af-a3ea-9ad7af6f5d85")
+ITEM_ID = UUID("81f20f69-6f3f-4e55-af11-d173ff41ee4b")
+
+
+@pytest.fixture
+async def programsession_service(engine: AsyncEngine) -> ProgramSessionService:
+    sessionmaker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with sessionmaker() as session:
+        session.add(EventModel(id_event=EVENT_ID, name="Example Event", start_date=date_type(2025, 7, 31), end_date=date_type(2025, 8, 2)))
+        await session.commit()
+        session.add(LocationModel(id_location=LOCATION_ID, id_event=EVENT_ID, name="Agora", color="#FF4500"))
+        session.add(LocationModel(id_location=OTHER_LOCATION_ID, id_event=EVENT_ID, name="Spad", color="#4169E1"))
+        await session.commit()
+        session.add(
+            ProgramItemModel(
+                id_program_item=ITEM_ID,
+                id_event=EVENT_ID,
+                id_location=LOCATION_ID,
+                name="Knitting steel wires",
+                required_time=timedelta(hours=1),
+                before_time_buffer=timedelta(minutes=10),
+                after_time_buffer=timedelta(minutes=10)
+            )
+        )
+        await session.commit()
+    return ProgramSessionService(ProgramSessionRepository(sessionmaker))
+
+
+@pytest.mark.asyncio
+async def test_create_program_session_prevents_double_booking(programsession_service: ProgramSessionService):
+    first = await programsession_service.create_program_session(
+        EVENT_ID, CreateProgramSessionEntity(id_program_item=ITEM_ID, start_time=datetime(2025, 7, 31, 9, 0))
+    )
+    assert first.id_location == LOCATION_ID
+    assert first.end_time is None
+
+    # 10:00 would only collide through the buffers (10:10 after the first, 09:50 before the second).
+    with pytest.raises(LocationDoubleBookedException) as e:
+        await programsession_service.create_program_session(
+            EVENT_ID, CreateProgramSessionEntity(id_program_item=ITEM_ID, start_time=datetime(2025, 7, 31, 10, 0))
+        )
+    assert e.value.conflicting_sessions == [first.id_program_session]
+
+    # Enough room for both buffers, another location, or a cancelled session are fine.
+    await programsession_service.create_program_session(
+        EVENT_ID, CreateProgramSessionEntity(id_program_item=ITEM_ID, start_time=datetime(2025, 7, 31, 10, 20))
+    )
+    await programsession_service.create_program_session(
+        EVENT_ID,
+        CreateProgramSessionEntity(id_program_item=ITEM_ID, id_location_override=OTHER_LOCATION_ID, start_time=datetime(2025, 7, 31, 9, 30))
+    )
+    await programsession_service.create_program_session(
+        EVENT_ID,
+        CreateProgramSessionEntity(id_program_item=ITEM_ID, start_time=datetime(2025, 7, 31, 9, 30), status=SessionStatus.CANCELLED)
+    )
+
+    with pytest.raises(ProgramItemNotFoundException):
+        await programsession_service.create_program_session(
+            EVENT_ID, CreateProgramSessionEntity(id_program_item=LOCATION_ID, start_time=datetime(2025, 7, 31, 9, 0))
+        )
+
+
+@pytest.mark.asyncio
+async def test_free_slots(programsession_service: ProgramSessionService):
+    await programsession_service.create_program_session(
+        EVENT_ID, CreateProgramSessionEntity(id_program_item=ITEM_ID, start_time=datetime(2025, 7, 31, 9, 0))
+    )
+    await programsession_service.create_program_session(
+        EVENT_ID, CreateProgramSessionEntity(id_program_item=ITEM_ID, start_time=datetime(2025, 7, 31, 10, 30))
+    )
+
+    slots = await programsession_service.free_slots(
+        EVENT_ID, LOCATION_ID, datetime(2025, 7, 31, 8, 0), datetime(2025, 7, 31, 12, 0), min_duration=timedelta(minutes=15)
+    )
+    assert [(slot.start_time, slot.end_time) for slot in slots] == [
+        (datetime(2025, 7, 31, 8, 0), datetime(2025, 7, 31, 8, 50)),
+        (datetime(2025, 7, 31, 11, 40), datetime(2025, 7, 31, 12, 0)),
+    ]
+
+    slots = await programsession_service.free_slots(EVENT_ID, OTHER_LOCATION_ID)
+    assert [(slot.start_time, slot.end_time) for slot in slots] == [(datetime(2025, 7, 31), datetime(2025, 8, 3))]
+
+
+@pytest.mark.asyncio
+async def test_create_program_sessions_reports_failures_per_item(programsession_service: ProgramSessionService):
+    response = await programsession_service.create_program_sessions(EVENT_ID, [
+        CreateProgramSessionEntity(id_program_item=ITEM_ID, start_time=datetime(2025, 7, 31, 9, 0)),
+        CreateProgramSessionEntity(id_program_item=ITEM_ID, start_time=datetime(2025, 7, 31, 10, 20)),
+    ])
+    assert [session.start_time for session in response.created] == [datetime(2025, 7, 31, 9, 0), datetime(2025, 7, 31, 10, 20)]
+    assert response.failed == []
+
+    # The third session collides with the first created one, the fourth with the second session of the same batch.
+    response = await programsession_service.create_program_sessions(EVENT_ID, [
+        CreateProgramSessionEntity(id_program_item=ITEM_ID, start_time=datetime(2025, 7, 31, 12, 0)),
+        CreateProgramSessionEntity(id_program_item=LOCATION_ID, start_time=datetime(2025, 7, 31, 14, 0)),
+        CreateProgramSessionEntity(id_program_item=ITEM_ID, start_time=datetime(2025, 7, 31, 9, 30)),
+        CreateProgramSessionEntity(id_program_item=ITEM_ID, start_time=datetime(2025, 7, 31, 12, 30)),
+    ])
+    assert [session.start_time for session in response.created] == [datetime(2025, 7, 31, 12, 0)]
+    assert [(failure.index, failure.code) for failure in response.failed] == [
+        (1, "PROGRAM_SESSION_ITEM_NOT_FOUND"),
+        (2, "PROGRAM_SESSION_LOCATION_DOUBLE_BOOKED"),
+        (3, "PROGRAM_SESSION_LOCATION_DOUBLE_BOOKED"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_generate_program_sessions_skips_booked_slots(programsession_service: ProgramSessionService):
+    booked = await programsession_service.create_program_session(
+        EVENT_ID, CreateProgramSessionEntity(id_program_item=ITEM_ID, start_time=datetime(2025, 8, 1, 10, 30))
+    )
+
+    # 09:00 and 10:30 on each of the three days, 12:00 would end after the day end.
+    result = await programsession_service.generate_program_sessions(
+        EVENT_ID, RecurrenceEntity(id_program_item=ITEM_ID, day_start=time(9, 0), day_end=time(12, 0), every=timedelta(minutes=90))
+    )
+    assert [session.start_time for session in result.created] == [
+        datetime(2025, 7, 31, 9, 0),
+        datetime(2025, 7, 31, 10, 30),
+        datetime(2025, 8, 1, 9, 0),
+        datetime(2025, 8, 2, 9, 0),
+        datetime(2025, 8, 2, 10, 30),
+    ]
+    assert booked.id_program_session not in {session.id_program_session for session in result.created}
+    assert result.skipped == 1
+
+    # Hourly sessions collide with each other through the buffers, every other one is skipped.
+    result = await programsession_service.generate_program_sessions(
+        EVENT_ID,
+        RecurrenceEntity(
+            id_program_item=ITEM_ID, id_location_override=OTHER_LOCATION_ID, day_start=time(20, 0), every=timedelta(hours=1)
+        )
+    )
+    assert [session.start_time.hour for session in result.created] == [20, 22] * 3
+    assert result.skipped == 6
+
+    with pytest.raises(ProgramItemNotFoundException):
+        await programsession_service.generate_program_sessions(
+            EVENT_ID, RecurrenceEntity(id_program_item=LOCATION_ID, day_start=time(9, 0), every=timedelta(hours=2))
+        )
@@ -0,0 +1,145 @@
+import asyncio
+from datetime import date as date_type, datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from service.core import AttendeeModel, EventModel, ProgramItemModel, ProgramSessionModel, ProgramSessionWaitlistModel, SessionStatus
+from service.registration import (
+    AlreadyRegisteredException,
+    CreateRegistrationEntity,
+    ProgramSessionClosedException,
+    ProgramSessionFullException,
+    RegistrationRepository,
+    RegistrationService,
+)
+
+EVENT_ID = UUID("98992867-827f-4c7b-b603-a435b1234706")
+PROGRAM_ITEM_ID = UUID("81f20f69-6f3f-4e55-af11-d173ff41ee4b")
+SESSION_ID = UUID("5fcbfce7-c178-4123-b31c-c8e835c81fe9")
+CANCELLED_SESSION_ID = UUID("7f0c21f7-1040-430e-ac29-74aefd625642")
+
+
+@pytest.fixture
+async def registration_service(engine: AsyncEngine) -> RegistrationService:
+    sessionmaker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    return RegistrationService(RegistrationRepository(sessionmaker))
+
+
+@pytest.fixture
+async def attendees(engine: AsyncEngine) -> list[UUID]:
+    sessionmaker = async_sessionmaker(bind=engine, autoflush=True)
+    async with sessionmaker() as session:
+        session.add(
+            EventModel(
+                id_event=EVENT_ID,
+                name="Example Event",
+                start_date=date_type(2025, 7, 31),
+                end_date=date_type(2025, 8, 2)
+            )
+        )
+        session.add(
+            ProgramItemModel(
+                id_program_item=PROGRAM_ITEM_ID,
+                id_event=EVENT_ID,
+                name="Knitting steel wires",
+                required_time=timedelta(hours=2),
+                attendee_limit=5,
+                attendee_limit_buffer=2
+            )
+        )
+        await session.commit()
+        session.add(
+            ProgramSessionModel(
+                id_program_session=SESSION_ID,
+                id_program_item=PROGRAM_ITEM_ID,
+                start_time=datetime(2025, 7, 31, 10, 0, 0),
+                end_time=datetime(2025, 7, 31, 12, 0, 0),
+            )
+        )
+        session.add(
+            ProgramSessionModel(
+                id_program_session=CANCELLED_SESSION_ID,
+                id_program_item=PROGRAM_ITEM_ID,
+                start_time=datetime(2025, 7, 31, 14, 0, 0),
+                end_time=datetime(2025, 7, 31, 16, 0, 0),
+                status=SessionStatus.CANCELLED
+            )
+        )
+        ids = [uuid4() for _ in range(40)]
+        session.add_all([
+            AttendeeModel(id_attendee=id_attendee, id_event=EVENT_ID, email=f"attendee{i}@example.com", full_name=None)
+            for i, id_attendee in enumerate(ids)
+        ])
+        await session.commit()
+    return ids
+
+
+@pytest.mark.asyncio
+async def test_register_respects_capacity_under_concurrency(registration_service: RegistrationService, attendees: list[UUID]):
+    async def register(id_attendee: UUID) -> bool:
+        try:
+            await registration_service.register(EVENT_ID, SESSION_ID, CreateRegistrationEntity(id_attendee=id_attendee, waitlist=False))
+        except ProgramSessionFullException:
+            return False
+        return True
+
+    results = await asyncio.gather(*[register(id_attendee) for id_attendee in attendees])
+
+    # attendee_limit 5 + attendee_limit_buffer 2
+    assert results.count(True) == 7
+    async with registration_service.repository.ensure_session() as session:
+        program_session = await session.get(ProgramSessionModel, SESSION_ID)
+        assert program_session.attendee_count == 7
+
+
+@pytest.mark.asyncio
+async def test_register_twice(registration_service: RegistrationService, attendees: list[UUID]):
+    registration = await registration_service.register(EVENT_ID, SESSION_ID, CreateRegistrationEntity(id_attendee=attendees[0], note="Vegan"))
+    assert registration.id_program_session == SESSION_ID
+    assert registration.note == "Vegan"
+
+    with pytest.raises(AlreadyRegisteredException):
+        await registration_service.register(EVENT_ID, SESSION_ID, CreateRegistrationEntity(id_attendee=attendees[0]))
+
+
+@pytest.mark.asyncio
+async def test_register_into_cancelled_session(registration_service: RegistrationService, attendees: list[UUID]):
+    with pytest.raises(ProgramSessionClosedException):
+        await registration_service.register(EVENT_ID, CANCELLED_SESSION_ID, CreateRegistrationEntity(id_attendee=attendees[0]))
+
+
+@pytest.mark.asyncio
+async def test_waitlist_promotion(registration_service: RegistrationService, attendees: list[UUID]):
+    for id_attendee in attendees[:7]:
+        registration = await registration_service.register(EVENT_ID, SESSION_ID, CreateRegistrationEntity(id_attendee=id_attendee))
+        assert registration.status == "registered"
+
+    for id_attendee in attendees[7:10]:
+        registration = await registration_service.register(EVENT_ID, SESSION_ID, CreateRegistrationEntity(id_attendee=id_attendee))
+        assert registration.status == "waitlisted"
+
+    with pytest.raises(ProgramSessionFullException):
+        await registration_service.register(EVENT_ID, SESSION_ID, CreateRegistrationEntity(id_attendee=attendees[10], waitlist=False))
+
+    # leaving the waitlist does not promote anybody
+    cancellation = await registration_service.cancel(EVENT_ID, SESSION_ID, attendees[8])
+    assert cancellation.cancelled.status == "waitlisted"
+    assert cancellation.promoted is None
+
+    # the head of the queue takes the freed place
+    cancellation = await registration_service.cancel(EVENT_ID, SESSION_ID, attendees[0])
+    assert cancellation.cancelled.status == "registered"
+    assert cancellation.promoted.id_attendee == attendees[7]
+
+    cancellation = await registration_service.cancel(EVENT_ID, SESSION_ID, attendees[1])
+    assert cancellation.promoted.id_attendee == attendees[9]
+
+    cancellation = await registration_service.cancel(EVENT_ID, SESSION_ID, attendees[2])
+    assert cancellation.promoted is None
+
+    async with registration_service.repository.ensure_session() as session:
+        program_session = await session.get(ProgramSessionModel, SESSION_ID)
+        assert program_session.attendee_count == 6
+        assert await session.get(ProgramSessionWaitlistModel, (attendees[7], SESSION_ID)) is None
@@ -0,0 +1,51 @@
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from service.core import BaseRepository, Replica, ReplicaRouter, read_intent
+
+
+def replica(name: str, engine: AsyncEngine) -> Replica:
+    return Replica(name, engine, async_sessionmaker(engine, expire_on_commit=False))
+
+
+@pytest.fixture
+async def router(engine: AsyncEngine):
+    unreachable = create_async_engine(engine.url.set(host="127.0.0.1", port=1), poolclass=NullPool)
+    router = ReplicaRouter([replica("down", unreachable), replica("up", create_async_engine(engine.url, poolclass=NullPool))])
+    yield router
+    await router.close()
+
+
+async def bind_of(repository: BaseRepository, read_only: bool | None = None) -> AsyncEngine:
+    async with repository.ensure_session(read_only=read_only) as session:
+        return session.bind  # type: ignore[return-value]
+
+
+@pytest.mark.asyncio
+async def test_reads_go_to_healthy_replicas_until_the_request_writes(engine: AsyncEngine, router: ReplicaRouter):
+    async def request() -> None:
+        repository = BaseRepository(async_sessionmaker(engine))
+        repository.replicas = router
+        up = router.replicas[1].engine
+
+        assert await bind_of(repository) is engine
+        read_intent.set(True)
+        # The unreachable replica is marked down on the first attempt, reads fall back and then rotate to the other one.
+        assert {await bind_of(repository) for _ in range(3)} <= {engine, up}
+        assert all([await bind_of(repository) is up for _ in range(3)])
+        assert await bind_of(repository, read_only=False) is engine
+        # Read-your-writes: after a committed write the request stays on the primary.
+        assert await bind_of(repository) is engine
+
+    # A task of its own, like a request, so the context variables do not leak into other tests.
+    await asyncio.create_task(request())
+
+
+@pytest.mark.asyncio
+async def test_health_check_takes_replicas_out_of_rotation(router: ReplicaRouter):
+    await router.check_health()
+    assert [replica.healthy for replica in router.replicas] == [False, True]
+    assert {router.pick().name for _ in range(4)} == {"up"}  # type: ignore[union-attr]
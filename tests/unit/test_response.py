@@ -0,0 +1,54 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from fastapi import APIRouter, FastAPI, Response
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+
+from route import FastJSONRoute
+from service.event import ProgramOverviewEntity
+
+entities = [
+    ProgramOverviewEntity(
+        id_program_item=uuid4(),
+        name="Knitting steel wires",
+        type="workshop",
+        required_time=timedelta(hours=1, minutes=30),
+        start_time=datetime(2025, 7, 31, 10, 0),
+        attendee_count=3
+    ),
+    ProgramOverviewEntity(id_program_item=uuid4(), name="Ďábelská přednáška"),
+]
+
+
+def build_router(route_class: type) -> APIRouter:
+    router = APIRouter(route_class=route_class)
+
+    @router.get("/overview")
+    async def overview() -> list[ProgramOverviewEntity]:
+        return entities
+
+    @router.get("/compact", response_model=list[ProgramOverviewEntity], response_model_exclude_none=True)
+    def compact():
+        return entities
+
+    @router.get("/teapot")
+    async def teapot() -> list[ProgramOverviewEntity]:
+        return Response(status_code=418)  # type: ignore[return-value]
+
+    return router
+
+
+def test_fast_route_matches_default_serialization():
+    default, fast = FastAPI(), FastAPI()
+    default.include_router(build_router(APIRoute))
+    fast.include_router(build_router(FastJSONRoute))
+    assert isinstance(fast.router.routes[-1], FastJSONRoute)
+
+    with TestClient(default) as default_client, TestClient(fast) as fast_client:
+        for path in ("/overview", "/compact"):
+            expected, response = default_client.get(path), fast_client.get(path)
+            assert response.headers["content-type"] == "application/json"
+            assert response.json() == expected.json()
+        assert "type" not in fast_client.get("/compact").json()[1]
+        assert fast_client.get("/teapot").status_code == 418
@@ -0,0 +1,94 @@
+import random
+from datetime import date as date_type, datetime, timedelta
+from itertools import combinations
+from uuid import UUID
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from service.core import AttendeeModel, AttendeeProgramSessionModel, EventModel, ProgramItemModel, ProgramSessionModel, SessionStatus
+from service.schedule import Interval, IntervalIndex, ScheduledSessionNotFoundException, ScheduleRepository, ScheduleService, overlapping_pairs
+
+EVENT_ID = UUID("98992867-827f-4c7b-b603-a435b1234706")
+ATTENDEE_ID = UUID("feb4dc59-cc5f-47c7-a101-a6eaa7011935")
+ITEM_ID = UUID("81f20f69-6f3f-4e55-af11-d173ff41ee4b")
+MORNING_ID = UUID("0b0a8c4e-5d0f-4bde-9a55-0d7d3f1c0001")
+NOON_ID = UUID("0b0a8c4e-5d0f-4bde-9a55-0d7d3f1c0002")
+AFTERNOON_ID = UUID("0b0a8c4e-5d0f-4bde-9a55-0d7d3f1c0003")
+CANCELLED_ID = UUID("0b0a8c4e-5d0f-4bde-9a55-0d7d3f1c0004")
+
+
+@pytest.fixture
+async def schedule_service(engine: AsyncEngine) -> ScheduleService:
+    sessionmaker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with sessionmaker() as session:
+        session.add(EventModel(id_event=EVENT_ID, name="Example Event", start_date=date_type(2025, 7, 31), end_date=date_type(2025, 8, 2)))
+        await session.commit()
+        session.add(AttendeeModel(id_attendee=ATTENDEE_ID, id_event=EVENT_ID, email="attendee@example.com"))
+        # One hour sessions with 10 minute buffers on both sides.
+        session.add(
+            ProgramItemModel(
+                id_program_item=ITEM_ID,
+                id_event=EVENT_ID,
+                name="Knitting steel wires",
+                required_time=timedelta(hours=1),
+                before_time_buffer=timedelta(minutes=10),
+                after_time_buffer=timedelta(minutes=10)
+            )
+        )
+        await session.commit()
+        for id_program_session, start_time, status in (
+            (MORNING_ID, datetime(2025, 7, 31, 9, 0), SessionStatus.PUBLISHED),
+            # Starts right after the morning session, only the buffers overlap.
+            (NOON_ID, datetime(2025, 7, 31, 10, 0), SessionStatus.PUBLISHED),
+            (AFTERNOON_ID, datetime(2025, 7, 31, 14, 0), SessionStatus.PUBLISHED),
+            (CANCELLED_ID, datetime(2025, 7, 31, 14, 30), SessionStatus.CANCELLED),
+        ):
+            session.add(ProgramSessionModel(id_program_session=id_program_session, id_program_item=ITEM_ID, start_time=start_time, status=status))
+        await session.commit()
+        for id_program_session in (MORNING_ID, NOON_ID, CANCELLED_ID):
+            session.add(AttendeeProgramSessionModel(id_attendee=ATTENDEE_ID, id_program_session=id_program_session))
+        await session.commit()
+    return ScheduleService(ScheduleRepository(sessionmaker))
+
+
+@pytest.mark.asyncio
+async def test_list_conflicts_counts_buffers_and_skips_cancelled(schedule_service: ScheduleService):
+    conflicts = await schedule_service.list_conflicts(EVENT_ID)
+
+    assert [(c.id_attendee, c.first.id_program_session, c.second.id_program_session) for c in conflicts] == [
+        (ATTENDEE_ID, MORNING_ID, NOON_ID)
+    ]
+    assert conflicts[0].first.blocked_until == datetime(2025, 7, 31, 10, 10)
+
+
+@pytest.mark.asyncio
+async def test_check_registration(schedule_service: ScheduleService):
+    result = await schedule_service.check_registration(EVENT_ID, AFTERNOON_ID, ATTENDEE_ID)
+    assert result.conflicts == []
+
+    result = await schedule_service.check_registration(EVENT_ID, NOON_ID, ATTENDEE_ID)
+    assert [conflict.id_program_session for conflict in result.conflicts] == [MORNING_ID]
+
+    with pytest.raises(ScheduledSessionNotFoundException):
+        await schedule_service.check_registration(EVENT_ID, ITEM_ID, ATTENDEE_ID)
+
+
+def test_interval_index_and_sweep_match_brute_force():
+    rng = random.Random(42)
+    base = datetime(2025, 7, 31)
+    intervals = []
+    for key in range(300):
+        start = base + timedelta(minutes=rng.randrange(0, 3000))
+        intervals.append(Interval(start, start + timedelta(minutes=rng.randrange(1, 240)), key))
+
+    expected = {frozenset((a.key, b.key)) for a, b in combinations(intervals, 2) if a.overlaps(b)}
+    assert {frozenset((a.key, b.key)) for a, b in overlapping_pairs(intervals)} == expected
+
+    index = IntervalIndex(intervals)
+    for _ in range(100):
+        start = base + timedelta(minutes=rng.randrange(0, 3000))
+        query = Interval(start, start + timedelta(minutes=rng.randrange(1, 240)), None)
+        overlapping = [interval.key for interval in intervals if interval.overlaps(query)]
+        assert sorted(interval.key for interval in index.overlapping(query.start, query.end)) == sorted(overlapping)
+        assert index.has_overlap(query.start, query.end) == bool(overlapping)
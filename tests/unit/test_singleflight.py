@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+
+from service.core import singleflight
+
+
+class CountingService:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    @singleflight()
+    async def load(self, key: str, *, session: object | None = None) -> list[str]:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        if key == "broken":
+            raise RuntimeError(key)
+        return [key]
+
+    @singleflight(window=60)
+    async def load_windowed(self, key: str) -> list[str]:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return [key]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_share_one_execution():
+    service = CountingService()
+
+    results = await asyncio.gather(*(service.load("a") for _ in range(10)), service.load("b"))
+    assert results == [["a"]] * 10 + [["b"]]
+    assert service.calls == 2
+    assert results[0] is results[9]
+
+    # Without a window, finished calls are not shared, and a session always bypasses.
+    await service.load("a")
+    await asyncio.gather(service.load("a", session=object()), service.load("a", session=object()))
+    assert service.calls == 5
+
+
+@pytest.mark.asyncio
+async def test_failures_are_shared_only_while_in_flight():
+    service = CountingService()
+
+    results = await asyncio.gather(service.load("broken"), service.load("broken"), return_exceptions=True)
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert service.calls == 1
+
+    with pytest.raises(RuntimeError):
+        await service.load("broken")
+    assert service.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_window_shares_finished_results():
+    service = CountingService()
+
+    first = await service.load_windowed("a")
+    assert await service.load_windowed("a") is first
+    assert service.calls == 1
+    await service.load_windowed("b")
+    assert service.calls == 2
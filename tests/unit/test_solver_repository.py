@@ -0,0 +1,76 @@
+from datetime import date as date_type, datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from service.core import EventModel, LocationModel, ProgramItemModel, ProgramSessionModel
+from service.solver import SolverItem, SolverRepository, SolverWindow, solve
+
+EVENT_ID = UUID("98992867-827f-4c7b-b603-a435b1234706")
+LOCATION_ID = UUID("6bb4dee0-c0c9-407d-b3e3-b752942103d2")
+SCHEDULED_ITEM_ID = UUID("81f20f69-6f3f-4e55-af11-d173ff41ee4b")
+UNSCHEDULED_ITEM_ID = UUID("a8899df5-4296-49ba-ba72-9a001cee3df5")
+
+
+@pytest.fixture
+async def solver_repository(engine: AsyncEngine) -> SolverRepository:
+    sessionmaker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with sessionmaker() as session:
+        session.add(EventModel(id_event=EVENT_ID, name="Example Event", start_date=date_type(2025, 7, 31), end_date=date_type(2025, 8, 2)))
+        await session.commit()
+        session.add(LocationModel(id_location=LOCATION_ID, id_event=EVENT_ID, name="Agora", color="#FF4500"))
+        await session.commit()
+        for id_program_item in (SCHEDULED_ITEM_ID, UNSCHEDULED_ITEM_ID):
+            session.add(
+                ProgramItemModel(
+                    id_program_item=id_program_item,
+                    id_event=EVENT_ID,
+                    id_location=LOCATION_ID,
+                    name="Knitting steel wires",
+                    required_time=timedelta(hours=1),
+                    before_time_buffer=timedelta(minutes=10),
+                    after_time_buffer=timedelta(minutes=10)
+                )
+            )
+        await session.commit()
+        session.add(ProgramSessionModel(id_program_session=uuid4(), id_program_item=SCHEDULED_ITEM_ID, start_time=datetime(2025, 7, 31, 12, 0)))
+        await session.commit()
+    return SolverRepository(sessionmaker)
+
+
+@pytest.mark.asyncio
+async def test_solver_layout_fills_free_windows(solver_repository: SolverRepository):
+    items = await solver_repository.list_unscheduled_items(EVENT_ID)
+    assert [item.id_program_item for item in items] == [UNSCHEDULED_ITEM_ID]
+
+    windows = await solver_repository.list_free_windows(EVENT_ID, [(datetime(2025, 7, 31, 9, 0), datetime(2025, 7, 31, 21, 0))])
+    assert [(window.start, window.end) for window in windows] == [
+        (datetime(2025, 7, 31, 9, 0), datetime(2025, 7, 31, 11, 50)),
+        (datetime(2025, 7, 31, 13, 10), datetime(2025, 7, 31, 21, 0)),
+    ]
+
+    solution = solve(items, windows, time_limit=0.1, seed=1)
+    assert solution.unplaced == []
+    assert await solver_repository.create_sessions(EVENT_ID, solution.sessions) == 1
+    assert await solver_repository.list_unscheduled_items(EVENT_ID) == []
+
+
+def test_solve_respects_pinned_locations_and_capacity():
+    day = datetime(2025, 7, 31, 9, 0)
+    first, second = uuid4(), uuid4()
+    windows = [SolverWindow(first, day, day + timedelta(hours=2)), SolverWindow(second, day, day + timedelta(hours=2))]
+    items = [
+        SolverItem(uuid4(), timedelta(hours=1), timedelta(0), timedelta(0), id_location=first),
+        SolverItem(uuid4(), timedelta(hours=1), timedelta(0), timedelta(0), id_location=first),
+        SolverItem(uuid4(), timedelta(hours=1), timedelta(0), timedelta(0), id_location=first),
+        SolverItem(uuid4(), timedelta(minutes=90), timedelta(0), timedelta(0)),
+    ]
+
+    solution = solve(items, windows, time_limit=0.1, seed=1)
+
+    assert len(solution.unplaced) == 1
+    assert solution.unplaced[0] in {item.id_program_item for item in items[:3]}
+    placed = {session.id_program_item: session for session in solution.sessions}
+    assert placed[items[3].id_program_item].id_location == second
+    assert solution.idle_time == timedelta(minutes=30)
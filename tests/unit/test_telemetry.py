@@ -0,0 +1,102 @@
+from collections.abc import AsyncGenerator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from sqlalchemy import text
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from route import TelemetryMiddleware
+from service.core import instrument_engine, traced
+
+exporter = InMemorySpanExporter()
+
+
+@pytest.fixture(autouse=True)
+def spans() -> InMemorySpanExporter:
+    # The global provider can only be installed once per process, the tracers of the application pick it up.
+    if not isinstance(trace.get_tracer_provider(), TracerProvider):
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        trace.set_tracer_provider(provider)
+    exporter.clear()
+    return exporter
+
+
+@traced("repository")
+class ItemRepository:
+    async def get_item(self, item_id: int) -> dict:
+        return {"id": item_id}
+
+    async def stream_items(self) -> AsyncGenerator[int]:
+        yield 1
+
+    async def _load(self) -> None:
+        pass
+
+
+@traced("service")
+class ItemService:
+    def __init__(self, repository: ItemRepository) -> None:
+        self.repository = repository
+
+    async def get_item(self, item_id: int) -> dict:
+        return await self.repository.get_item(item_id)
+
+
+@pytest.mark.asyncio
+async def test_traced_methods_nest_spans(spans: InMemorySpanExporter):
+    service = ItemService(ItemRepository())
+
+    assert await service.get_item(1) == {"id": 1}
+    assert [item async for item in service.repository.stream_items()] == [1]
+    await service.repository._load()
+
+    repository_span, service_span = spans.get_finished_spans()
+    assert (repository_span.name, service_span.name) == ("ItemRepository.get_item", "ItemService.get_item")
+    assert repository_span.parent.span_id == service_span.context.span_id
+    assert ItemService.get_item.__name__ == "get_item"
+
+
+def test_middleware_names_span_after_route(spans: InMemorySpanExporter):
+    app = FastAPI()
+    app.add_middleware(TelemetryMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return await ItemService(ItemRepository()).get_item(item_id)
+
+    traceparent = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+    with TestClient(app) as client:
+        assert client.get("/items/7", headers={"traceparent": traceparent}).json() == {"id": 7}
+        assert client.get("/nowhere").status_code == 404
+
+    *_, request_span, missing_span = spans.get_finished_spans()
+    assert request_span.name == "GET /items/{item_id}"
+    assert request_span.attributes["http.route"] == "/items/{item_id}"
+    assert request_span.attributes["http.response.status_code"] == 200
+    assert format(request_span.context.trace_id, "032x") == "0af7651916cd43dd8448eb211c80319c"
+    assert missing_span.name == "GET"
+    assert missing_span.attributes["http.response.status_code"] == 404
+
+
+@pytest.mark.asyncio
+async def test_statements_get_spans_with_text_and_row_count(engine: AsyncEngine, spans: InMemorySpanExporter):
+    instrument_engine(engine)
+
+    async with engine.connect() as connection:
+        await connection.execute(text("SELECT generate_series(1, 3)"))
+        with pytest.raises(ProgrammingError, match="t_does_not_exist"):
+            await connection.execute(text("SELECT * FROM t_does_not_exist"))
+
+    # The dialect may run statements of its own on the first connect.
+    *_, select, failed = [span for span in spans.get_finished_spans() if "db.query.text" in span.attributes]
+    assert select.name == "SELECT"
+    assert select.attributes["db.query.text"] == "SELECT generate_series(1, 3)"
+    assert select.attributes["db.response.returned_rows"] == 3
+    assert failed.status.status_code == trace.StatusCode.ERROR